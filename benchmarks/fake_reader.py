@@ -0,0 +1,369 @@
+"""Provides a local stand-in for TheOldReader's API, for benchmarking.
+
+Only the Google Reader-style endpoints that OldNews makes use of are
+implemented; the data served comes from a `SyntheticReader`.
+"""
+
+##############################################################################
+# Python imports.
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from threading import Lock, Thread
+from time import sleep
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+##############################################################################
+# OldAS imports.
+from oldas import Prefix, State
+
+##############################################################################
+# Local imports.
+from synthetic import RawData, SyntheticReader
+
+##############################################################################
+API = "/reader/api/0/"
+"""The root of the API endpoints."""
+
+
+##############################################################################
+class FakeReader:
+    """The state of the fake TheOldReader server."""
+
+    def __init__(
+        self, make_data: Callable[[], SyntheticReader], latency: float = 0.0
+    ) -> None:
+        """Initialise the fake reader.
+
+        Args:
+            make_data: Function that makes the data to serve.
+            latency: The number of seconds of latency to add to each request.
+        """
+        self._make_data = make_data
+        """The function that makes the data to serve."""
+        self.latency = latency
+        """The number of seconds of latency to add to each request."""
+        self.data = make_data()
+        """The data being served."""
+        self.lock = Lock()
+        """The lock that guards the data."""
+        self.requests = 0
+        """The number of API requests that have been handled."""
+        self.failures = 0
+        """The number of API requests still to fail."""
+        self.failure_status = HTTPStatus.SERVICE_UNAVAILABLE
+        """The status to fail API requests with."""
+        self.failure_every = 1
+        """Fail one in this many API requests while failures remain."""
+        self.retry_after: str | None = None
+        """The `Retry-After` to send with failures, if any."""
+
+    def reset(self) -> None:
+        """Reset the data being served back to its starting state."""
+        self.data = self._make_data()
+        self.requests = 0
+        self.failures = 0
+
+    def failing(self) -> bool:
+        """Should the current API request fail?
+
+        Returns:
+            `True` if the request should fail, `False` if not.
+
+        Note:
+            This should be called with the lock held, once the request has
+            been counted.
+        """
+        if self.failures > 0 and self.requests % self.failure_every == 0:
+            self.failures -= 1
+            return True
+        return False
+
+    def _with_state(self, article: RawData) -> RawData:
+        """Add the read state to an article.
+
+        Args:
+            article: The article to add the state to.
+
+        Returns:
+            The article as it should be served.
+        """
+        if article["id"] in self.data.read:
+            return {**article, "categories": [*article["categories"], str(State.READ)]}
+        return article
+
+    def _matching(self, stream: str, params: dict[str, str]) -> list[RawData]:
+        """Get the articles that match a stream request.
+
+        Args:
+            stream: The stream being requested.
+            params: The parameters of the request.
+
+        Returns:
+            The matching articles, in the requested order.
+        """
+        articles = self.data.article_list
+        if stream.startswith(Prefix.FEED):
+            articles = [
+                article
+                for article in articles
+                if article["origin"]["streamId"] == stream
+            ]
+        elif stream.startswith(Prefix.FOLDER):
+            articles = [
+                article for article in articles if stream in article["categories"]
+            ]
+        if oldest := int(params.get("ot", 0)):
+            articles = [
+                article for article in articles if article["published"] >= oldest
+            ]
+        if params.get("xt") == State.READ:
+            articles = [
+                article for article in articles if article["id"] not in self.data.read
+            ]
+        return articles if params.get("r") == "o" else articles[::-1]
+
+    @staticmethod
+    def _page(
+        items: list[RawData], params: dict[str, str], default_size: int
+    ) -> tuple[list[RawData], str | None]:
+        """Get a page of items.
+
+        Args:
+            items: The items to page through.
+            params: The parameters of the request.
+            default_size: The default page size.
+
+        Returns:
+            The page of items and the continuation, if there is more.
+        """
+        start = int(params.get("c") or 0)
+        end = start + int(params.get("n") or default_size)
+        return items[start:end], str(end) if end < len(items) else None
+
+    def get(self, endpoint: str, params: dict[str, str]) -> RawData | None:
+        """Handle a GET request.
+
+        Args:
+            endpoint: The endpoint being requested.
+            params: The parameters of the request.
+
+        Returns:
+            The data to return, or `None` if the endpoint isn't known.
+        """
+        if endpoint == "tag/list":
+            return {"tags": self.data.folder_list}
+        if endpoint == "subscription/list":
+            return {"subscriptions": self.data.subscription_list}
+        if endpoint == "stream/contents":
+            items, continuation = self._page(
+                self._matching(params.get("s", ""), params), params, 20
+            )
+            return {
+                "items": [self._with_state(article) for article in items],
+                **({"continuation": continuation} if continuation else {}),
+            }
+        if endpoint == "stream/items/ids":
+            items, continuation = self._page(
+                self._matching(params.get("s", ""), params), params, 20
+            )
+            return {
+                "itemRefs": [
+                    {
+                        "id": article["id"].removeprefix(Prefix.ARTICLE),
+                        "directStreamIds": [],
+                        "timestampUsec": str(article["published"] * 1_000_000),
+                    }
+                    for article in items
+                ],
+                **({"continuation": continuation} if continuation else {}),
+            }
+        return None
+
+    def post(self, endpoint: str, data: dict[str, list[str]]) -> bool:
+        """Handle a POST request.
+
+        Args:
+            endpoint: The endpoint being requested.
+            data: The form data of the request.
+
+        Returns:
+            `True` if the request was handled, `False` if not.
+        """
+        if endpoint == "edit-tag":
+            articles = set(data.get("i", []))
+            if State.READ in data.get("a", []):
+                self.data.read |= articles
+            if State.READ in data.get("r", []):
+                self.data.read -= articles
+            return True
+        return False
+
+    def control(self, command: str, params: dict[str, str]) -> bool:
+        """Handle a request to control the fake reader.
+
+        Args:
+            command: The control command.
+            params: The parameters for the command.
+
+        Returns:
+            `True` if the command was handled, `False` if not.
+        """
+        if command == "reset":
+            self.reset()
+        elif command == "add-articles":
+            self.data.add_articles(int(params.get("count", 100)))
+        elif command == "add-feeds":
+            self.data.add_feeds(
+                int(params.get("count", 5)), int(params.get("articles", 100))
+            )
+        elif command == "churn":
+            self.data.churn_read_state(float(params.get("ratio", 0.05)))
+        elif command == "fail":
+            self.failures = int(params.get("count", 1))
+            self.failure_status = HTTPStatus(int(params.get("status", 503)))
+            self.failure_every = max(1, int(params.get("every", 1)))
+            self.retry_after = params.get("retry_after")
+        else:
+            return False
+        return True
+
+
+##############################################################################
+class _Handler(BaseHTTPRequestHandler):
+    """The request handler for the fake reader."""
+
+    server: "FakeReaderServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep the server quiet."""
+
+    def _reply(
+        self,
+        status: HTTPStatus,
+        body: str,
+        content_type: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Send a reply.
+
+        Args:
+            status: The status of the reply.
+            body: The body of the reply.
+            content_type: The content type of the body.
+            headers: Any extra headers to send with the reply.
+        """
+        payload = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for header, value in (headers or {}).items():
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _not_found(self) -> None:
+        """Reply that the resource wasn't found."""
+        self._reply(HTTPStatus.NOT_FOUND, "Not found", "text/plain")
+
+    def _fail(self) -> None:
+        """Reply with the failure that the fake reader has been told to inject."""
+        reader = self.server.reader
+        self._reply(
+            reader.failure_status,
+            reader.failure_status.phrase,
+            "text/plain",
+            {} if reader.retry_after is None else {"Retry-After": reader.retry_after},
+        )
+
+    def do_GET(self) -> None:
+        """Handle a GET request."""
+        url = urlparse(self.path)
+        if not url.path.startswith(API):
+            return self._not_found()
+        reader = self.server.reader
+        sleep(reader.latency)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        with reader.lock:
+            reader.requests += 1
+            if reader.failing():
+                return self._fail()
+            result = reader.get(url.path.removeprefix(API), params)
+        if result is None:
+            return self._not_found()
+        self._reply(HTTPStatus.OK, dumps(result), "application/json")
+
+    def do_POST(self) -> None:
+        """Handle a POST request."""
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        data = parse_qs(self.rfile.read(length).decode())
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        reader = self.server.reader
+        with reader.lock:
+            if url.path.startswith("/_control/"):
+                handled = reader.control(url.path.removeprefix("/_control/"), params)
+            elif url.path.startswith(API):
+                sleep(reader.latency)
+                reader.requests += 1
+                if reader.failing():
+                    return self._fail()
+                handled = reader.post(url.path.removeprefix(API), data)
+            else:
+                handled = False
+        if handled:
+            self._reply(HTTPStatus.OK, "OK", "text/plain")
+        else:
+            self._not_found()
+
+
+##############################################################################
+class FakeReaderServer(ThreadingHTTPServer):
+    """A local HTTP server that pretends to be TheOldReader."""
+
+    daemon_threads = True
+
+    def __init__(self, reader: FakeReader, port: int = 0) -> None:
+        """Initialise the server.
+
+        Args:
+            reader: The fake reader to serve.
+            port: The port to serve on; 0 picks a free port.
+        """
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.reader = reader
+        """The fake reader being served."""
+
+    @property
+    def url(self) -> str:
+        """The root URL of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+
+##############################################################################
+@contextmanager
+def serving(reader: FakeReader, port: int = 0) -> Iterator[FakeReaderServer]:
+    """Serve a fake reader in a background thread.
+
+    Args:
+        reader: The fake reader to serve.
+        port: The port to serve on; 0 picks a free port.
+
+    Yields:
+        The running server.
+    """
+    server = FakeReaderServer(reader, port)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+### fake_reader.py ends here
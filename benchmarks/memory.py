@@ -0,0 +1,171 @@
+"""Benchmark of the memory used to list articles.
+
+A local database is built from synthetic data, with every article in a
+single folder, and then the folder's articles are loaded and shown in an
+article list. For each stage the benchmark records the memory allocated:
+
+- `loaded`: the articles as loaded from the local database.
+- `listed`: the article list's view of the articles, once shown.
+
+Each is reported in bytes, in total, per row, and per 10,000 rows.
+
+Usage:
+
+    python benchmarks/memory.py [--articles N] [--output FILE]
+"""
+
+##############################################################################
+# Python imports.
+from argparse import ArgumentParser, Namespace
+from asyncio import run
+from gc import collect
+from json import dumps
+from os import _exit
+from pathlib import Path
+from platform import platform, python_version
+from time import time
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any
+
+##############################################################################
+# OldAS imports.
+from oldas import Folder
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+
+##############################################################################
+# Local imports.
+from synthetic import SyntheticReader
+from synthetic_db import folders, local_data
+
+
+##############################################################################
+def allocated() -> int:
+    """Get the memory currently allocated.
+
+    Returns:
+        The number of bytes currently allocated, after a garbage collection.
+    """
+    collect()
+    return get_traced_memory()[0]
+
+
+##############################################################################
+def usage(since: int, rows: int) -> dict[str, float]:
+    """Describe the memory allocated since a given point.
+
+    Args:
+        since: The number of bytes that were allocated at that point.
+        rows: The number of rows the memory is for.
+
+    Returns:
+        The memory allocated, in total, per row, and per 10,000 rows.
+    """
+    used = allocated() - since
+    return {
+        "bytes": used,
+        "per_row": used / rows,
+        "per_10k_rows": used * 10_000 / rows,
+    }
+
+
+##############################################################################
+async def measure(folder: Folder) -> dict[str, Any]:
+    """Measure the memory used to list the articles in a folder.
+
+    Args:
+        folder: The folder whose articles should be listed.
+
+    Returns:
+        The results of the benchmark.
+    """
+    from oldnews.data import get_local_article_headers
+    from oldnews.widgets import ArticleList
+
+    class ListApp(App[None]):
+        """An application that only shows an article list."""
+
+        def compose(self) -> ComposeResult:
+            """Compose the application."""
+            yield ArticleList()
+
+    results: dict[str, Any] = {}
+    async with ListApp().run_test(size=(160, 50)) as pilot:
+        article_list = pilot.app.query_one(ArticleList)
+        start()
+        try:
+            since = allocated()
+            articles = await get_local_article_headers(folder, False)
+            results["rows"] = rows = len(articles)
+            results["loaded"] = usage(since, rows)
+            since = allocated()
+            article_list.selected_category = folder
+            article_list.articles = articles
+            await pilot.pause()
+            results["listed"] = usage(since, rows)
+        finally:
+            stop()
+    return results
+
+
+##############################################################################
+def get_args() -> Namespace:
+    """Get the command line arguments.
+
+    Returns:
+        The parsed arguments.
+    """
+    parser = ArgumentParser(description="Benchmark the memory used to list articles.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--feeds", type=int, default=50)
+    parser.add_argument("--articles", type=int, default=10_000)
+    parser.add_argument("--summary-size", type=int, default=2_000)
+    parser.add_argument("--output", type=Path, help="File to write the results to")
+    return parser.parse_args()
+
+
+##############################################################################
+async def main() -> None:
+    """Main entry point for the benchmark."""
+    from oldnews import __version__
+    from oldnews.data import initialise_local_data, shutdown_local_data
+
+    args = get_args()
+    reader = SyntheticReader(
+        seed=args.seed,
+        feeds=args.feeds,
+        # A single folder, so that it holds all of the articles.
+        folders=1,
+        articles=args.articles,
+        summary_size=args.summary_size,
+    )
+    with local_data() as data:
+        await data.build(reader)
+        await initialise_local_data()
+        try:
+            results = await measure(folders(reader)[0])
+        finally:
+            await shutdown_local_data()
+    output = {
+        "version": __version__,
+        "python": python_version(),
+        "platform": platform(),
+        "time": time(),
+        "parameters": vars(args) | {"output": None},
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(dumps(output, indent=4))
+    else:
+        print(dumps(output, indent=4))
+
+
+##############################################################################
+if __name__ == "__main__":
+    run(main())
+    # The database's worker thread can keep the interpreter alive at exit.
+    _exit(0)
+
+### memory.py ends here
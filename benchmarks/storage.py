@@ -0,0 +1,574 @@
+"""Micro-benchmarks for the local storage layer.
+
+Local databases of various sizes are built from synthetic data, and then
+the main functions in `oldnews.data.local_articles` are timed against
+them. Results can be saved as JSON, and compared with a previous run.
+
+Usage:
+
+    python benchmarks/storage.py [--sizes 1000:50,10000:200] [--output FILE]
+
+A size with a single feed (for example `10000:1`) gives a database where
+every article belongs to the one subscription, which is the worst case for
+the subscription-level operations.
+"""
+
+##############################################################################
+# Python imports.
+from argparse import ArgumentParser, Namespace
+from asyncio import create_task, run, sleep
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from json import dumps, loads
+from pathlib import Path
+from platform import platform, python_version
+from statistics import mean, median, stdev
+from time import perf_counter, time
+from typing import Any
+
+##############################################################################
+# OldAS imports.
+from oldas import Articles, Folder, Subscription
+
+##############################################################################
+# Local imports.
+from synthetic import SyntheticReader
+from synthetic_db import LocalData, articles, folders, local_data, subscriptions
+
+##############################################################################
+type Operation = Callable[[], Awaitable[Any]]
+"""Type of an operation being benchmarked."""
+
+
+##############################################################################
+@dataclass
+class Benchmark:
+    """A storage benchmark."""
+
+    name: str
+    """The name of the benchmark."""
+    prepare: Callable[[SyntheticReader], Operation]
+    """Function that prepares the operation to time."""
+    destructive: bool = False
+    """Does the operation change the database?"""
+    self_timed: bool = False
+    """Does the operation time itself, returning the time to record?"""
+
+
+##############################################################################
+def first_folder(reader: SyntheticReader) -> Folder:
+    """Get the first folder of a synthetic reader.
+
+    Args:
+        reader: The synthetic reader.
+
+    Returns:
+        The folder.
+    """
+    return folders(reader)[0]
+
+
+##############################################################################
+def first_subscription(reader: SyntheticReader) -> Subscription:
+    """Get the first subscription of a synthetic reader.
+
+    Args:
+        reader: The synthetic reader.
+
+    Returns:
+        The subscription.
+    """
+    return subscriptions(reader)[0]
+
+
+##############################################################################
+def save_articles(reader: SyntheticReader) -> Operation:
+    """Prepare to time saving a batch of new articles.
+
+    Args:
+        reader: The synthetic data the database was built from.
+
+    Returns:
+        The operation to time.
+    """
+    from oldnews.data import save_local_articles
+
+    new_articles = SyntheticReader(
+        seed=reader.seed + 1, feeds=reader.feeds, articles=200
+    )
+    batch = articles(new_articles)
+    return lambda: save_local_articles(batch)
+
+
+##############################################################################
+def resave_articles(reader: SyntheticReader) -> Operation:
+    """Prepare to time saving a batch of articles that are already saved.
+
+    Args:
+        reader: The synthetic data the database was built from.
+
+    Returns:
+        The operation to time.
+    """
+    from oldnews.data import save_local_articles
+
+    batch = Articles(articles(reader)[-200:])
+    return lambda: save_local_articles(batch)
+
+
+##############################################################################
+def get_articles(
+    related_to: str, unread_only: bool
+) -> Callable[[SyntheticReader], Operation]:
+    """Make a preparation for timing getting articles.
+
+    Args:
+        related_to: What to get the articles for (`folder` or `subscription`).
+        unread_only: Only get the unread articles?
+
+    Returns:
+        The preparation function.
+    """
+
+    def prepare(reader: SyntheticReader) -> Operation:
+        """Prepare to time getting articles.
+
+        Args:
+            reader: The synthetic data the database was built from.
+
+        Returns:
+            The operation to time.
+        """
+        from oldnews.data import get_local_articles
+
+        category = (
+            first_folder(reader)
+            if related_to == "folder"
+            else first_subscription(reader)
+        )
+        return lambda: get_local_articles(category, unread_only)
+
+    return prepare
+
+
+##############################################################################
+def get_headers(
+    related_to: str, unread_only: bool
+) -> Callable[[SyntheticReader], Operation]:
+    """Make a preparation for timing getting article headers.
+
+    Args:
+        related_to: What to get the headers for (`folder` or `subscription`).
+        unread_only: Only get the headers of unread articles?
+
+    Returns:
+        The preparation function.
+    """
+
+    def prepare(reader: SyntheticReader) -> Operation:
+        """Prepare to time getting article headers.
+
+        Args:
+            reader: The synthetic data the database was built from.
+
+        Returns:
+            The operation to time.
+        """
+        from oldnews.data import get_local_article_headers
+
+        category = (
+            first_folder(reader)
+            if related_to == "folder"
+            else first_subscription(reader)
+        )
+        return lambda: get_local_article_headers(category, unread_only)
+
+    return prepare
+
+
+##############################################################################
+def get_unread(reader: SyntheticReader) -> Operation:
+    """Prepare to time getting the unread counts.
+
+    Args:
+        reader: The synthetic data the database was built from.
+
+    Returns:
+        The operation to time.
+    """
+    from oldnews.data import get_local_unread
+
+    return lambda: get_local_unread(folders(reader), subscriptions(reader))
+
+
+##############################################################################
+def get_unread_ids(reader: SyntheticReader) -> Operation:
+    """Prepare to time getting the IDs of the unread articles.
+
+    Args:
+        reader: The synthetic data the database was built from.
+
+    Returns:
+        The operation to time.
+    """
+    from oldnews.data import get_unread_article_ids
+
+    return get_unread_article_ids
+
+
+##############################################################################
+def known_ids(reader: SyntheticReader) -> Operation:
+    """Prepare to time filtering article IDs down to those known locally.
+
+    Args:
+        reader: The synthetic data the database was built from.
+
+    Returns:
+        The operation to time.
+    """
+    from oldnews.data import locally_known_article_ids
+
+    # Half of them known, half of them not.
+    article_ids = [
+        *(article["id"] for article in reader.article_list[-1_000:]),
+        *(f"{article['id']}-unknown" for article in reader.article_list[-1_000:]),
+    ]
+    return lambda: locally_known_article_ids(article_ids)
+
+
+##############################################################################
+def unread_while_saving(reader: SyntheticReader) -> Operation:
+    """Prepare to time getting the unread counts while articles are being saved.
+
+    Args:
+        reader: The synthetic data the database was built from.
+
+    Returns:
+        The operation to time; it returns how long the unread counts took.
+    """
+    from oldnews.data import get_local_unread, save_local_articles
+
+    new_articles = SyntheticReader(
+        seed=reader.seed + 1, feeds=reader.feeds, articles=2_000
+    )
+    batch = articles(new_articles)
+
+    async def operation() -> float:
+        """Get the unread counts part way through saving a batch of articles.
+
+        Returns:
+            The time between asking for the unread counts and getting them.
+        """
+        saving = create_task(save_local_articles(batch))
+        # Ask for the counts once the save has had time to get going; the
+        # time starts from when they're asked for, not from when the event
+        # loop gets round to asking for them.
+        asked = perf_counter() + 0.1
+        await sleep(0.1)
+        await get_local_unread(folders(reader), subscriptions(reader))
+        took = perf_counter() - asked
+        await saving
+        return took
+
+    return operation
+
+
+##############################################################################
+def mark_read(reader: SyntheticReader) -> Operation:
+    """Prepare to time marking a batch of articles as read.
+
+    Args:
+        reader: The synthetic data the database was built from.
+
+    Returns:
+        The operation to time.
+    """
+    from oldnews.data import locally_mark_article_ids_read
+
+    unread = [
+        article["id"]
+        for article in reader.article_list
+        if article["id"] not in reader.read
+    ][:500]
+    return lambda: locally_mark_article_ids_read(unread)
+
+
+##############################################################################
+def clean_old(reader: SyntheticReader) -> Operation:
+    """Prepare to time cleaning out old read articles.
+
+    Args:
+        reader: The synthetic data the database was built from.
+
+    Returns:
+        The operation to time.
+    """
+    from oldnews.data import clean_old_read_articles
+
+    return lambda: clean_old_read_articles(timedelta(days=reader.days // 2))
+
+
+##############################################################################
+def move_articles(reader: SyntheticReader) -> Operation:
+    """Prepare to time moving a subscription's articles between folders.
+
+    Args:
+        reader: The synthetic data the database was built from.
+
+    Returns:
+        The operation to time.
+    """
+    from oldnews.data import move_subscription_articles
+
+    subscription = first_subscription(reader)
+    from_folder = subscription.categories[0].id if subscription.categories else None
+    to_folder = folders(reader)[-1].id
+    return lambda: move_subscription_articles(subscription, from_folder, to_folder)
+
+
+##############################################################################
+def remove_articles(reader: SyntheticReader) -> Operation:
+    """Prepare to time removing a subscription's articles.
+
+    Args:
+        reader: The synthetic data the database was built from.
+
+    Returns:
+        The operation to time.
+    """
+    from oldnews.data import remove_subscription_articles
+
+    subscription = first_subscription(reader)
+    return lambda: remove_subscription_articles(subscription)
+
+
+##############################################################################
+BENCHMARKS = (
+    Benchmark("save_local_articles (200)", save_articles, destructive=True),
+    Benchmark(
+        "save_local_articles (200, unchanged)", resave_articles, destructive=True
+    ),
+    Benchmark("get_local_articles (folder, unread)", get_articles("folder", True)),
+    Benchmark("get_local_articles (folder, all)", get_articles("folder", False)),
+    Benchmark(
+        "get_local_articles (subscription, unread)",
+        get_articles("subscription", True),
+    ),
+    Benchmark(
+        "get_local_articles (subscription, all)",
+        get_articles("subscription", False),
+    ),
+    Benchmark(
+        "get_local_article_headers (folder, unread)", get_headers("folder", True)
+    ),
+    Benchmark("get_local_article_headers (folder, all)", get_headers("folder", False)),
+    Benchmark("get_local_unread", get_unread),
+    Benchmark(
+        "get_local_unread (while saving 2000)",
+        unread_while_saving,
+        destructive=True,
+        self_timed=True,
+    ),
+    Benchmark("get_unread_article_ids", get_unread_ids),
+    Benchmark("locally_known_article_ids (2000)", known_ids),
+    Benchmark("locally_mark_article_ids_read (500)", mark_read, destructive=True),
+    Benchmark("clean_old_read_articles", clean_old, destructive=True),
+    Benchmark("move_subscription_articles", move_articles, destructive=True),
+    Benchmark("remove_subscription_articles", remove_articles, destructive=True),
+)
+"""The benchmarks to run."""
+
+
+##############################################################################
+def statistics(timings: list[float]) -> dict[str, float]:
+    """Summarise a set of timings.
+
+    Args:
+        timings: The timings to summarise.
+
+    Returns:
+        The summary statistics.
+    """
+    return {
+        "min": min(timings),
+        "max": max(timings),
+        "mean": mean(timings),
+        "median": median(timings),
+        "stddev": stdev(timings) if len(timings) > 1 else 0.0,
+    }
+
+
+##############################################################################
+async def run_benchmark(
+    benchmark: Benchmark, reader: SyntheticReader, data: LocalData, rounds: int
+) -> list[float]:
+    """Run a single benchmark.
+
+    Args:
+        benchmark: The benchmark to run.
+        reader: The synthetic data the database was built from.
+        data: The local data to run against.
+        rounds: The number of times to run the benchmark.
+
+    Returns:
+        The timings for each round.
+    """
+    from oldnews.data import initialise_local_data, shutdown_local_data
+
+    operation = benchmark.prepare(reader)
+    timings: list[float] = []
+    for _ in range(rounds):
+        if benchmark.destructive:
+            data.restore()
+        await initialise_local_data()
+        try:
+            started = perf_counter()
+            result = await operation()
+            timings.append(result if benchmark.self_timed else perf_counter() - started)
+        finally:
+            await shutdown_local_data()
+    return timings
+
+
+##############################################################################
+async def run_size(
+    article_count: int, feed_count: int, args: Namespace
+) -> list[dict[str, Any]]:
+    """Run all the benchmarks against a database of a given size.
+
+    Args:
+        article_count: The number of articles in the database.
+        feed_count: The number of feeds in the database.
+        args: The command line arguments.
+
+    Returns:
+        The results of the benchmarks.
+    """
+    reader = SyntheticReader(
+        seed=args.seed,
+        feeds=feed_count,
+        folders=args.folders,
+        articles=article_count,
+        summary_size=args.summary_size,
+    )
+    results: list[dict[str, Any]] = []
+    with local_data() as data:
+        started = perf_counter()
+        await data.build(reader)
+        print(
+            f"Built {article_count:,} articles over {feed_count:,} feeds "
+            f"in {perf_counter() - started:.1f}s "
+            f"({data.database.stat().st_size / 1_048_576:.1f}MiB)"
+        )
+        for benchmark in BENCHMARKS:
+            if args.only and not any(only in benchmark.name for only in args.only):
+                continue
+            timings = await run_benchmark(benchmark, reader, data, args.rounds)
+            result = {
+                "name": benchmark.name,
+                "articles": article_count,
+                "feeds": feed_count,
+                "rounds": len(timings),
+                **statistics(timings),
+            }
+            results.append(result)
+            print(f"  {benchmark.name:<45} median {result['median'] * 1000:10.2f}ms")
+    return results
+
+
+##############################################################################
+def compare(results: list[dict[str, Any]], previous: Path) -> None:
+    """Compare results with those of a previous run.
+
+    Args:
+        results: The results of this run.
+        previous: The file holding the results of a previous run.
+    """
+    before = {
+        (result["name"], result["articles"], result["feeds"]): result["median"]
+        for result in loads(previous.read_text())["results"]
+    }
+    print(f"\nCompared with {previous}:")
+    for result in results:
+        if was := before.get((result["name"], result["articles"], result["feeds"])):
+            print(
+                f"  {result['name']:<45} {result['articles']:>7,}/{result['feeds']:<5,} "
+                f"{was * 1000:10.2f}ms -> {result['median'] * 1000:10.2f}ms "
+                f"({result['median'] / was:6.2f}x)"
+            )
+
+
+##############################################################################
+def sizes(value: str) -> list[tuple[int, int]]:
+    """Parse a list of database sizes.
+
+    Args:
+        value: The sizes, as a comma-separated list of `articles:feeds`.
+
+    Returns:
+        The list of `(articles, feeds)` sizes.
+    """
+    return [
+        (int(articles), int(feeds))
+        for articles, _, feeds in (size.partition(":") for size in value.split(","))
+    ]
+
+
+##############################################################################
+def get_args() -> Namespace:
+    """Get the command line arguments.
+
+    Returns:
+        The parsed arguments.
+    """
+    parser = ArgumentParser(description="Benchmark the local storage layer.")
+    parser.add_argument(
+        "--sizes",
+        type=sizes,
+        default=sizes("1000:50,10000:1,10000:200,100000:1000"),
+        help="Comma-separated list of articles:feeds database sizes",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--folders", type=int, default=8)
+    parser.add_argument("--summary-size", type=int, default=1_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--only", action="append", help="Only run benchmarks whose name contains this"
+    )
+    parser.add_argument("--output", type=Path, help="File to write the results to")
+    parser.add_argument("--compare", type=Path, help="Previous results to compare to")
+    return parser.parse_args()
+
+
+##############################################################################
+async def main() -> None:
+    """Main entry point for the benchmark."""
+    from oldnews import __version__
+
+    args = get_args()
+    results: list[dict[str, Any]] = []
+    for article_count, feed_count in args.sizes:
+        results.extend(await run_size(article_count, feed_count, args))
+    if args.output:
+        args.output.write_text(
+            dumps(
+                {
+                    "version": __version__,
+                    "python": python_version(),
+                    "platform": platform(),
+                    "time": time(),
+                    "results": results,
+                },
+                indent=4,
+            )
+        )
+    if args.compare:
+        compare(results, args.compare)
+
+
+##############################################################################
+if __name__ == "__main__":
+    run(main())
+
+### storage.py ends here
@@ -0,0 +1,245 @@
+"""End-to-end benchmark of syncing with TheOldReader.
+
+A local fake of TheOldReader is started, and then each scenario is run in
+its own process (so that peak memory use is measured per scenario, and so
+that each scenario starts with its own empty local database).
+
+Usage:
+
+    python benchmarks/sync_benchmark.py [--feeds N] [--articles N] ...
+"""
+
+##############################################################################
+# Python imports.
+from argparse import ArgumentParser, Namespace
+from asyncio import run
+from collections.abc import Awaitable, Callable
+from json import dumps, loads
+from os import environ
+from pathlib import Path
+from resource import RUSAGE_SELF, getrusage
+from subprocess import run as run_process
+from sys import executable
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any
+from urllib.request import Request, urlopen
+
+##############################################################################
+# Local imports.
+from fake_reader import FakeReader, serving
+from synthetic import SyntheticReader
+
+##############################################################################
+type Preparation = Callable[[str], Awaitable[None]]
+"""Type of a function that prepares for a measured sync."""
+
+
+##############################################################################
+def control(server: str, command: str, **params: Any) -> None:
+    """Send a control command to the fake reader.
+
+    Args:
+        server: The URL of the fake reader.
+        command: The command to send.
+        params: The parameters for the command.
+    """
+    query = "&".join(f"{key}={value}" for key, value in params.items())
+    with urlopen(Request(f"{server}/_control/{command}?{query}", method="POST")):
+        pass
+
+
+##############################################################################
+async def sync_once(server: str) -> dict[str, Any]:
+    """Perform a single sync against the fake reader.
+
+    Args:
+        server: The URL of the fake reader.
+
+    Returns:
+        The sync report as a dictionary.
+    """
+    from oldnews.session import OldNewsSession
+    from oldnews.sync import TheOldReaderSync
+
+    class BenchmarkSession(OldNewsSession):
+        """A session that talks to the fake reader."""
+
+        _API = f"{server}/reader/api/0/"
+
+    sync = TheOldReaderSync(BenchmarkSession("OldNews", "benchmark"))
+    await sync.sync()
+    return sync.report.as_dict()
+
+
+##############################################################################
+async def nothing(_: str) -> None:
+    """Prepare for a first sync, which needs no preparation."""
+
+
+##############################################################################
+async def new_articles(server: str) -> None:
+    """Prepare for an incremental sync.
+
+    Args:
+        server: The URL of the fake reader.
+    """
+    await sync_once(server)
+    control(server, "add-articles", count=200)
+    control(server, "churn", ratio=0.05)
+
+
+##############################################################################
+async def new_feeds(server: str) -> None:
+    """Prepare for a sync that needs to pull in a backlog.
+
+    Args:
+        server: The URL of the fake reader.
+    """
+    await sync_once(server)
+    control(server, "add-feeds", count=10, articles=200)
+
+
+##############################################################################
+async def flaky_server(server: str) -> None:
+    """Prepare for a first sync against a server that keeps failing.
+
+    Args:
+        server: The URL of the fake reader.
+    """
+    control(server, "fail", count=6, every=4, status=503)
+
+
+##############################################################################
+SCENARIOS: dict[str, Preparation] = {
+    "first-sync": nothing,
+    "incremental-sync": new_articles,
+    "backlog": new_feeds,
+    "flaky-sync": flaky_server,
+}
+"""The scenarios to benchmark, and how to prepare for them."""
+
+
+##############################################################################
+async def run_scenario(scenario: str, server: str) -> dict[str, Any]:
+    """Run a scenario.
+
+    Args:
+        scenario: The name of the scenario.
+        server: The URL of the fake reader.
+
+    Returns:
+        The results of the scenario.
+    """
+    from oldnews.data import initialise_local_data, shutdown_local_data
+
+    await initialise_local_data()
+    try:
+        await SCENARIOS[scenario](server)
+        started = perf_counter()
+        report = await sync_once(server)
+        wall_time = perf_counter() - started
+    finally:
+        await shutdown_local_data()
+    return {
+        "scenario": scenario,
+        "wall_time": round(wall_time, 4),
+        "peak_rss_kib": getrusage(RUSAGE_SELF).ru_maxrss,
+        "report": report,
+    }
+
+
+##############################################################################
+def in_subprocess(scenario: str, server: str) -> dict[str, Any]:
+    """Run a scenario in its own process, with its own local data.
+
+    Args:
+        scenario: The name of the scenario.
+        server: The URL of the fake reader.
+
+    Returns:
+        The results of the scenario.
+    """
+    with TemporaryDirectory() as home:
+        result = run_process(
+            [executable, __file__, "--child", scenario, "--server", server],
+            env=environ
+            | {
+                "XDG_DATA_HOME": str(Path(home) / "data"),
+                "XDG_CONFIG_HOME": str(Path(home) / "config"),
+            },
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    return loads(result.stdout)
+
+
+##############################################################################
+def get_args() -> Namespace:
+    """Get the command line arguments.
+
+    Returns:
+        The parsed arguments.
+    """
+    parser = ArgumentParser(description="Benchmark syncing with TheOldReader.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--feeds", type=int, default=50)
+    parser.add_argument("--folders", type=int, default=8)
+    parser.add_argument("--articles", type=int, default=5_000)
+    parser.add_argument("--summary-size", type=int, default=2_000)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added per request"
+    )
+    parser.add_argument(
+        "--scenario", action="append", choices=SCENARIOS, help="Scenario to run"
+    )
+    parser.add_argument("--output", type=Path, help="File to write the results to")
+    parser.add_argument("--child", choices=SCENARIOS, help=None)
+    parser.add_argument("--server", help=None)
+    return parser.parse_args()
+
+
+##############################################################################
+def main() -> None:
+    """Main entry point for the benchmark."""
+    args = get_args()
+    if args.child:
+        print(dumps(run(run_scenario(args.child, args.server))))
+        return
+    reader = FakeReader(
+        lambda: SyntheticReader(
+            seed=args.seed,
+            feeds=args.feeds,
+            folders=args.folders,
+            articles=args.articles,
+            summary_size=args.summary_size,
+        ),
+        args.latency,
+    )
+    results: list[dict[str, Any]] = []
+    with serving(reader) as server:
+        for scenario in args.scenario or SCENARIOS:
+            reader.reset()
+            result = in_subprocess(scenario, server.url)
+            # Note that this includes any requests made while preparing.
+            result["server_requests"] = reader.requests
+            results.append(result)
+            print(
+                f"{scenario:>18}: {result['wall_time']:8.3f}s "
+                f"peak RSS {result['peak_rss_kib'] / 1024:7.1f}MiB "
+                f"requests {reader.requests} "
+                f"retries {sum(phase['retries'] for phase in result['report']['phases'])}"
+            )
+    output = {"parameters": vars(args) | {"output": None}, "results": results}
+    if args.output:
+        args.output.write_text(dumps(output, indent=4))
+    else:
+        print(dumps(output, indent=4))
+
+
+##############################################################################
+if __name__ == "__main__":
+    main()
+
+### sync_benchmark.py ends here
@@ -0,0 +1,244 @@
+"""Provides a generator of synthetic TheOldReader data for benchmarking."""
+
+##############################################################################
+# Python imports.
+from dataclasses import dataclass, field
+from random import Random
+from time import time
+from typing import Any
+
+##############################################################################
+# OldAS imports.
+from oldas import Prefix, State
+
+##############################################################################
+type RawData = dict[str, Any]
+"""Type of the raw JSON data used by the API."""
+
+##############################################################################
+_WORDS = [
+    "terminal",
+    "news",
+    "reader",
+    "python",
+    "textual",
+    "sqlite",
+    "feed",
+    "article",
+    "summary",
+    "folder",
+    "subscription",
+    "sync",
+    "unread",
+    "latency",
+    "benchmark",
+    "index",
+    "query",
+    "render",
+    "markdown",
+    "async",
+    "worker",
+    "widget",
+    "option",
+    "list",
+    "cursor",
+    "screen",
+    "thread",
+    "queue",
+    "batch",
+    "page",
+]
+"""Words used to build synthetic text."""
+
+
+##############################################################################
+@dataclass
+class SyntheticReader:
+    """A seeded, synthetic, set of TheOldReader data."""
+
+    seed: int = 42
+    """The seed for the random data."""
+    feeds: int = 50
+    """The number of feeds to generate."""
+    folders: int = 8
+    """The number of folders to spread the feeds over."""
+    articles: int = 5_000
+    """The number of articles to generate."""
+    days: int = 28
+    """The number of days over which to spread the articles."""
+    summary_size: int = 2_000
+    """The approximate size, in bytes, of each article summary."""
+    read_ratio: float = 0.7
+    """The proportion of the articles that are marked as read."""
+
+    folder_list: list[RawData] = field(init=False, default_factory=list)
+    """The folders, as they'd be returned by the API."""
+    subscription_list: list[RawData] = field(init=False, default_factory=list)
+    """The subscriptions, as they'd be returned by the API."""
+    article_list: list[RawData] = field(init=False, default_factory=list)
+    """The articles, oldest first, as they'd be returned by the API."""
+    read: set[str] = field(init=False, default_factory=set)
+    """The IDs of the read articles."""
+
+    def __post_init__(self) -> None:
+        """Generate the data."""
+        self._random = Random(self.seed)
+        self._next_article = 0
+        self.folder_list = [
+            {"id": f"{Prefix.FOLDER}Folder {folder}", "sortid": f"{folder:08X}"}
+            for folder in range(self.folders)
+        ]
+        self.subscription_list = [
+            self._subscription(feed) for feed in range(self.feeds)
+        ]
+        now = time()
+        self.article_list = sorted(
+            (
+                self.article(now - self._random.uniform(0, self.days * 86_400))
+                for _ in range(self.articles)
+            ),
+            key=lambda article: article["published"],
+        )
+        self.read = {
+            article["id"]
+            for article in self.article_list
+            if self._random.random() < self.read_ratio
+        }
+
+    def _text(self, words: int) -> str:
+        """Generate some random text.
+
+        Args:
+            words: The number of words to generate.
+
+        Returns:
+            The text.
+        """
+        return " ".join(self._random.choices(_WORDS, k=words))
+
+    def _summary(self) -> str:
+        """Generate the content of a summary.
+
+        Returns:
+            Paragraphs of random text, of roughly the summary size.
+        """
+        paragraphs: list[str] = []
+        size = 0
+        while size < self.summary_size:
+            paragraphs.append(paragraph := f"<p>{self._text(20)}</p>")
+            size += len(paragraph)
+        return "".join(paragraphs)
+
+    def _subscription(self, feed: int) -> RawData:
+        """Generate a subscription.
+
+        Args:
+            feed: The number of the feed.
+
+        Returns:
+            The subscription data.
+        """
+        folder = self.folder_list[feed % self.folders] if self.folders else None
+        return {
+            "id": f"{Prefix.FEED}{feed:024x}",
+            "title": f"Feed {feed}: {self._text(3)}",
+            "sortid": f"{feed:08X}",
+            "firstitemmsec": "0",
+            "url": f"https://feed-{feed}.example.com/feed.xml",
+            "htmlUrl": f"https://feed-{feed}.example.com/",
+            "categories": (
+                [
+                    {
+                        "id": folder["id"],
+                        "label": folder["id"].removeprefix(Prefix.FOLDER),
+                    }
+                ]
+                if folder
+                else []
+            ),
+        }
+
+    def article(self, published: float, feed: RawData | None = None) -> RawData:
+        """Generate an article.
+
+        Args:
+            published: The time the article was published.
+            feed: The subscription the article belongs to, or `None` for random.
+
+        Returns:
+            The article data.
+        """
+        feed = feed or self._random.choice(self.subscription_list)
+        self._next_article += 1
+        return {
+            "id": f"{Prefix.ARTICLE}{self.seed:08x}{self._next_article:08x}",
+            "title": self._text(8).capitalize(),
+            "published": int(published),
+            "updated": int(published),
+            "author": self._text(2).title(),
+            "summary": {
+                "direction": "ltr",
+                "content": self._summary(),
+            },
+            "categories": [
+                str(State.READING_LIST),
+                *(category["id"] for category in feed["categories"]),
+            ],
+            "origin": {
+                "streamId": feed["id"],
+                "title": feed["title"],
+                "htmlUrl": feed["htmlUrl"],
+            },
+            "alternate": [
+                {"href": f"{feed['htmlUrl']}{self._next_article}", "type": "text/html"}
+            ],
+        }
+
+    def add_articles(self, count: int) -> list[RawData]:
+        """Add some brand new articles.
+
+        Args:
+            count: The number of articles to add.
+
+        Returns:
+            The new articles.
+        """
+        now = time()
+        new_articles = [self.article(now) for _ in range(count)]
+        self.article_list.extend(new_articles)
+        return new_articles
+
+    def add_feeds(self, count: int, articles_per_feed: int) -> list[RawData]:
+        """Add some brand new feeds, complete with a history of articles.
+
+        Args:
+            count: The number of feeds to add.
+            articles_per_feed: The number of historical articles for each feed.
+
+        Returns:
+            The new subscriptions.
+        """
+        now = time()
+        new_feeds = [self._subscription(self.feeds + feed) for feed in range(count)]
+        self.feeds += count
+        self.subscription_list.extend(new_feeds)
+        self.article_list.extend(
+            self.article(now - self._random.uniform(0, self.days * 86_400), feed)
+            for feed in new_feeds
+            for _ in range(articles_per_feed)
+        )
+        self.article_list.sort(key=lambda article: article["published"])
+        return new_feeds
+
+    def churn_read_state(self, ratio: float) -> None:
+        """Flip the read state of a proportion of the articles.
+
+        Args:
+            ratio: The proportion of articles to flip.
+        """
+        for article in self.article_list:
+            if self._random.random() < ratio:
+                self.read ^= {article["id"]}
+
+
+### synthetic.py ends here
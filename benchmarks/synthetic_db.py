@@ -0,0 +1,155 @@
+"""Provides code for building local databases from synthetic data."""
+
+##############################################################################
+# Python imports.
+from collections.abc import Iterator
+from contextlib import contextmanager
+from os import environ
+from pathlib import Path
+from shutil import copyfile
+from tempfile import TemporaryDirectory
+
+##############################################################################
+# OldAS imports.
+from oldas import Article, Articles, Folder, Folders, State, Subscription, Subscriptions
+
+##############################################################################
+# Local imports.
+from synthetic import SyntheticReader
+
+
+##############################################################################
+def folders(reader: SyntheticReader) -> Folders:
+    """Get the folders of a synthetic reader.
+
+    Args:
+        reader: The synthetic reader.
+
+    Returns:
+        The folders.
+    """
+    return Folders(Folder.from_json(folder) for folder in reader.folder_list)
+
+
+##############################################################################
+def subscriptions(reader: SyntheticReader) -> Subscriptions:
+    """Get the subscriptions of a synthetic reader.
+
+    Args:
+        reader: The synthetic reader.
+
+    Returns:
+        The subscriptions.
+    """
+    return Subscriptions(
+        Subscription.from_json(subscription)
+        for subscription in reader.subscription_list
+    )
+
+
+##############################################################################
+def articles(reader: SyntheticReader) -> Articles:
+    """Get the articles of a synthetic reader, with their read state.
+
+    Args:
+        reader: The synthetic reader.
+
+    Returns:
+        The articles.
+    """
+    return Articles(
+        Article.from_json(
+            {**article, "categories": [*article["categories"], str(State.READ)]}
+            if article["id"] in reader.read
+            else article
+        )
+        for article in reader.article_list
+    )
+
+
+##############################################################################
+async def populate(reader: SyntheticReader) -> None:
+    """Populate the local database with the data from a synthetic reader.
+
+    Args:
+        reader: The synthetic reader.
+    """
+    from oldnews.data import (
+        remember_we_last_grabbed_at,
+        save_local_articles,
+        save_local_folders,
+        save_local_subscriptions,
+    )
+
+    await save_local_folders(folders(reader))
+    await save_local_subscriptions(subscriptions(reader))
+    # Keep well inside SQLite's limit on the number of parameters.
+    batch = 5_000
+    all_articles = articles(reader)
+    for start in range(0, len(all_articles), batch):
+        await save_local_articles(Articles(all_articles[start : start + batch]))
+    await remember_we_last_grabbed_at()
+
+
+##############################################################################
+class LocalData:
+    """A throwaway set of local application data, built from synthetic data."""
+
+    def __init__(self, root: Path) -> None:
+        """Initialise the local data.
+
+        Args:
+            root: The directory to keep the data in.
+        """
+        self._root = root
+        """The directory the data is kept in."""
+        environ["XDG_DATA_HOME"] = str(root / "data")
+        environ["XDG_CONFIG_HOME"] = str(root / "config")
+
+    @property
+    def database(self) -> Path:
+        """The path to the database."""
+        from oldnews.data.local_data import local_db_file
+
+        return local_db_file()
+
+    @property
+    def _pristine(self) -> Path:
+        """The path to the pristine copy of the database."""
+        return self._root / "pristine.db"
+
+    async def build(self, reader: SyntheticReader) -> None:
+        """Build the database from a synthetic reader.
+
+        Args:
+            reader: The synthetic reader to build the database from.
+        """
+        from oldnews.data import initialise_local_data, shutdown_local_data
+
+        await initialise_local_data()
+        try:
+            await populate(reader)
+        finally:
+            await shutdown_local_data()
+        copyfile(self.database, self._pristine)
+
+    def restore(self) -> None:
+        """Restore the database to how it was just after it was built."""
+        for suffix in ("-wal", "-shm"):
+            Path(f"{self.database}{suffix}").unlink(missing_ok=True)
+        copyfile(self._pristine, self.database)
+
+
+##############################################################################
+@contextmanager
+def local_data() -> Iterator[LocalData]:
+    """Provide a throwaway set of local application data.
+
+    Yields:
+        The local data.
+    """
+    with TemporaryDirectory() as root:
+        yield LocalData(Path(root))
+
+
+### synthetic_db.py ends here
@@ -0,0 +1,401 @@
+"""Headless benchmark of the user interface.
+
+The application is driven with Textual's pilot against a local database
+built from synthetic data, with a local fake of TheOldReader standing in
+for the real thing. For each action the benchmark records:
+
+- `message_loop`: the time until the message loop has settled.
+- `first_frame`: the time until the first frame was produced.
+- `last_frame`: the time until the last frame was produced.
+- `frames`: the number of frames produced.
+
+Usage:
+
+    python benchmarks/ui.py [--articles N] [--steps N] [--sync-articles N]
+                            [--output FILE]
+"""
+
+##############################################################################
+# Python imports.
+from argparse import ArgumentParser, Namespace
+from asyncio import run
+from dataclasses import dataclass, field
+from json import dumps
+from os import _exit
+from pathlib import Path
+from platform import platform, python_version
+from statistics import mean, median, quantiles
+from time import perf_counter, time
+from typing import Any
+
+##############################################################################
+# Rich imports.
+from rich.console import RenderableType
+
+##############################################################################
+# Textual imports.
+from textual.pilot import Pilot
+from textual.screen import Screen
+
+##############################################################################
+# Local imports.
+from fake_reader import FakeReader, serving
+from synthetic import SyntheticReader
+from synthetic_db import local_data
+
+
+##############################################################################
+@dataclass
+class Timing:
+    """The timing of a single UI action."""
+
+    message_loop: float
+    """The time, in seconds, until the message loop settled."""
+    first_frame: float | None
+    """The time, in seconds, until the first frame was produced."""
+    last_frame: float | None
+    """The time, in seconds, until the last frame was produced."""
+    frames: int
+    """The number of frames produced."""
+
+    def as_dict(self) -> dict[str, Any]:
+        """The timing as a dictionary.
+
+        Returns:
+            A dictionary of the timing.
+        """
+        return {
+            "message_loop": self.message_loop,
+            "first_frame": self.first_frame,
+            "last_frame": self.last_frame,
+            "frames": self.frames,
+        }
+
+
+##############################################################################
+@dataclass
+class Recorder:
+    """Records when frames are produced."""
+
+    frames: list[float] = field(default_factory=list)
+    """The times at which frames were produced."""
+
+    def frame(self) -> None:
+        """Record that a frame was produced."""
+        self.frames.append(perf_counter())
+
+    def since(self, started: float, settled: float) -> Timing:
+        """Get the timing of an action.
+
+        Args:
+            started: The time the action started.
+            settled: The time the message loop settled.
+
+        Returns:
+            The timing of the action.
+        """
+        frames = [frame - started for frame in self.frames if frame >= started]
+        return Timing(
+            message_loop=settled - started,
+            first_frame=frames[0] if frames else None,
+            last_frame=frames[-1] if frames else None,
+            frames=len(frames),
+        )
+
+
+##############################################################################
+def benchmark_app(recorder: Recorder) -> Any:
+    """Make the application to benchmark.
+
+    Args:
+        recorder: The recorder of frames.
+
+    Returns:
+        The application.
+    """
+    from oldnews.oldnews import OldNews
+
+    class BenchmarkApp(OldNews):
+        """The application, with frames being recorded."""
+
+        def _display(self, screen: Screen, renderable: RenderableType | None) -> None:
+            if renderable is not None:
+                recorder.frame()
+            super()._display(screen, renderable)
+
+    return BenchmarkApp(Namespace(theme=None))
+
+
+##############################################################################
+async def settle(pilot: Pilot[None]) -> float:
+    """Wait for the application to settle.
+
+    Args:
+        pilot: The pilot driving the application.
+
+    Returns:
+        The time at which the application settled.
+    """
+    await pilot.pause()
+    while any(worker.is_running for worker in pilot.app.workers):
+        await pilot.pause(0.001)
+    await pilot.pause()
+    return perf_counter()
+
+
+##############################################################################
+async def press(pilot: Pilot[None], recorder: Recorder, *keys: str) -> Timing:
+    """Press some keys and time how long the application takes to react.
+
+    Args:
+        pilot: The pilot driving the application.
+        recorder: The recorder of frames.
+        keys: The keys to press.
+
+    Returns:
+        The timing of the action.
+    """
+    started = perf_counter()
+    await pilot.press(*keys)
+    return recorder.since(started, await settle(pilot))
+
+
+##############################################################################
+def summarise(timings: list[Timing]) -> dict[str, Any]:
+    """Summarise a collection of timings.
+
+    Args:
+        timings: The timings to summarise.
+
+    Returns:
+        The summary.
+    """
+    summary: dict[str, Any] = {"count": len(timings)}
+    for measure in ("message_loop", "first_frame", "last_frame"):
+        values = [
+            value
+            for timing in timings
+            if (value := getattr(timing, measure)) is not None
+        ]
+        if values:
+            summary[measure] = {
+                "min": min(values),
+                "mean": mean(values),
+                "median": median(values),
+                "p95": quantiles(values, n=20)[-1] if len(values) > 1 else values[0],
+                "max": max(values),
+            }
+    summary["frames"] = sum(timing.frames for timing in timings)
+    return summary
+
+
+##############################################################################
+async def sync_new_articles(
+    pilot: Pilot[None], reader: FakeReader, count: int
+) -> dict[str, Any]:
+    """Time a sync that brings new articles into the list being shown.
+
+    Args:
+        pilot: The pilot driving the application.
+        reader: The fake reader.
+        count: The number of new articles to sync.
+
+    Returns:
+        The times, from the start of the sync, at which new articles first
+        appeared in the list, at which the sync finished, and at which the
+        application settled afterwards.
+    """
+    from oldnews.commands import RefreshFromTheOldReader
+    from oldnews.screens import Main
+
+    assert isinstance(main := pilot.app.screen, Main)
+    shown = main.article_list.option_count
+    with reader.lock:
+        reader.data.add_articles(count)
+    started = perf_counter()
+    first_merge: float | None = None
+    main.post_message(RefreshFromTheOldReader())
+
+    def syncing() -> bool:
+        return any(
+            worker.group == "sync" and worker.is_running for worker in pilot.app.workers
+        )
+
+    while not syncing():
+        await pilot.pause(0.001)
+    while syncing():
+        if first_merge is None and main.article_list.option_count != shown:
+            first_merge = perf_counter() - started
+        await pilot.pause(0.01)
+    finished = perf_counter() - started
+    settled = await settle(pilot) - started
+    return {
+        "first_merge": first_merge,
+        "sync_finished": finished,
+        "settled": settled,
+        "articles_added": main.article_list.option_count - shown,
+    }
+
+
+##############################################################################
+async def scan_articles(
+    pilot: Pilot[None], recorder: Recorder, reader: FakeReader, steps: int
+) -> dict[str, Any]:
+    """Time scanning quickly through articles, and then stopping on one.
+
+    Args:
+        pilot: The pilot driving the application.
+        recorder: The recorder of frames.
+        reader: The fake reader.
+        steps: The number of articles to scan through.
+
+    Returns:
+        The timings of the scan, along with the number of calls made to
+        TheOldReader while scanning and once stopped on an article.
+    """
+    from oldnews.data import load_configuration
+    from oldnews.read_marker import ReadMarker
+
+    requests = reader.requests
+    timings = [await press(pilot, recorder, "N") for _ in range(steps)]
+    scanning = reader.requests - requests
+    # Stay on the last article for long enough for it to be marked as read.
+    await pilot.pause(
+        load_configuration().mark_read_after + ReadMarker.WRITE_INTERVAL + 0.5
+    )
+    await settle(pilot)
+    return summarise(timings) | {
+        "requests_while_scanning": scanning,
+        "requests_once_stopped": reader.requests - requests - scanning,
+    }
+
+
+##############################################################################
+async def drive(steps: int, reader: FakeReader, sync_articles: int) -> dict[str, Any]:
+    """Drive the application through the benchmarked actions.
+
+    Args:
+        steps: The number of articles to step through.
+        reader: The fake reader.
+        sync_articles: The number of new articles to sync.
+
+    Returns:
+        The results of the benchmark.
+    """
+    from oldnews.screens import Main
+    from oldnews.widgets.navigation import FolderView
+
+    recorder = Recorder()
+    app = benchmark_app(recorder)
+    results: dict[str, Any] = {}
+    started = perf_counter()
+    async with app.run_test(size=(160, 50)) as pilot:
+        while not (isinstance(app.screen, Main) and app.screen.navigation.option_count):
+            await pilot.pause(0.001)
+        results["mount_main"] = recorder.since(started, await settle(pilot)).as_dict()
+        main = app.screen
+
+        # Select the first folder.
+        main.navigation.focus()
+        main.navigation.highlighted = next(
+            index
+            for index, option in enumerate(main.navigation.options)
+            if isinstance(option, FolderView)
+        )
+        results["select_folder"] = (await press(pilot, recorder, "enter")).as_dict()
+        results["articles_shown"] = main.article_list.option_count
+
+        # View the first article, then step through the unread ones.
+        await press(pilot, recorder, "enter")
+        results["next_unread"] = summarise(
+            [await press(pilot, recorder, "n") for _ in range(steps)]
+        )
+
+        # Scan quickly through articles regardless of read status.
+        results["scan_articles"] = await scan_articles(pilot, recorder, reader, steps)
+
+        # Back out to the list, and then play with the display.
+        await press(pilot, recorder, "escape")
+        results["toggle_compact"] = summarise(
+            [await press(pilot, recorder, "f5") for _ in range(2)]
+        )
+        results["toggle_show_all"] = summarise(
+            [await press(pilot, recorder, "f2") for _ in range(2)]
+        )
+
+        # Sync new articles into the list while it's showing.
+        results["sync_new_articles"] = await sync_new_articles(
+            pilot, reader, sync_articles
+        )
+        await pilot.exit(None)
+    return results
+
+
+##############################################################################
+def get_args() -> Namespace:
+    """Get the command line arguments.
+
+    Returns:
+        The parsed arguments.
+    """
+    parser = ArgumentParser(description="Benchmark the user interface.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--feeds", type=int, default=50)
+    parser.add_argument("--articles", type=int, default=5_000)
+    parser.add_argument("--summary-size", type=int, default=2_000)
+    parser.add_argument("--read-ratio", type=float, default=0.5)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--sync-articles", type=int, default=1_000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--output", type=Path, help="File to write the results to")
+    return parser.parse_args()
+
+
+##############################################################################
+async def main() -> None:
+    """Main entry point for the benchmark."""
+    from oldnews import __version__
+    from oldnews.data import save_configuration, set_auth_token
+    from oldnews.data.config import Configuration
+    from oldnews.session import OldNewsSession
+
+    args = get_args()
+    reader = FakeReader(
+        lambda: SyntheticReader(
+            seed=args.seed,
+            feeds=args.feeds,
+            # A single folder, so that it holds all of the articles.
+            folders=1,
+            articles=args.articles,
+            summary_size=args.summary_size,
+            read_ratio=args.read_ratio,
+        ),
+        args.latency,
+    )
+    with local_data() as data, serving(reader) as server:
+        await data.build(reader.data)
+        set_auth_token("benchmark")
+        save_configuration(Configuration(background_sync_interval=0))
+        OldNewsSession._API = f"{server.url}/reader/api/0/"
+        results = await drive(args.steps, reader, args.sync_articles)
+    output = {
+        "version": __version__,
+        "python": python_version(),
+        "platform": platform(),
+        "time": time(),
+        "parameters": vars(args) | {"output": None},
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(dumps(output, indent=4))
+    else:
+        print(dumps(output, indent=4))
+
+
+##############################################################################
+if __name__ == "__main__":
+    run(main())
+    # The database's worker thread can keep the interpreter alive at exit.
+    _exit(0)
+
+### ui.py ends here
@@ -3,13 +3,21 @@
 ##############################################################################
 # Python imports.
 from argparse import ArgumentParser, Namespace
+from asyncio import run
 from inspect import cleandoc
 from operator import attrgetter
 
 ##############################################################################
 # Local imports.
 from . import __doc__, __version__
-from .data import reset_data
+from .data import (
+    get_summary_storage,
+    initialise_local_data,
+    load_query_stats,
+    reset_data,
+    reset_query_stats,
+    shutdown_local_data,
+)
 from .data.locations import config_dir, data_dir
 from .oldnews import OldNews
 
@@ -89,6 +97,34 @@ def get_args() -> Namespace:
         action="store_true",
     )
 
+    # Add the 'query-stats' command.
+    query_stats = sub_parser.add_parser(
+        "query-stats",
+        aliases=["qs"],
+        help="Show statistics about the database queries made by OldNews",
+    )
+    query_stats.add_argument(
+        "-s",
+        "--sort",
+        help="The statistic to sort by",
+        choices=("total", "mean", "maximum", "statements", "rows"),
+        default="total",
+    )
+    query_stats.add_argument(
+        "-r", "--reset", help="Reset the statistics", action="store_true"
+    )
+
+    # Add the 'storage' command.
+    sub_parser.add_parser(
+        "storage", help="Show how much space the local news data takes up"
+    )
+
+    # Add the 'daemon' command.
+    sub_parser.add_parser(
+        "daemon",
+        help="Run a sync daemon that instances of OldNews on this host can share",
+    )
+
     # Finally, parse the command line.
     return parser.parse_args()
 
@@ -139,6 +175,88 @@ def reset_news(args: Namespace) -> None:
             print("Login token removed")
 
 
+##############################################################################
+def show_query_stats(args: Namespace) -> None:
+    """Show the statistics about the database queries made.
+
+    Args:
+        args: The command line arguments.
+    """
+    from rich.console import Console
+    from rich.table import Column, Table
+
+    if args.reset:
+        reset_query_stats()
+        print("Query statistics reset")
+        return
+    if not (stats := load_query_stats()):
+        print("No query statistics have been recorded yet")
+        return
+    table = Table("Statements", "Rows", "Total", "Mean", "Maximum")
+    table.columns.insert(0, Column("Function", overflow="fold"))
+    for function in sorted(
+        stats.values(),
+        key=attrgetter(
+            {
+                "total": "total_time",
+                "mean": "mean_time",
+                "maximum": "maximum_time",
+                "statements": "statements",
+                "rows": "rows",
+            }[args.sort]
+        ),
+        reverse=True,
+    ):
+        table.add_row(
+            function.function,
+            f"{function.statements:,}",
+            f"{function.rows:,}",
+            f"{function.total_time:.3f}s",
+            f"{function.mean_time * 1_000:.2f}ms",
+            f"{function.maximum_time * 1_000:.2f}ms",
+        )
+    Console().print(table)
+
+
+##############################################################################
+async def show_storage() -> None:
+    """Show how much space the local news data takes up."""
+    from humanize import intcomma, naturalsize
+
+    from .data.local_data import local_db_file
+
+    await initialise_local_data()
+    try:
+        storage = await get_summary_storage()
+    finally:
+        await shutdown_local_data()
+    print(f"Database:            {naturalsize(local_db_file().stat().st_size)}")
+    print(f"Articles:            {intcomma(storage.articles)}")
+    print(f"Summaries:           {naturalsize(storage.original)}")
+    print(f"Summaries (stored):  {naturalsize(storage.stored)}")
+    print(f"Saved:               {naturalsize(storage.saved)} ({storage.saving:.0%})")
+
+
+##############################################################################
+async def run_daemon() -> None:
+    """Run the sync daemon."""
+    from .daemon import SyncDaemon, daemon_running, socket_file
+    from .data import Log, get_auth_token
+    from .session import OldNewsSession
+
+    if not (token := get_auth_token()):
+        print("Not logged in to TheOldReader; run OldNews to log in first")
+        return
+    if await daemon_running():
+        print("The sync daemon is already running")
+        return
+    print(f"Sync daemon listening on {socket_file()}; press Ctrl+C to stop")
+    try:
+        await SyncDaemon(OldNewsSession("OldNews", token, logger=Log())).serve()
+    finally:
+        print("Sync daemon stopped")
+
+
 ##############################################################################
 def main() -> None:
     """Main entry function."""
@@ -154,6 +272,15 @@ def main() -> None:
             show_bindable_commands()
         case "themes":
             show_themes()
+        case "qs" | "query-stats":
+            show_query_stats(args)
+        case "storage":
+            run(show_storage())
+        case "daemon":
+            try:
+                run(run_daemon())
+            except KeyboardInterrupt:
+                pass
         case _:
             OldNews(args).run()
 
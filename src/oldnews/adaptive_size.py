@@ -0,0 +1,68 @@
+"""Provides a class for adapting a batch size to how long batches take."""
+
+##############################################################################
+# Python imports.
+from dataclasses import dataclass
+
+##############################################################################
+SMOOTHING = 0.3
+"""How much weight a new observation has against those that came before."""
+
+
+##############################################################################
+@dataclass
+class AdaptiveSize:
+    """A batch size that adapts so that each batch takes about a target time.
+
+    The time taken per item is tracked as a moving average, and the size is
+    set to the number of items that should take the target time; it's never
+    more than doubled or halved in one go, and always stays within its
+    bounds.
+    """
+
+    size: int
+    """The current size."""
+    minimum: int
+    """The smallest the size can be."""
+    maximum: int
+    """The largest the size can be."""
+    target: float
+    """The number of seconds a batch should ideally take."""
+
+    def __post_init__(self) -> None:
+        """Initialise the size."""
+        self.size = self._bounded(self.size)
+        self._per_item: float | None = None
+        """The moving average of the number of seconds taken per item."""
+
+    def _bounded(self, size: float) -> int:
+        """Keep a size within the bounds.
+
+        Args:
+            size: The size to bound.
+
+        Returns:
+            The size, within the bounds.
+        """
+        return max(self.minimum, min(self.maximum, round(size)))
+
+    def observe(self, seconds: float, items: int) -> None:
+        """Observe how long a batch took, and adapt the size.
+
+        Args:
+            seconds: The number of seconds the batch took.
+            items: The number of items in the batch.
+        """
+        if items <= 0:
+            return
+        per_item = seconds / items
+        self._per_item = (
+            per_item
+            if self._per_item is None
+            else (SMOOTHING * per_item) + ((1 - SMOOTHING) * self._per_item)
+        )
+        ideal = self.target / self._per_item if self._per_item else self.maximum
+        self.size = self._bounded(min(max(ideal, self.size / 2), self.size * 2))
+
+
+### adaptive_size.py ends here
@@ -18,6 +18,7 @@ from .copying import (
 from .main import (
     Information,
     RefreshFromTheOldReader,
+    SyncInformation,
     UserInformation,
 )
 from .marking import (
@@ -28,6 +29,7 @@ from .marking import (
 from .navigation import (
     Next,
     NextUnread,
+    NextUnreadCategory,
     Previous,
     PreviousUnread,
 )
@@ -62,6 +64,7 @@ __all__ = [
     "MarkUnread",
     "Next",
     "NextUnread",
+    "NextUnreadCategory",
     "MoveSubscription",
     "OpenArticle",
     "OpenHomePage",
@@ -71,6 +74,7 @@ __all__ = [
     "Rename",
     "Remove",
     "SetSubscriptionContentFilter",
+    "SyncInformation",
     "ToggleCompact",
     "ToggleShowAll",
     "UserInformation",
@@ -21,6 +21,11 @@ class Information(Command):
     BINDING_KEY = "i"
 
 
+##############################################################################
+class SyncInformation(Command):
+    """Show performance reports for the most recent syncs with TheOldReader"""
+
+
 ##############################################################################
 class UserInformation(Command):
     """Show the information known about the logged-in account"""
@@ -12,6 +12,13 @@ class NextUnread(Command):
     BINDING_KEY = "n"
 
 
+##############################################################################
+class NextUnreadCategory(Command):
+    """Navigate to the first unread article in the next category with unread articles"""
+
+    BINDING_KEY = "ctrl+n"
+
+
 ##############################################################################
 class Next(Command):
     """Navigate to the next article regardless of read status"""
@@ -69,22 +69,25 @@ async def _filter_content(article: Article, content: str) -> str:
         content: The content to filter.
     """
     Log().debug(
-        f"Looking for content filter for article {article.id} in subscription {article.origin.stream_id}"
+        "Looking for content filter for article %s in subscription %s",
+        article.id,
+        article.origin.stream_id,
     )
     if article.origin.stream_id and (
         content_filter := await get_content_grab_filter_for(article.origin.stream_id)
     ):
-        Log().debug(f"Found selector '{content_filter}'")
+        Log().debug("Found selector '%s'", content_filter)
         if target_content := BeautifulSoup(content, "html.parser").select_one(
             content_filter
         ):
             content = str(target_content)
         else:
             Log().warning(
-                f"The selector '{content_filter}' matched nothing; falling back to downloaded content"
+                "The selector '%s' matched nothing; falling back to downloaded content",
+                content_filter,
             )
     else:
-        Log().debug(f"No selector found for subscription {article.origin.stream_id}")
+        Log().debug("No selector found for subscription %s", article.origin.stream_id)
     return content
 
 
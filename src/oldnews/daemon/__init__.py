@@ -0,0 +1,19 @@
+"""Provides the sync daemon, and the means of attaching to it."""
+
+##############################################################################
+# Local imports.
+from .client import DaemonClient, daemon_running
+from .protocol import changes_from_json, socket_file
+from .server import SyncDaemon
+
+##############################################################################
+# Exports.
+__all__ = [
+    "changes_from_json",
+    "DaemonClient",
+    "daemon_running",
+    "socket_file",
+    "SyncDaemon",
+]
+
+### __init__.py ends here
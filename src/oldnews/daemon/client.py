@@ -0,0 +1,134 @@
+"""Provides the connection from OldNews to the sync daemon."""
+
+##############################################################################
+# Python imports.
+from asyncio import StreamReader, StreamWriter, open_unix_connection
+from collections.abc import AsyncIterator, Iterable
+from pathlib import Path
+from typing import Any, Self
+
+##############################################################################
+# Local imports.
+from ..data import Log
+from .protocol import LINE_LIMIT, Message, decode, encode, socket_file
+
+
+##############################################################################
+class DaemonClient:
+    """A connection from OldNews to the sync daemon."""
+
+    def __init__(self, reader: StreamReader, writer: StreamWriter) -> None:
+        """Initialise the connection.
+
+        Args:
+            reader: The stream to read events from the daemon with.
+            writer: The stream to send requests to the daemon with.
+        """
+        self._reader = reader
+        """The stream to read events from the daemon with."""
+        self._writer = writer
+        """The stream to send requests to the daemon with."""
+
+    @classmethod
+    async def attach(cls, path: Path | None = None) -> Self | None:
+        """Attach to the sync daemon, if it's running.
+
+        Args:
+            path: The path to the daemon's socket; the default if not given.
+
+        Returns:
+            The connection to the daemon, or `None` if it isn't running.
+        """
+        if not (path := path or socket_file()).exists():
+            return None
+        try:
+            reader, writer = await open_unix_connection(path, limit=LINE_LIMIT)
+        except OSError:
+            return None
+        return cls(reader, writer)
+
+    async def detach(self) -> None:
+        """Detach from the sync daemon."""
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def events(self) -> AsyncIterator[Message]:
+        """Get the events sent by the daemon.
+
+        Yields:
+            The events, until the connection to the daemon is lost.
+        """
+        while True:
+            try:
+                if not (line := await self._reader.readline()):
+                    break
+                event = decode(line)
+            except ConnectionError:
+                break
+            except ValueError as error:
+                Log().warning("Bad event from the sync daemon: %s", error)
+                continue
+            yield event
+        Log().warning("Lost the connection to the sync daemon")
+
+    async def _send(self, kind: str, **data: Any) -> bool:
+        """Send a request to the daemon.
+
+        Args:
+            kind: The kind of request.
+            data: The data for the request.
+
+        Returns:
+            `True` if the request was sent, `False` if the connection to the
+            daemon has been lost.
+        """
+        if self._writer.is_closing():
+            return False
+        try:
+            self._writer.write(encode(kind, **data))
+            await self._writer.drain()
+        except ConnectionError:
+            return False
+        return True
+
+    async def request_sync(self) -> bool:
+        """Ask the daemon to sync with TheOldReader now.
+
+        Returns:
+            `True` if the request was sent, `False` if not.
+        """
+        return await self._send("sync")
+
+    async def mark(self, read: Iterable[str], unread: Iterable[str]) -> bool:
+        """Ask the daemon to mark articles as read or unread.
+
+        Args:
+            read: The IDs of the articles to mark as read.
+            unread: The IDs of the articles to mark as unread.
+
+        Returns:
+            `True` if the request was sent, `False` if not.
+        """
+        return await self._send("mark", read=sorted(read), unread=sorted(unread))
+
+
+##############################################################################
+async def daemon_running(path: Path | None = None) -> bool:
+    """Is the sync daemon running?
+
+    Args:
+        path: The path to the daemon's socket; the default if not given.
+
+    Returns:
+        `True` if the daemon is running and can be attached to, `False` if not.
+    """
+    if (client := await DaemonClient.attach(path)) is None:
+        return False
+    await client.detach()
+    return True
+
+
+### client.py ends here
@@ -0,0 +1,117 @@
+"""The protocol spoken between the sync daemon and the instances of OldNews.
+
+The daemon listens on a Unix socket in the application's data directory.
+Messages go both ways as lines of JSON, each an object with a `kind`:
+
+- From OldNews to the daemon, requests: `sync` asks for a sync with
+  TheOldReader now; `mark` asks for articles to be marked as read or
+  unread.
+- From the daemon to OldNews, events: `step`, `result`, `folders`,
+  `subscriptions`, `unread`, `articles_changed` and `sync_finished` report
+  on the progress of a sync, much as the callbacks of `TheOldReaderSync`
+  do; `sync_failed` and `error` report problems.
+
+The daemon is the only writer of the data it's responsible for; OldNews
+instances that are attached to it still read the local database directly.
+"""
+
+##############################################################################
+# Python imports.
+from json import dumps, loads
+from pathlib import Path
+from typing import Any
+
+##############################################################################
+# Local imports.
+from ..data import ArticleChanges
+from ..data.locations import data_dir
+
+##############################################################################
+LINE_LIMIT = 16 * 1024 * 1024
+"""The longest line of JSON that can be sent; changes can carry a lot of IDs."""
+
+type Message = dict[str, Any]
+"""Type of a message sent between the daemon and OldNews."""
+
+
+##############################################################################
+def socket_file() -> Path:
+    """Get the file of the socket that the daemon listens on.
+
+    Returns:
+        The file of the socket.
+    """
+    return data_dir() / "daemon.sock"
+
+
+##############################################################################
+def encode(kind: str, **data: Any) -> bytes:
+    """Encode a message, ready to be sent.
+
+    Args:
+        kind: The kind of message.
+        data: The data for the message.
+
+    Returns:
+        The message as a line of JSON.
+    """
+    return f"{dumps({'kind': kind, **data}, separators=(',', ':'))}\n".encode()
+
+
+##############################################################################
+def decode(line: bytes) -> Message:
+    """Decode a message that has been received.
+
+    Args:
+        line: The line of JSON that was received.
+
+    Returns:
+        The message.
+
+    Raises:
+        ValueError: If the line isn't a message.
+    """
+    if not isinstance(message := loads(line), dict) or "kind" not in message:
+        raise ValueError(f"Not a message: {line!r}")
+    return message
+
+
+##############################################################################
+def changes_to_json(changes: ArticleChanges) -> dict[str, list[str]]:
+    """Convert a set of article changes so that they can be sent.
+
+    Args:
+        changes: The changes to convert.
+
+    Returns:
+        The changes, as lists of article IDs keyed by the kind of change.
+    """
+    return {
+        "added": sorted(changes.added),
+        "updated": sorted(changes.updated),
+        "read": sorted(changes.read),
+        "unread": sorted(changes.unread),
+        "removed": sorted(changes.removed),
+    }
+
+
+##############################################################################
+def changes_from_json(changes: dict[str, list[str]]) -> ArticleChanges:
+    """Convert a set of article changes that have been received.
+
+    Args:
+        changes: The changes, as lists of article IDs keyed by the kind of change.
+
+    Returns:
+        The changes.
+    """
+    return ArticleChanges(
+        added=frozenset(changes.get("added", ())),
+        updated=frozenset(changes.get("updated", ())),
+        read=frozenset(changes.get("read", ())),
+        unread=frozenset(changes.get("unread", ())),
+        removed=frozenset(changes.get("removed", ())),
+    )
+
+
+### protocol.py ends here
@@ -0,0 +1,314 @@
+"""Provides the sync daemon.
+
+The sync daemon lets several instances of OldNews on the same host, be they
+in terminals or served to browsers, share a single sync with TheOldReader
+and a single path for writing to the local database, rather than each
+running its own and competing for the database.
+"""
+
+##############################################################################
+# Python imports.
+from asyncio import (
+    Event,
+    StreamReader,
+    StreamWriter,
+    Task,
+    create_task,
+    start_unix_server,
+    wait_for,
+)
+from collections.abc import Coroutine
+from datetime import UTC, datetime, timedelta
+from os import umask
+from pathlib import Path
+from socket import AF_UNIX, SOCK_STREAM, socket
+from typing import Any
+
+##############################################################################
+# OldAS imports.
+from oldas import OldASError, Session, State
+
+##############################################################################
+# Local imports.
+from ..data import (
+    ArticleChanges,
+    Log,
+    clean_old_read_articles,
+    initialise_local_data,
+    last_grabbed_data_at,
+    load_configuration,
+    locally_mark_article_ids_read,
+    locally_mark_article_ids_unread,
+    shutdown_local_data,
+)
+from ..sync import TheOldReaderSync
+from ..sync_schedule import SyncSchedule
+from .protocol import LINE_LIMIT, Message, changes_to_json, decode, encode, socket_file
+
+##############################################################################
+CLIENT_BACKLOG_LIMIT = 4 * LINE_LIMIT
+"""The most unsent data a client can have before it's dropped as too slow."""
+
+
+##############################################################################
+def _listening_socket(path: Path) -> socket:
+    """Create the socket that the daemon listens on.
+
+    Args:
+        path: The path of the socket.
+
+    Returns:
+        The socket, bound to the path.
+
+    Note:
+        Only the user that owns the local data should be able to attach, so
+        the socket is created with no access for anyone else, rather than
+        having its permissions tightened once it already exists.
+    """
+    listener = socket(AF_UNIX, SOCK_STREAM)
+    previous = umask(0o177)
+    try:
+        listener.bind(str(path))
+    except OSError:
+        listener.close()
+        raise
+    finally:
+        umask(previous)
+    return listener
+
+
+##############################################################################
+class SyncDaemon:
+    """A daemon that syncs with TheOldReader for the instances of OldNews on a host.
+
+    The daemon owns the session with TheOldReader, the schedule of
+    background syncs, and the writing of syncs and read states to the local
+    database. Instances of OldNews attach to it over a Unix socket; they
+    send it requests, and it tells all of them about what it has changed.
+    """
+
+    def __init__(self, session: Session) -> None:
+        """Initialise the daemon.
+
+        Args:
+            session: The TheOldReader API session to sync with.
+        """
+        self._session = session
+        """The TheOldReader API session."""
+        configuration = load_configuration()
+        self._schedule = SyncSchedule(
+            configuration.background_sync_interval,
+            configuration.background_sync_jitter,
+            configuration.background_sync_maximum_interval,
+        )
+        """The schedule for background syncs with TheOldReader."""
+        self._clients: set[StreamWriter] = set()
+        """The streams for sending events to the attached instances of OldNews."""
+        self._sync_wanted = Event()
+        """Event set when a sync has been asked for."""
+        self._tasks: set[Task[None]] = set()
+        """The tasks that are running in the background."""
+
+    def _publish(self, kind: str, **data: Any) -> None:
+        """Send an event to all of the attached instances of OldNews.
+
+        Args:
+            kind: The kind of event.
+            data: The data for the event.
+        """
+        event = encode(kind, **data)
+        for client in list(self._clients):
+            if client.transport.get_write_buffer_size() > CLIENT_BACKLOG_LIMIT:
+                Log().warning("Dropping a sync daemon client that has fallen behind")
+                self._clients.discard(client)
+                client.close()
+            elif not client.is_closing():
+                client.write(event)
+
+    def _in_background(self, work: Coroutine[Any, Any, None]) -> None:
+        """Run some work in the background.
+
+        Args:
+            work: The work to run.
+        """
+        self._tasks.add(task := create_task(work))
+        task.add_done_callback(self._tasks.discard)
+
+    async def _remotely_mark(
+        self, read: frozenset[str], unread: frozenset[str]
+    ) -> None:
+        """Mark articles as read or unread on TheOldReader.
+
+        Args:
+            read: The IDs of the articles to mark as read.
+            unread: The IDs of the articles to mark as unread.
+        """
+        try:
+            if read:
+                await self._session.add_tag(sorted(read), State.READ)
+            if unread:
+                await self._session.remove_tag(sorted(unread), State.READ)
+        except OldASError as error:
+            Log().error("Marking articles on TheOldReader failed: %s", error)
+            self._publish(
+                "error", title="Failed to mark on TheOldReader", error=str(error)
+            )
+
+    async def _mark(self, read: frozenset[str], unread: frozenset[str]) -> None:
+        """Mark articles as read or unread.
+
+        Args:
+            read: The IDs of the articles to mark as read.
+            unread: The IDs of the articles to mark as unread.
+        """
+        if read:
+            await locally_mark_article_ids_read(read)
+        if unread:
+            await locally_mark_article_ids_unread(unread)
+        self._publish(
+            "articles_changed",
+            changes=changes_to_json(ArticleChanges(read=read, unread=unread)),
+        )
+        self._in_background(self._remotely_mark(read, unread))
+
+    async def _handle(self, request: Message) -> None:
+        """Handle a request from an instance of OldNews.
+
+        Args:
+            request: The request to handle.
+        """
+        match request["kind"]:
+            case "sync":
+                self._sync_wanted.set()
+            case "mark":
+                await self._mark(
+                    frozenset(request.get("read", ())),
+                    frozenset(request.get("unread", ())),
+                )
+            case kind:
+                Log().warning("Unknown request to the sync daemon: %s", kind)
+
+    async def _serve(self, reader: StreamReader, writer: StreamWriter) -> None:
+        """Serve an instance of OldNews that has attached to the daemon.
+
+        Args:
+            reader: The stream to read requests from.
+            writer: The stream to send events to.
+        """
+        self._clients.add(writer)
+        Log().info("Sync daemon client attached; now serving %s", len(self._clients))
+        try:
+            while line := await reader.readline():
+                try:
+                    request = decode(line)
+                except ValueError as error:
+                    Log().warning("Bad request to the sync daemon: %s", error)
+                    continue
+                try:
+                    await self._handle(request)
+                except Exception as error:
+                    # Most likely the local database is busy with another
+                    # writer; report it, but keep serving the client.
+                    Log().error("Sync daemon request failed: %s", error)
+                    writer.write(
+                        encode(
+                            "error",
+                            title="The sync daemon couldn't do that",
+                            error=str(error),
+                        )
+                    )
+        except (ConnectionError, ValueError) as error:
+            Log().warning("Sync daemon client connection failed: %s", error)
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+            Log().info(
+                "Sync daemon client detached; now serving %s", len(self._clients)
+            )
+
+    async def _sync(self) -> None:
+        """Sync with TheOldReader, telling the attached instances as it goes."""
+        sync = TheOldReaderSync(
+            self._session,
+            on_new_step=lambda step: self._publish("step", text=step),
+            on_new_result=lambda result: self._publish("result", text=result),
+            on_new_folders=lambda _: self._publish("folders"),
+            on_new_subscriptions=lambda _: self._publish("subscriptions"),
+            on_new_unread=lambda counts: self._publish("unread", counts=counts),
+            on_articles_changed=lambda changes: self._publish(
+                "articles_changed", changes=changes_to_json(changes)
+            ),
+            on_sync_finished=lambda changed: self._publish(
+                "sync_finished", articles_changed=changed
+            ),
+        )
+        try:
+            await sync.sync()
+        except Exception as error:
+            # Whatever went wrong, be it with TheOldReader or with the local
+            # database, the daemon needs to keep going for the instances
+            # that are attached to it.
+            Log().error("Sync with TheOldReader failed: %s", error)
+            self._schedule.failed()
+            self._publish("sync_failed", error=str(error))
+        else:
+            self._schedule.synced(sync.articles_changed)
+
+    async def _sync_when_due(self) -> None:
+        """Sync with TheOldReader whenever asked to, or when the schedule says so."""
+        if (last_grabbed := await last_grabbed_data_at()) is None or (
+            (datetime.now(UTC) - last_grabbed).total_seconds()
+            >= load_configuration().startup_refresh_holdoff_period
+        ):
+            self._sync_wanted.set()
+        while True:
+            try:
+                await wait_for(
+                    self._sync_wanted.wait(),
+                    self._schedule.next_delay if self._schedule.enabled else None,
+                )
+            except TimeoutError:
+                Log().info("Starting background sync")
+            # Any requests for a sync that come in while this one is
+            # running will result in another once it's done.
+            self._sync_wanted.clear()
+            await self._sync()
+
+    async def serve(self, path: Path | None = None) -> None:
+        """Run the daemon.
+
+        Args:
+            path: The path to listen on; the default socket if not given.
+
+        Note:
+            This runs until it is cancelled. It should only be run if the
+            daemon isn't already running, as any existing socket at the
+            path is removed.
+        """
+        path = path or socket_file()
+        path.unlink(missing_ok=True)
+        await initialise_local_data()
+        try:
+            if cleaned := await clean_old_read_articles(
+                timedelta(days=load_configuration().local_history)
+            ):
+                Log().info("Old read articles cleaned from local storage: %s", cleaned)
+            server = await start_unix_server(
+                self._serve, sock=_listening_socket(path), limit=LINE_LIMIT
+            )
+            Log().info("Sync daemon listening on %s", path)
+            try:
+                await self._sync_when_due()
+            finally:
+                # Closing the server waits for the clients to go, so send
+                # them on their way first.
+                for client in self._clients:
+                    client.close()
+                server.close()
+                await server.wait_closed()
+        finally:
+            path.unlink(missing_ok=True)
+            await shutdown_local_data()
+
+
+### server.py ends here
@@ -2,7 +2,11 @@
 
 ##############################################################################
 # Local imports.
+from .article_headers import ArticleHeader, ArticleHeaders
 from .auth import get_auth_token, set_auth_token
+from .batch_sizes import BatchSizes, load_batch_sizes, save_batch_sizes
+from .change_set import ArticleChanges, ChangeSet
+from .compression import SummaryStorage, get_summary_storage
 from .config import (
     Configuration,
     load_configuration,
@@ -12,8 +16,12 @@ from .config import (
 from .dump import data_dump
 from .last_grab import last_grabbed_data_at, remember_we_last_grabbed_at
 from .local_articles import (
+    SavedArticles,
     clean_old_read_articles,
+    get_local_article,
+    get_local_article_headers,
     get_local_articles,
+    get_local_articles_by_id,
     get_unread_article_ids,
     locally_known_article_ids,
     locally_mark_article_ids_read,
@@ -36,32 +44,46 @@ from .local_subscriptions import (
     set_content_grab_filter_for,
 )
 from .local_unread import LocalUnread, get_local_unread, total_unread
-from .log import Log
+from .log import Capped, Log
 from .navigation_state import (
     get_navigation_state,
     rename_folder_in_navigation_state,
     save_navigation_state,
 )
+from .query_stats import QueryStats, load_query_stats, reset_query_stats
 from .reset import reset_data
+from .sync_report import SyncPhase, SyncReport, measuring, tally
 
 ##############################################################################
 # Exports.
 __all__ = [
+    "ArticleChanges",
+    "ArticleHeader",
+    "ArticleHeaders",
+    "BatchSizes",
+    "Capped",
+    "ChangeSet",
     "clean_old_read_articles",
     "Configuration",
     "data_dump",
     "get_all_content_grab_filters",
     "get_auth_token",
     "get_content_grab_filter_for",
+    "get_local_article",
+    "get_local_article_headers",
     "get_local_articles",
+    "get_local_articles_by_id",
     "get_local_folders",
     "get_local_subscriptions",
     "get_local_unread",
     "get_navigation_state",
+    "get_summary_storage",
     "get_unread_article_ids",
     "initialise_local_data",
     "last_grabbed_data_at",
+    "load_batch_sizes",
     "load_configuration",
+    "load_query_stats",
     "locally_known_article_ids",
     "locally_mark_article_ids_read",
     "locally_mark_article_ids_unread",
@@ -69,13 +91,18 @@ __all__ = [
     "locally_mark_unread",
     "LocalUnread",
     "Log",
+    "measuring",
     "move_subscription_articles",
+    "QueryStats",
     "remember_we_last_grabbed_at",
     "remove_folder_from_articles",
     "remove_subscription_articles",
     "rename_folder_for_articles",
     "rename_folder_in_navigation_state",
     "reset_data",
+    "reset_query_stats",
+    "SavedArticles",
+    "save_batch_sizes",
     "save_configuration",
     "save_local_articles",
     "save_local_folders",
@@ -84,6 +111,10 @@ __all__ = [
     "set_auth_token",
     "set_content_grab_filter_for",
     "shutdown_local_data",
+    "SyncPhase",
+    "SummaryStorage",
+    "SyncReport",
+    "tally",
     "total_unread",
     "update_configuration",
 ]
@@ -0,0 +1,43 @@
+"""Provides a compact record of the details needed to list an article."""
+
+##############################################################################
+# Python imports.
+from dataclasses import dataclass
+from datetime import datetime
+
+
+##############################################################################
+@dataclass(frozen=True, slots=True)
+class ArticleHeader:
+    """The details of an article that are needed to list it.
+
+    This holds only what the article list shows, and what's needed to move
+    around the list, so it's far smaller than a full `Article`; the full
+    article is loaded from the local database when it's viewed.
+    """
+
+    id: str
+    """The ID of the article."""
+    title: str
+    """The title of the article."""
+    published: datetime
+    """The time the article was published."""
+    author: str
+    """The author of the article."""
+    origin_title: str
+    """The title of the subscription the article came from."""
+    is_unread: bool
+    """Is the article unread?"""
+
+    @property
+    def is_read(self) -> bool:
+        """Has the article been read?"""
+        return not self.is_unread
+
+
+##############################################################################
+type ArticleHeaders = tuple[ArticleHeader, ...]
+"""Type of a list of article headers."""
+
+
+### article_headers.py ends here
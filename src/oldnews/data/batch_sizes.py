@@ -0,0 +1,60 @@
+"""Code relating to remembering the batch sizes used when syncing."""
+
+##############################################################################
+# Python imports.
+from dataclasses import asdict, dataclass
+from json import dumps, loads
+from pathlib import Path
+
+##############################################################################
+# Local imports.
+from .locations import data_dir
+
+
+##############################################################################
+@dataclass(frozen=True)
+class BatchSizes:
+    """The batch sizes settled on during a sync."""
+
+    page_size: int
+    """The number of articles to ask TheOldReader for in each page."""
+    save_size: int
+    """The number of articles to save to the database in each batch."""
+
+
+##############################################################################
+def batch_sizes_file() -> Path:
+    """The path to the file that holds the remembered batch sizes.
+
+    Returns:
+        The path to the batch sizes file.
+    """
+    return data_dir() / "batch-sizes.json"
+
+
+##############################################################################
+def load_batch_sizes() -> BatchSizes | None:
+    """Load the remembered batch sizes.
+
+    Returns:
+        The batch sizes, or `None` if none have been remembered yet.
+    """
+    if (sizes_file := batch_sizes_file()).exists():
+        try:
+            return BatchSizes(**loads(sizes_file.read_text(encoding="utf-8")))
+        except (ValueError, TypeError):
+            pass
+    return None
+
+
+##############################################################################
+def save_batch_sizes(sizes: BatchSizes) -> None:
+    """Remember the batch sizes.
+
+    Args:
+        sizes: The batch sizes to remember.
+    """
+    batch_sizes_file().write_text(dumps(asdict(sizes), indent=4), encoding="utf-8")
+
+
+### batch_sizes.py ends here
@@ -0,0 +1,141 @@
+"""Provides classes for describing changes made to local data."""
+
+##############################################################################
+# Python imports.
+from dataclasses import dataclass, field, fields
+from heapq import merge
+from operator import attrgetter
+
+##############################################################################
+# Local imports.
+from .article_headers import ArticleHeaders
+from .log import Capped
+
+
+##############################################################################
+def _summary(changes: "ChangeSet | ArticleChanges") -> str:
+    """Summarise some changes, with only a sample of the IDs of each kind.
+
+    Args:
+        changes: The changes to summarise.
+
+    Returns:
+        The summary of the changes.
+    """
+    return (
+        "; ".join(
+            f"{change.name}: {Capped(items)}"
+            for change in fields(changes)
+            if (items := getattr(changes, change.name))
+        )
+        or "No changes"
+    )
+
+
+##############################################################################
+@dataclass(frozen=True)
+class ChangeSet:
+    """The changes made when reconciling local data with TheOldReader."""
+
+    added: frozenset[str] = field(default_factory=frozenset)
+    """The IDs of the items that were added."""
+    removed: frozenset[str] = field(default_factory=frozenset)
+    """The IDs of the items that were removed."""
+    renamed: frozenset[str] = field(default_factory=frozenset)
+    """The IDs of the items whose title changed."""
+    moved: frozenset[str] = field(default_factory=frozenset)
+    """The IDs of the items whose folders changed."""
+    changed: frozenset[str] = field(default_factory=frozenset)
+    """The IDs of the items that changed in any way."""
+
+    def __bool__(self) -> bool:
+        """Does the change set contain any changes?"""
+        return bool(self.added or self.removed or self.changed)
+
+    def __len__(self) -> int:
+        """The number of items that were added, removed or changed."""
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def __str__(self) -> str:
+        """The changes, with only a sample of the IDs of each kind of change."""
+        return _summary(self)
+
+
+##############################################################################
+@dataclass(frozen=True)
+class ArticleChanges:
+    """The changes made to local articles during a sync."""
+
+    added: frozenset[str] = field(default_factory=frozenset)
+    """The IDs of the articles that were added."""
+    updated: frozenset[str] = field(default_factory=frozenset)
+    """The IDs of the articles whose content or categories changed."""
+    read: frozenset[str] = field(default_factory=frozenset)
+    """The IDs of the articles that were marked as read."""
+    unread: frozenset[str] = field(default_factory=frozenset)
+    """The IDs of the articles that were marked as unread."""
+    removed: frozenset[str] = field(default_factory=frozenset)
+    """The IDs of the articles that were removed."""
+
+    def __bool__(self) -> bool:
+        """Does the change set contain any changes?"""
+        return bool(self.article_ids)
+
+    def __or__(self, other: "ArticleChanges") -> "ArticleChanges":
+        """Combine two sets of article changes.
+
+        Args:
+            other: The changes to combine with these.
+
+        Returns:
+            The combined changes.
+        """
+        return ArticleChanges(
+            self.added | other.added,
+            self.updated | other.updated,
+            self.read | other.read,
+            self.unread | other.unread,
+            self.removed | other.removed,
+        )
+
+    def __str__(self) -> str:
+        """The changes, with only a sample of the IDs of each kind of change."""
+        return _summary(self)
+
+    @property
+    def article_ids(self) -> frozenset[str]:
+        """The IDs of all the articles that changed in any way."""
+        return self.added | self.updated | self.read | self.unread | self.removed
+
+    def merged_into(
+        self, articles: ArticleHeaders, changed: ArticleHeaders
+    ) -> ArticleHeaders:
+        """Merge the changed articles into a list of articles.
+
+        Args:
+            articles: The headers of the list of articles, newest first.
+            changed: The headers of the changed articles that belong in the
+                list, newest first.
+
+        Returns:
+            The list of articles with the changes merged in, newest first.
+
+        Note:
+            Any article in the list that changed, but isn't in `changed`,
+            no longer belongs in the list and is dropped.
+        """
+        # A changed article may have a new publication time, so rather than
+        # being updated in place, where it could end up out of order, every
+        # changed article is taken out and merged back in.
+        changed_ids = self.article_ids
+        return tuple(
+            merge(
+                (article for article in articles if article.id not in changed_ids),
+                changed,
+                key=attrgetter("published"),
+                reverse=True,
+            )
+        )
+
+
+### change_set.py ends here
@@ -0,0 +1,126 @@
+"""Provides code for compressing the summaries of articles."""
+
+##############################################################################
+# Python imports.
+from dataclasses import dataclass
+from functools import cached_property
+from zlib import compress, decompress
+
+##############################################################################
+# OldAS imports.
+from oldas.articles import Direction, Summary
+
+##############################################################################
+# Local imports.
+from .models import LocalArticle
+
+##############################################################################
+_COMPRESSED = b"z"
+"""The marker for a summary that is zlib-compressed."""
+
+_PLAIN = b"t"
+"""The marker for a summary that is stored as plain UTF-8 text."""
+
+
+##############################################################################
+def compress_summary(content: str) -> bytes:
+    """Compress the content of a summary for storage.
+
+    Args:
+        content: The content to compress.
+
+    Returns:
+        The compressed content.
+
+    Note:
+        Short summaries can get bigger when compressed; those are stored as
+        they are.
+    """
+    plain = content.encode("utf-8")
+    if len(compressed := compress(plain)) < len(plain):
+        return _COMPRESSED + compressed
+    return _PLAIN + plain
+
+
+##############################################################################
+def decompress_summary(stored: bytes) -> str:
+    """Decompress the stored content of a summary.
+
+    Args:
+        stored: The stored content.
+
+    Returns:
+        The content of the summary.
+    """
+    if stored[:1] == _COMPRESSED:
+        return decompress(stored[1:]).decode("utf-8")
+    return stored[1:].decode("utf-8")
+
+
+##############################################################################
+class CompressedSummary(Summary):
+    """A summary whose content is only decompressed when it's needed."""
+
+    _stored: bytes
+    """The stored, compressed, content of the summary."""
+
+    def __init__(self, direction: Direction, stored: bytes) -> None:
+        """Initialise the summary.
+
+        Args:
+            direction: The direction for the text in the summary.
+            stored: The stored, compressed, content of the summary.
+        """
+        # The summary is frozen, so get around that for our own attributes.
+        object.__setattr__(self, "direction", direction)
+        object.__setattr__(self, "_stored", stored)
+
+    @cached_property
+    def content(self) -> str:
+        """The content of the summary."""
+        return decompress_summary(self._stored)
+
+
+##############################################################################
+@dataclass(frozen=True)
+class SummaryStorage:
+    """Details of how much space the summaries of the articles take up."""
+
+    articles: int
+    """The number of articles."""
+    original: int
+    """The size, in bytes, of the summaries before compression."""
+    stored: int
+    """The size, in bytes, of the summaries as stored."""
+
+    @property
+    def saved(self) -> int:
+        """The number of bytes saved by compressing the summaries."""
+        return self.original - self.stored
+
+    @property
+    def saving(self) -> float:
+        """The proportion of the original size saved by compression."""
+        return self.saved / self.original if self.original else 0.0
+
+
+##############################################################################
+async def get_summary_storage() -> SummaryStorage:
+    """Get details of how much space the summaries of the articles take up.
+
+    Returns:
+        The details of the storage of the summaries.
+    """
+    (storage,) = await LocalArticle._meta.db.execute_query_dict(
+        'SELECT COUNT(*) AS "articles", TOTAL("summary_size") AS "original", '
+        'TOTAL(LENGTH("summary_content")) AS "stored" '
+        f'FROM "{LocalArticle._meta.db_table}"'
+    )
+    return SummaryStorage(
+        articles=int(storage["articles"]),
+        original=int(storage["original"]),
+        stored=int(storage["stored"]),
+    )
+
+
+### compression.py ends here
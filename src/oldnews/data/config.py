@@ -35,7 +35,53 @@ class Configuration:
     """The number of seconds to wait before hitting TheOldReader again on startup."""
 
     article_download_batch_size: int = 50
-    """The batch size to use when downloading articles."""
+    """The batch size to start with when downloading and saving articles.
+
+    Syncs tune the download page size and the save batch size as they go,
+    and remember what they settle on; this is only used until they have.
+    """
+
+    article_page_size_minimum: int = 20
+    """The fewest articles to ask TheOldReader for in a page."""
+
+    article_page_size_maximum: int = 500
+    """The most articles to ask TheOldReader for in a page."""
+
+    article_save_batch_size_minimum: int = 20
+    """The fewest downloaded articles to save to the database in one go."""
+
+    article_save_batch_size_maximum: int = 2_000
+    """The most downloaded articles to save to the database in one go."""
+
+    api_requests_per_second: float = 5.0
+    """The most calls to make to TheOldReader each second; 0 turns off the limit."""
+
+    api_request_burst: int = 10
+    """The most calls to TheOldReader that can be made in a burst before the limit applies."""
+
+    api_retries: int = 4
+    """The most times a failed call to TheOldReader will be retried."""
+
+    background_sync_interval: float = 1_800
+    """The number of seconds between background syncs; 0 turns them off."""
+
+    background_sync_jitter: float = 0.1
+    """The proportion by which to randomly vary the background sync interval."""
+
+    background_sync_maximum_interval: float = 14_400
+    """The longest number of seconds background syncs will back off to."""
+
+    slow_query_threshold: float = 0.1
+    """The number of seconds after which a database statement is logged as slow; 0 turns this off."""
+
+    article_read_ahead: bool = True
+    """Prepare the articles around the one being read, so they show straight away."""
+
+    article_render_limit: int = 200_000
+    """The most characters of an article to render before asking; 0 for no limit."""
+
+    mark_read_after: float = 1.0
+    """The number of seconds an article must be viewed for before it's marked as read; 0 marks it straight away."""
 
     compact_ui: bool = False
     """Use a more compact user interface."""
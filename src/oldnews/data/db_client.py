@@ -0,0 +1,158 @@
+"""Provides the database client used with Tortoise.
+
+This is the standard Tortoise SQLite client, with a little bit of extra
+work so that the application can keep track of how much work it is asking
+of the database, and which of its own functions are asking for it. Any
+statement that takes longer than the configured threshold is written to
+the slow query log, along with its query plan.
+"""
+
+##############################################################################
+# Python imports.
+from collections.abc import Sequence
+from time import perf_counter
+from typing import Any, cast
+
+##############################################################################
+# Tortoise imports.
+from tortoise.backends.base.client import (
+    NestedTransactionContext,
+    TransactionContext,
+)
+from tortoise.backends.sqlite.client import (
+    SqliteClient,
+    SqliteTransactionContext,
+    SqliteTransactionWrapper,
+)
+
+##############################################################################
+# Local imports.
+from .config import load_configuration
+from .log import SlowQueryLog
+from .query_stats import calling_function, record_query, tidy_statement
+from .sync_report import tally
+
+
+##############################################################################
+class _InstrumentedSqliteClient(SqliteClient):
+    """A SQLite client that counts, times and records the statements it executes."""
+
+    async def _explain(self, query: str, values: list[Any] | None) -> list[str]:
+        """Get the query plan for a statement.
+
+        Args:
+            query: The statement to explain.
+            values: The values for the statement.
+
+        Returns:
+            The lines of the query plan.
+        """
+        try:
+            _, plan = await super().execute_query(f"EXPLAIN QUERY PLAN {query}", values)
+        except Exception as error:
+            return [f"Query plan unavailable: {error}"]
+        depth: dict[int, int] = {0: 0}
+        lines: list[str] = []
+        for step in plan:
+            depth[step["id"]] = depth.get(step["parent"], 0) + 1
+            lines.append(f"{'  ' * depth[step['id']]}{step['detail']}")
+        return lines
+
+    async def _record(
+        self,
+        query: str,
+        values: list[Any] | None,
+        rows: int,
+        duration: float,
+        explain: bool = True,
+    ) -> None:
+        """Record the execution of a statement.
+
+        Args:
+            query: The statement that was executed.
+            values: The values for the statement.
+            rows: The number of rows returned or affected.
+            duration: The time, in seconds, the statement took.
+            explain: Can the statement's query plan be explained?
+        """
+        tally(db_statements=1)
+        record_query(function := calling_function(), query, rows, duration)
+        if (threshold := load_configuration().slow_query_threshold) and (
+            duration >= threshold
+        ):
+            SlowQueryLog().info(
+                "\n".join(
+                    [
+                        f"{duration:.4f}s in {function} "
+                        f"({len(values or [])} parameters, {rows} rows)",
+                        f"  {tidy_statement(query)}",
+                        *(await self._explain(query, values) if explain else []),
+                    ]
+                )
+            )
+
+    async def execute_insert(self, query: str, values: list[Any]) -> int:
+        started = perf_counter()
+        result = cast(int, await super().execute_insert(query, values))
+        await self._record(query, values, 1, perf_counter() - started)
+        return result
+
+    async def execute_many(self, query: str, values: list[list[Any]]) -> None:
+        started = perf_counter()
+        await super().execute_many(query, values)
+        await self._record(
+            query, values[0] if values else None, len(values), perf_counter() - started
+        )
+
+    async def execute_query(
+        self, query: str, values: list[Any] | None = None
+    ) -> tuple[int, Sequence[dict[str, Any]]]:
+        started = perf_counter()
+        result = cast(
+            tuple[int, Sequence[dict[str, Any]]],
+            await super().execute_query(query, values),
+        )
+        await self._record(query, values, result[0], perf_counter() - started)
+        return result
+
+    async def execute_query_dict(
+        self, query: str, values: list[Any] | None = None
+    ) -> list[dict[str, Any]]:
+        started = perf_counter()
+        result = cast(
+            list[dict[str, Any]], await super().execute_query_dict(query, values)
+        )
+        await self._record(query, values, len(result), perf_counter() - started)
+        return result
+
+    async def execute_script(self, query: str) -> None:
+        started = perf_counter()
+        await super().execute_script(query)
+        await self._record(query, None, 0, perf_counter() - started, explain=False)
+
+
+##############################################################################
+class _InstrumentedTransactionWrapper(
+    _InstrumentedSqliteClient, SqliteTransactionWrapper
+):
+    """A SQLite transaction wrapper that records the statements it executes."""
+
+    def _in_transaction(self) -> TransactionContext:
+        return NestedTransactionContext(_InstrumentedTransactionWrapper(self))
+
+
+##############################################################################
+class OldNewsSqliteClient(_InstrumentedSqliteClient):
+    """The SQLite client for the application."""
+
+    def _in_transaction(self) -> TransactionContext:
+        return SqliteTransactionContext(
+            _InstrumentedTransactionWrapper(self), self._lock
+        )
+
+
+##############################################################################
+client_class = OldNewsSqliteClient
+"""The client class, as looked for by Tortoise when loading an engine."""
+
+### db_client.py ends here
@@ -5,10 +5,18 @@
 from functools import singledispatch
 from typing import Any
 
+##############################################################################
+# Humanize imports.
+from humanize import intcomma, naturalsize
+
 ##############################################################################
 # OldAS imports.
 from oldas import Article, Folder, Subscription, User
 
+##############################################################################
+# Local imports.
+from .sync_report import SyncReport
+
 ##############################################################################
 type DataDump = tuple[tuple[str, str], ...]
 """Type of a data dump."""
@@ -86,4 +94,32 @@ def _(data: User) -> DataDump:
     )
 
 
+##############################################################################
+@data_dump.register
+def _(data: SyncReport) -> DataDump:
+    return (
+        ("Sync Started", data.started.astimezone().strftime("%Y-%m-%d %H:%M:%S")),
+        ("Sync Time", f"{data.wall_time:.2f}s"),
+        ("Sync Completed", "Yes" if data.completed else "No"),
+        *(
+            (
+                phase.name.capitalize(),
+                f"{phase.wall_time:.2f}s, "
+                f"{intcomma(phase.items)} items, "
+                + (
+                    f"{intcomma(phase.written)} written, "
+                    f"{intcomma(phase.skipped)} skipped, "
+                    if phase.written or phase.skipped
+                    else ""
+                )
+                + f"{naturalsize(phase.bytes_received)}, "
+                + (f"{intcomma(phase.retries)} retries, " if phase.retries else "")
+                + f"{intcomma(phase.db_statements)} statements, "
+                f"{phase.items_per_second:,.1f} items/s",
+            )
+            for phase in data.phases.values()
+        ),
+    )
+
+
 ### dump.py ends here
@@ -0,0 +1,398 @@
+"""Provides hand-written SQL for the busiest reads of the local data.
+
+Building Tortoise model instances, and the object graphs that come with
+prefetching their relations, costs more than the SQL does when there are
+lots of rows; so the queries here go straight to the connection and build
+`oldas` objects from the rows themselves.
+
+These are the reads the UI makes while a sync may be writing, so they're
+made with the read-only connections in `readers`.
+
+Note:
+    Sets of IDs are passed to SQLite as a single JSON array, and unpacked
+    with `json_each`, so that there's no limit on how many can be used.
+"""
+
+##############################################################################
+# Python imports.
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime
+from html import unescape
+from json import dumps
+from sys import intern
+from typing import Any, cast
+
+##############################################################################
+# OldAS imports.
+from oldas import Article, Articles, Folder, Folders, State, Subscription, Subscriptions
+from oldas.articles import Alternate, Alternates, Direction, Origin
+
+##############################################################################
+# Tortoise imports.
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+##############################################################################
+# Local imports.
+from .article_headers import ArticleHeader, ArticleHeaders
+from .compression import CompressedSummary
+from .models import LocalArticle, LocalArticleAlternate, LocalArticleCategory
+from .readers import reading
+
+
+##############################################################################
+async def _query(
+    connection: BaseDBAsyncClient, sql: str, *values: Any
+) -> list[dict[str, Any]]:
+    """Run a query against the local database.
+
+    Args:
+        connection: The connection to run the query with.
+        sql: The SQL of the query.
+        values: The values for the query.
+
+    Returns:
+        The rows that the query returned.
+    """
+    _, rows = await connection.execute_query(sql, list(values))
+    return cast(list[dict[str, Any]], rows)
+
+
+##############################################################################
+def _is_unread(article_id: str) -> str:
+    """Get the SQL that tests if an article is unread.
+
+    Args:
+        article_id: The SQL for the ID of the article to test.
+
+    Returns:
+        The SQL for the test; it takes the read category as a value.
+    """
+    return f"""NOT EXISTS (
+        SELECT 1 FROM "{LocalArticleCategory._meta.db_table}" AS "read"
+        WHERE "read"."article_id" = {article_id} AND "read"."category" = ?
+    )"""
+
+
+##############################################################################
+async def read_article_ids() -> set[str]:
+    """Get the IDs of all the local articles that have been read.
+
+    Returns:
+        The IDs of the articles that have been read.
+    """
+    async with reading() as connection:
+        rows = await _query(
+            connection,
+            f'SELECT "article_id" FROM "{LocalArticleCategory._meta.db_table}" '
+            'WHERE "category" = ?',
+            str(State.READ),
+        )
+    return {row["article_id"] for row in rows}
+
+
+##############################################################################
+async def unread_article_ids() -> list[str]:
+    """Get the IDs of all the local articles that haven't been read.
+
+    Returns:
+        The IDs of the articles that haven't been read.
+    """
+    async with reading() as connection:
+        rows = await _query(
+            connection,
+            f'SELECT "article"."article_id" FROM "{LocalArticle._meta.db_table}" '
+            f'AS "article" WHERE {_is_unread('"article"."article_id"')}',
+            str(State.READ),
+        )
+    return [row["article_id"] for row in rows]
+
+
+##############################################################################
+async def known_article_ids(article_ids: Iterable[str]) -> set[str]:
+    """Filter a collection of article IDs down to those that are known locally.
+
+    Args:
+        article_ids: The article IDs to filter.
+
+    Returns:
+        The IDs of the articles that are known locally.
+    """
+    async with reading() as connection:
+        rows = await _query(
+            connection,
+            f'SELECT "article_id" FROM "{LocalArticle._meta.db_table}" '
+            'WHERE "article_id" IN (SELECT "value" FROM json_each(?))',
+            dumps(list(set(article_ids))),
+        )
+    return {row["article_id"] for row in rows}
+
+
+##############################################################################
+async def _categories_of(
+    connection: BaseDBAsyncClient, article_ids: str
+) -> dict[str, list[str]]:
+    """Get the categories of some articles.
+
+    Args:
+        connection: The connection to read with.
+        article_ids: The IDs of the articles, as a JSON array.
+
+    Returns:
+        The categories of the articles, keyed by article ID.
+    """
+    categories: defaultdict[str, list[str]] = defaultdict(list)
+    for row in await _query(
+        connection,
+        f'SELECT "article_id", "category" FROM "{LocalArticleCategory._meta.db_table}" '
+        'WHERE "article_id" IN (SELECT "value" FROM json_each(?)) ORDER BY "id"',
+        article_ids,
+    ):
+        categories[row["article_id"]].append(row["category"])
+    return categories
+
+
+##############################################################################
+async def _alternates_of(
+    connection: BaseDBAsyncClient, article_ids: str
+) -> dict[str, list[Alternate]]:
+    """Get the alternates of some articles.
+
+    Args:
+        connection: The connection to read with.
+        article_ids: The IDs of the articles, as a JSON array.
+
+    Returns:
+        The alternates of the articles, keyed by article ID.
+    """
+    alternates: defaultdict[str, list[Alternate]] = defaultdict(list)
+    for row in await _query(
+        connection,
+        f'SELECT "article_id", "href", "mime_type" '
+        f'FROM "{LocalArticleAlternate._meta.db_table}" '
+        'WHERE "article_id" IN (SELECT "value" FROM json_each(?)) ORDER BY "id"',
+        article_ids,
+    ):
+        alternates[row["article_id"]].append(
+            Alternate(href=row["href"], mime_type=row["mime_type"])
+        )
+    return alternates
+
+
+##############################################################################
+def _filters_for(
+    related_to: Folder | Subscription,
+    unread_only: bool,
+    only: Iterable[str] | None = None,
+) -> tuple[list[str], list[Any]]:
+    """Get the filters that select the local articles for a folder or subscription.
+
+    Args:
+        related_to: The folder or subscription to get the articles for.
+        unread_only: Only get the articles that haven't been read?
+        only: Optional IDs of the only articles to consider.
+
+    Returns:
+        The SQL of the filters, and the values they take.
+    """
+    filters: list[str] = []
+    values: list[Any] = []
+    if isinstance(related_to, Folder):
+        filters.append(
+            f'"article"."article_id" IN (SELECT "article_id" FROM '
+            f'"{LocalArticleCategory._meta.db_table}" WHERE "category" = ?)'
+        )
+    else:
+        filters.append('"article"."origin_stream_id" = ?')
+    values.append(related_to.id)
+    if unread_only:
+        filters.append(_is_unread('"article"."article_id"'))
+        values.append(str(State.READ))
+    if only is not None:
+        filters.append('"article"."article_id" IN (SELECT "value" FROM json_each(?))')
+        values.append(dumps(list(set(only))))
+    return filters, values
+
+
+##############################################################################
+async def _articles_where(filters: list[str], values: list[Any]) -> Articles:
+    """Get the local articles that match some filters.
+
+    Args:
+        filters: The SQL of the filters.
+        values: The values for the filters.
+
+    Returns:
+        The articles, newest first.
+    """
+    async with reading() as connection:
+        rows = await _query(
+            connection,
+            f"""
+            SELECT "article"."article_id", "article"."title", "article"."published",
+                "article"."updated", "article"."author", "article"."summary_direction",
+                "article"."summary_content", "article"."origin_stream_id",
+                "article"."origin_title", "article"."origin_html_url"
+            FROM "{LocalArticle._meta.db_table}" AS "article"
+            WHERE {" AND ".join(filters)}
+            ORDER BY "article"."published" DESC
+            """,
+            *values,
+        )
+        article_ids = dumps([row["article_id"] for row in rows])
+        categories = await _categories_of(connection, article_ids)
+        alternates = await _alternates_of(connection, article_ids)
+    return Articles(
+        Article(
+            id=row["article_id"],
+            title=unescape(row["title"]),
+            published=datetime.fromisoformat(row["published"]),
+            updated=datetime.fromisoformat(row["updated"]),
+            author=row["author"],
+            categories=Article.clean_categories(categories[row["article_id"]]),
+            alternate=Alternates(alternates[row["article_id"]]),
+            origin=Origin(
+                stream_id=row["origin_stream_id"],
+                title=unescape(row["origin_title"]),
+                html_url=row["origin_html_url"],
+            ),
+            summary=CompressedSummary(
+                direction=cast(Direction, row["summary_direction"]),
+                stored=row["summary_content"],
+            ),
+        )
+        for row in rows
+    )
+
+
+##############################################################################
+async def articles_in(
+    related_to: Folder | Subscription,
+    unread_only: bool,
+    only: Iterable[str] | None = None,
+) -> Articles:
+    """Get the local articles for a folder or subscription.
+
+    Args:
+        related_to: The folder or subscription to get the articles for.
+        unread_only: Only get the articles that haven't been read?
+        only: Optional IDs of the only articles to consider.
+
+    Returns:
+        The articles, newest first.
+    """
+    return await _articles_where(*_filters_for(related_to, unread_only, only))
+
+
+##############################################################################
+async def articles_with_ids(article_ids: Iterable[str]) -> Articles:
+    """Get the local articles with the given IDs.
+
+    Args:
+        article_ids: The IDs of the articles to get.
+
+    Returns:
+        The articles, newest first; any IDs that aren't known locally are
+        left out.
+    """
+    return await _articles_where(
+        ['"article"."article_id" IN (SELECT "value" FROM json_each(?))'],
+        [dumps(list(set(article_ids)))],
+    )
+
+
+##############################################################################
+async def article_headers_in(
+    related_to: Folder | Subscription,
+    unread_only: bool,
+    only: Iterable[str] | None = None,
+) -> ArticleHeaders:
+    """Get the headers of the local articles for a folder or subscription.
+
+    Args:
+        related_to: The folder or subscription to get the article headers for.
+        unread_only: Only get the articles that haven't been read?
+        only: Optional IDs of the only articles to consider.
+
+    Returns:
+        The article headers, newest first.
+
+    Note:
+        Only the columns needed for the headers are read; the summaries,
+        categories and alternates of the articles are left in the database.
+        The titles of subscriptions, and the names of authors, are interned
+        as they're repeated across many articles.
+    """
+    filters, values = _filters_for(related_to, unread_only, only)
+    async with reading() as connection:
+        rows = await _query(
+            connection,
+            f"""
+            SELECT "article"."article_id", "article"."title", "article"."published",
+                "article"."author", "article"."origin_title",
+                {_is_unread('"article"."article_id"')} AS "unread"
+            FROM "{LocalArticle._meta.db_table}" AS "article"
+            WHERE {" AND ".join(filters)}
+            ORDER BY "article"."published" DESC
+            """,
+            str(State.READ),
+            *values,
+        )
+    return tuple(
+        ArticleHeader(
+            id=row["article_id"],
+            title=unescape(row["title"]),
+            published=datetime.fromisoformat(row["published"]),
+            author=intern(row["author"]),
+            origin_title=intern(unescape(row["origin_title"])),
+            is_unread=bool(row["unread"]),
+        )
+        for row in rows
+    )
+
+
+##############################################################################
+async def unread_counts(
+    folders: Folders, subscriptions: Subscriptions
+) -> dict[str, int]:
+    """Get the counts of unread articles for folders and subscriptions.
+
+    Args:
+        folders: The folders to get the counts for.
+        subscriptions: The subscriptions to get the counts for.
+
+    Returns:
+        The unread counts, keyed by the ID of the folder or subscription.
+    """
+    counts = {category.id: 0 for category in [*folders, *subscriptions]}
+    async with reading() as connection:
+        for row in await _query(
+            connection,
+            f"""
+            SELECT "category"."category" AS "id", COUNT(*) AS "unread"
+            FROM "{LocalArticleCategory._meta.db_table}" AS "category"
+            WHERE "category"."category" IN (SELECT "value" FROM json_each(?))
+            AND {_is_unread('"category"."article_id"')}
+            GROUP BY "category"."category"
+            """,
+            dumps([folder.id for folder in folders]),
+            str(State.READ),
+        ):
+            counts[row["id"]] = row["unread"]
+        for row in await _query(
+            connection,
+            f"""
+            SELECT "article"."origin_stream_id" AS "id", COUNT(*) AS "unread"
+            FROM "{LocalArticle._meta.db_table}" AS "article"
+            WHERE "article"."origin_stream_id" IN (SELECT "value" FROM json_each(?))
+            AND {_is_unread('"article"."article_id"')}
+            GROUP BY "article"."origin_stream_id"
+            """,
+            dumps([subscription.id for subscription in subscriptions]),
+            str(State.READ),
+        ):
+            counts[row["id"]] = row["unread"]
+    return counts
+
+
+### fast_reads.py ends here
@@ -2,67 +2,255 @@
 
 ##############################################################################
 # Python imports.
+from asyncio import sleep
+from collections import defaultdict
 from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from html import unescape
-from typing import cast
+from hashlib import blake2b
 
 ##############################################################################
 # OldAS imports.
 from oldas import Article, Articles, Folder, Folders, State, Subscription
-from oldas.articles import Alternate, Alternates, Direction, Origin, Summary
 
 ##############################################################################
 # Tortoise imports.
+from tortoise.expressions import Subquery
 from tortoise.transactions import in_transaction
 
 ##############################################################################
 # Local imports.
+from .article_headers import ArticleHeaders
+from .compression import compress_summary
+from .fast_reads import (
+    article_headers_in,
+    articles_in,
+    articles_with_ids,
+    known_article_ids,
+    read_article_ids,
+    unread_article_ids,
+)
 from .log import Log
 from .models import LocalArticle, LocalArticleAlternate, LocalArticleCategory
 
+##############################################################################
+_YIELD_EVERY = 10
+"""How many articles to prepare for saving before letting other tasks run."""
+
+
+##############################################################################
+@dataclass
+class SavedArticles:
+    """Counts of what happened when saving a batch of articles."""
+
+    added: int = 0
+    """The number of articles that were new."""
+    updated: int = 0
+    """The number of articles whose content had changed."""
+    recategorised: int = 0
+    """The number of articles whose content was the same but whose
+    categories or alternates had changed."""
+    skipped: int = 0
+    """The number of articles that hadn't changed at all."""
+    added_ids: set[str] = field(default_factory=set, repr=False)
+    """The IDs of the articles that were new."""
+    updated_ids: set[str] = field(default_factory=set, repr=False)
+    """The IDs of the articles that were updated or recategorised."""
+
+    @property
+    def written(self) -> int:
+        """The number of articles that needed writing to the database."""
+        return self.added + self.updated + self.recategorised
+
+
+##############################################################################
+def _content_hash(article: Article) -> str:
+    """Calculate a hash of the content of an article.
+
+    Args:
+        article: The article to hash.
+
+    Returns:
+        The hash of the content of the article.
+
+    Note:
+        The categories and alternates aren't part of the hash; they're
+        compared separately.
+    """
+    return blake2b(
+        "\0".join(
+            (
+                article.title,
+                article.published.isoformat(),
+                article.updated.isoformat(),
+                article.author,
+                article.summary.direction,
+                article.summary.content,
+                article.origin.stream_id or "",
+                article.origin.title,
+                article.origin.html_url,
+            )
+        ).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+
+
+##############################################################################
+def _local_article(article: Article, content_hash: str) -> LocalArticle:
+    """Make a local article from an article.
+
+    Args:
+        article: The article to make the local article from.
+        content_hash: The hash of the content of the article.
+
+    Returns:
+        The local article.
+    """
+    return LocalArticle(
+        article_id=article.id,
+        title=article.title,
+        published=article.published,
+        updated=article.updated,
+        author=article.author,
+        summary_direction=article.summary.direction,
+        summary_content=compress_summary(article.summary.content),
+        summary_size=len(article.summary.content.encode("utf-8")),
+        origin_stream_id=article.origin.stream_id,
+        origin_title=article.origin.title,
+        origin_html_url=article.origin.html_url,
+        content_hash=content_hash,
+    )
+
 
 ##############################################################################
-async def save_local_articles(articles: Articles) -> Articles:
+async def save_local_articles(articles: Articles) -> SavedArticles:
     """Locally save the given articles.
 
     Args:
         articles: The articles to save.
 
     Returns:
-        The articles.
+        Counts of what happened to the articles.
+
+    Note:
+        Articles that are already saved and haven't changed are left alone;
+        for those that have changed only what has changed is written.
     """
-    for article in articles:
-        async with in_transaction():
-            local_article, _ = await LocalArticle.update_or_create(
-                article_id=article.id,
-                defaults={
-                    "title": article.title,
-                    "published": article.published,
-                    "updated": article.updated,
-                    "author": article.author,
-                    "summary_direction": article.summary.direction,
-                    "summary_content": article.summary.content,
-                    "origin_stream_id": article.origin.stream_id,
-                    "origin_title": article.origin.title,
-                    "origin_html_url": article.origin.html_url,
+    saved = SavedArticles()
+    if not (batch := {article.id: article for article in articles}):
+        return saved
+
+    # Preparing a big batch is a lot of work, so it's done before looking at
+    # what's already saved, letting readers get a look in as it goes.
+    prepared: list[tuple[Article, str, set[str], set[tuple[str, str]]]] = []
+    for position, article in enumerate(batch.values()):
+        if position and not position % _YIELD_EVERY:
+            await sleep(0)
+        prepared.append(
+            (
+                article,
+                _content_hash(article),
+                {str(category) for category in article.categories},
+                {
+                    (alternate.href, alternate.mime_type)
+                    for alternate in article.alternate
                 },
             )
-            await LocalArticleCategory.filter(article=local_article).delete()
-            await LocalArticleCategory.bulk_create(
-                LocalArticleCategory(article=local_article, category=str(category))
-                for category in article.categories
+        )
+
+    # What's already saved is looked at in the same transaction as the
+    # writes, so nothing can change it in between.
+    async with in_transaction():
+        known_hashes = dict(
+            await LocalArticle.filter(article_id__in=batch).values_list(
+                "article_id", "content_hash"
             )
-            await LocalArticleAlternate.filter(article=local_article).delete()
-            await LocalArticleAlternate.bulk_create(
+        )
+        known_categories: dict[str, dict[str, int]] = defaultdict(dict)
+        for category_id, article_id, category in await LocalArticleCategory.filter(
+            article_id__in=batch
+        ).values_list("id", "article_id", "category"):
+            known_categories[article_id][category] = category_id
+        known_alternates: dict[str, dict[tuple[str, str], int]] = defaultdict(dict)
+        for (
+            alternate_id,
+            article_id,
+            href,
+            mime_type,
+        ) in await LocalArticleAlternate.filter(article_id__in=batch).values_list(
+            "id", "article_id", "href", "mime_type"
+        ):
+            known_alternates[article_id][(href, mime_type)] = alternate_id
+
+        new_articles: list[LocalArticle] = []
+        changed_articles: list[LocalArticle] = []
+        new_categories: list[LocalArticleCategory] = []
+        old_categories: list[int] = []
+        new_alternates: list[LocalArticleAlternate] = []
+        old_alternates: list[int] = []
+        for article, content_hash, categories, alternates in prepared:
+            article_id = article.id
+            had_categories = known_categories.get(article_id, {})
+            new_categories.extend(
+                LocalArticleCategory(article_id=article_id, category=category)
+                for category in categories - had_categories.keys()
+            )
+            old_categories.extend(
+                category_id
+                for category, category_id in had_categories.items()
+                if category not in categories
+            )
+
+            had_alternates = known_alternates.get(article_id, {})
+            new_alternates.extend(
                 LocalArticleAlternate(
-                    article=local_article,
-                    href=alternate.href,
-                    mime_type=alternate.mime_type,
+                    article_id=article_id, href=href, mime_type=mime_type
                 )
-                for alternate in article.alternate
+                for href, mime_type in alternates - had_alternates.keys()
+            )
+            old_alternates.extend(
+                alternate_id
+                for alternate, alternate_id in had_alternates.items()
+                if alternate not in alternates
             )
-    return articles
+
+            if article_id not in known_hashes:
+                new_articles.append(_local_article(article, content_hash))
+                saved.added += 1
+                saved.added_ids.add(article_id)
+            elif known_hashes[article_id] != content_hash:
+                changed_articles.append(_local_article(article, content_hash))
+                saved.updated += 1
+                saved.updated_ids.add(article_id)
+            elif (
+                categories != had_categories.keys()
+                or alternates != had_alternates.keys()
+            ):
+                saved.recategorised += 1
+                saved.updated_ids.add(article_id)
+            else:
+                saved.skipped += 1
+
+        if new_articles:
+            await LocalArticle.bulk_create(new_articles)
+        if changed_articles:
+            await LocalArticle.bulk_update(
+                changed_articles,
+                fields=[
+                    field
+                    for field in LocalArticle._meta.db_fields
+                    if field != "article_id"
+                ],
+            )
+        if old_categories:
+            await LocalArticleCategory.filter(id__in=old_categories).delete()
+        if new_categories:
+            await LocalArticleCategory.bulk_create(new_categories)
+        if old_alternates:
+            await LocalArticleAlternate.filter(id__in=old_alternates).delete()
+        if new_alternates:
+            await LocalArticleAlternate.bulk_create(new_alternates)
+    return saved
 
 
 ##############################################################################
@@ -72,65 +260,70 @@ async def get_local_read_article_ids() -> set[str]:
     Returns:
         A `set` of IDs of articles that have been read.
     """
-    return {
-        category.article.article_id
-        for category in await LocalArticleCategory.filter(
-            category=str(State.READ)
-        ).prefetch_related("article")
-    }
+    return await read_article_ids()
 
 
 ##############################################################################
 async def get_local_articles(
-    related_to: Folder | Subscription, unread_only: bool
+    related_to: Folder | Subscription,
+    unread_only: bool,
+    only: Iterable[str] | None = None,
 ) -> Articles:
     """Get all available unread articles.
 
     Args:
         related_to: The folder or feed the articles should relate to.
         unread_only: Only load up the unread articles?
+        only: Optional IDs of the only articles to consider.
 
     Returns: The unread articles.
     """
-    local_articles = (
-        LocalArticle.filter(categories__category=related_to.id)
-        if isinstance(related_to, Folder)
-        else LocalArticle.filter(origin_stream_id=related_to.id)
-    )
-    if unread_only and (read := (await get_local_read_article_ids())):
-        local_articles = local_articles.filter(article_id__not_in=read)
-
-    articles: list[Article] = []
-    for article in await local_articles.prefetch_related(
-        "categories", "alternates"
-    ).order_by("-published"):
-        articles.append(
-            Article(
-                id=article.article_id,
-                title=unescape(article.title),
-                published=article.published,
-                updated=article.updated,
-                author=article.author,
-                categories=Article.clean_categories(
-                    category.category
-                    for category in article.categories  # type: ignore
-                ),
-                alternate=Alternates(
-                    Alternate(href=alternate.href, mime_type=alternate.mime_type)
-                    for alternate in article.alternates  # type: ignore
-                ),
-                origin=Origin(
-                    stream_id=article.origin_stream_id,
-                    title=unescape(article.origin_title),
-                    html_url=article.origin_html_url,
-                ),
-                summary=Summary(
-                    direction=cast(Direction, article.summary_direction),
-                    content=article.summary_content,
-                ),
-            )
-        )
-    return Articles(articles)
+    return await articles_in(related_to, unread_only, only)
+
+
+##############################################################################
+async def get_local_article_headers(
+    related_to: Folder | Subscription,
+    unread_only: bool,
+    only: Iterable[str] | None = None,
+) -> ArticleHeaders:
+    """Get the headers of the available articles, for listing them.
+
+    Args:
+        related_to: The folder or feed the articles should relate to.
+        unread_only: Only load up the unread articles?
+        only: Optional IDs of the only articles to consider.
+
+    Returns:
+        The article headers, newest first.
+    """
+    return await article_headers_in(related_to, unread_only, only)
+
+
+##############################################################################
+async def get_local_articles_by_id(articles: Iterable[str]) -> Articles:
+    """Get the full local articles with the given IDs.
+
+    Args:
+        articles: The IDs of the articles to get.
+
+    Returns:
+        The articles, newest first.
+    """
+    return await articles_with_ids(articles)
+
+
+##############################################################################
+async def get_local_article(article: str) -> Article | None:
+    """Get the full local article with the given ID.
+
+    Args:
+        article: The ID of the article to get.
+
+    Returns:
+        The article, or `None` if it isn't known locally.
+    """
+    return next(iter(await articles_with_ids([article])), None)
 
 
 ##############################################################################
@@ -165,10 +358,7 @@ async def locally_known_article_ids(articles: Iterable[str]) -> set[str]:
     Returns:
         A set of the article IDs that are known locally.
     """
-    return {
-        article.article_id
-        for article in await LocalArticle.filter(article_id__in=set(articles))
-    }
+    return await known_article_ids(articles)
 
 
 ##############################################################################
@@ -179,7 +369,7 @@ async def locally_mark_article_ids_read(articles: Iterable[str]) -> None:
         articles: The article IDs to mark as read.
     """
     if article_ids := set(articles):
-        Log().debug(f"Number of articles to mark as read: {len(article_ids)}")
+        Log().debug("Number of articles to mark as read: %s", len(article_ids))
         await LocalArticleCategory.bulk_create(
             [
                 LocalArticleCategory(article=article, category=str(State.READ))
@@ -197,35 +387,12 @@ async def locally_mark_article_ids_unread(articles: Iterable[str]) -> None:
         articles: The article IDs to mark as unread.
     """
     if article_ids := set(articles):
-        Log().debug(f"Number of articles to mark as unread: {len(article_ids)}")
+        Log().debug("Number of articles to mark as unread: %s", len(article_ids))
         await LocalArticleCategory.filter(
             category=str(State.READ), article_id__in=article_ids
         ).delete()
 
 
-##############################################################################
-async def unread_count_in(
-    category: Folder | Subscription, read: set[str] | None = None
-) -> int:
-    """Get the count of unread articles in a given category.
-
-    Args:
-        category: The category (Folder or Subscription) to get the unread count for.
-        read: The set of IDs of read articles.
-
-    Returns:
-        The count of unread articles in that category.
-    """
-    query = (
-        LocalArticle.filter(categories__category=category.id)
-        if isinstance(category, Folder)
-        else LocalArticle.filter(origin_stream_id=category.id)
-    )
-    if read := read if read is not None else await get_local_read_article_ids():
-        query = query.filter(article_id__not_in=read)
-    return await query.count()
-
-
 ##############################################################################
 async def get_unread_article_ids() -> list[str]:
     """Get a list of all the unread article IDs.
@@ -233,11 +400,7 @@ async def get_unread_article_ids() -> list[str]:
     Returns:
         The list of IDs of unread articles.
     """
-    read = await get_local_read_article_ids()
-    return [
-        article.article_id
-        for article in await LocalArticle.filter(article_id__not_in=read)
-    ]
+    return await unread_article_ids()
 
 
 ##############################################################################
@@ -252,11 +415,11 @@ async def clean_old_read_articles(cutoff: timedelta) -> int:
     """
     read = await get_local_read_article_ids()
     retire_time = datetime.now(UTC) - cutoff
-    Log().debug(f"Cleaning up read articles published before {retire_time}")
+    Log().debug("Cleaning up read articles published before %s", retire_time)
     cleaned = await LocalArticle.filter(
         published__lt=retire_time, article_id__in=read
     ).delete()
-    Log().debug(f"Cleaned: {cleaned}")
+    Log().debug("Cleaned: %s", cleaned)
     return cleaned
 
 
@@ -270,7 +433,9 @@ async def rename_folder_for_articles(rename_from: str | Folder, rename_to: str)
     """
     rename_from = Folders.full_id(rename_from)
     rename_to = Folders.full_id(rename_to)
-    Log().debug(f"Renaming folder for local articles from {rename_from} to {rename_to}")
+    Log().debug(
+        "Renaming folder for local articles from %s to %s", rename_from, rename_to
+    )
     await LocalArticleCategory.filter(category=rename_from).update(category=rename_to)
 
 
@@ -282,7 +447,7 @@ async def remove_folder_from_articles(folder: str | Folder) -> None:
         folder: The folder to remove from all articles.
     """
     folder = Folders.full_id(folder)
-    Log().debug(f"Removing folder {folder} from all local articles")
+    Log().debug("Removing folder %s from all local articles", folder)
     await LocalArticleCategory.filter(category=folder).delete()
 
 
@@ -304,29 +469,58 @@ async def move_subscription_articles(
     )
     to_folder = Folders.full_id(to_folder) if to_folder is not None else to_folder
     Log().debug(
-        f"Moving all articles of {subscription.title} ({subscription.id}) from folder {from_folder} to {to_folder}"
+        "Moving all articles of %s (%s) from folder %s to %s",
+        subscription.title,
+        subscription.id,
+        from_folder,
+        to_folder,
     )
-    for article in await LocalArticle.filter(
-        origin_stream_id=subscription.id
-    ).prefetch_related("categories"):
+    async with in_transaction() as connection:
         if from_folder:
-            await article.remove_category(from_folder)
+            await LocalArticleCategory.filter(
+                category=from_folder,
+                article_id__in=Subquery(
+                    LocalArticle.filter(origin_stream_id=subscription.id).values(
+                        "article_id"
+                    )
+                ),
+            ).delete()
         if to_folder:
-            await article.add_category(to_folder)
+            # Tortoise has no way of expressing an INSERT ... SELECT, so
+            # this one has to be done by hand.
+            await connection.execute_query(
+                f"""
+                INSERT INTO "{LocalArticleCategory._meta.db_table}" ("article_id", "category")
+                SELECT article."article_id", ?
+                FROM "{LocalArticle._meta.db_table}" AS article
+                WHERE article."origin_stream_id" = ? AND NOT EXISTS (
+                    SELECT 1 FROM "{LocalArticleCategory._meta.db_table}" AS existing
+                    WHERE existing."article_id" = article."article_id"
+                    AND existing."category" = ?
+                )
+                """,
+                [to_folder, subscription.id, to_folder],
+            )
 
 
 ##############################################################################
-async def remove_subscription_articles(subscription: str | Subscription) -> None:
+async def remove_subscription_articles(subscription: str | Subscription) -> set[str]:
     """Remove all the articles associated with the given subscription.
 
     Args:
         subscription: The subscription to remove the articles for.
+
+    Returns:
+        The IDs of the articles that were removed.
     """
     if isinstance(subscription, Subscription):
         subscription = subscription.id
-    Log().debug(f"Removing all local articles for subscription {subscription}")
-    deleted = await LocalArticle.filter(origin_stream_id=subscription).delete()
-    Log().debug(f"Articles removed that belonged to {subscription}: {deleted}")
+    Log().debug("Removing all local articles for subscription %s", subscription)
+    articles = LocalArticle.filter(origin_stream_id=subscription)
+    removed = {article_id for (article_id,) in await articles.values_list("article_id")}
+    deleted = await articles.delete()
+    Log().debug("Articles removed that belonged to %s: %s", subscription, deleted)
+    return removed
 
 
 ### local_articles.py ends here
@@ -12,6 +12,9 @@ from tortoise import Tortoise
 # Local imports.
 from .locations import data_dir
 from .log import Log
+from .migrations import MigrationProgress, log_progress, migrate
+from .query_stats import save_query_stats
+from .readers import close_readers, open_readers
 
 
 ##############################################################################
@@ -25,20 +28,43 @@ def local_db_file() -> Path:
 
 
 ##############################################################################
-async def initialise_local_data() -> None:
-    """Initialise the local storage."""
+async def initialise_local_data(progress: MigrationProgress = log_progress) -> None:
+    """Initialise the local storage.
+
+    Args:
+        progress: The function to report the progress of any migrations to.
+    """
     Log().debug("Database startup")
     await Tortoise.init(
-        db_url=f"sqlite://{local_db_file()}",
-        modules={"models": ["oldnews.data.models"]},
+        config={
+            "connections": {
+                "default": {
+                    "engine": "oldnews.data.db_client",
+                    "credentials": {
+                        "file_path": str(local_db_file()),
+                        # Lets the readers read while a sync writes.
+                        "journal_mode": "WAL",
+                    },
+                }
+            },
+            "apps": {
+                "models": {
+                    "models": ["oldnews.data.models"],
+                    "default_connection": "default",
+                }
+            },
+        }
     )
-    await Tortoise.generate_schemas()
+    await migrate(progress)
+    open_readers(local_db_file())
 
 
 ##############################################################################
 async def shutdown_local_data() -> None:
-    """Close down the local connection."""
+    """Close down the local connections."""
+    await close_readers()
     await Tortoise.close_connections()
+    save_query_stats()
     Log().debug("Database shutdown")
 
 
@@ -10,6 +10,7 @@ from tortoise.transactions import in_transaction
 
 ##############################################################################
 # Local imports.
+from .change_set import ChangeSet
 from .models import LocalFolder
 
 
@@ -27,22 +28,45 @@ async def get_local_folders() -> Folders:
 
 
 ##############################################################################
-async def save_local_folders(folders: Folders) -> Folders:
+async def save_local_folders(folders: Folders) -> ChangeSet:
     """Save the local copy of the known folders.
 
     Args:
         folders: The known folders.
 
     Returns:
-        The folders.
+        The changes made to the local copy of the folders.
+
+    Note:
+        Only the folders that have been added, removed or changed are
+        written; a folder's ID is its name, so a renamed folder is seen as
+        one folder being removed and another added.
     """
-    async with in_transaction():
-        await LocalFolder.all().delete()
-        await LocalFolder.bulk_create(
-            LocalFolder(folder_id=folder.id, sort_id=folder.sort_id)
-            for folder in folders
-        )
-    return folders
+    known = {folder.id: folder for folder in await get_local_folders()}
+    wanted = {folder.id: folder for folder in folders}
+    changes = ChangeSet(
+        added=frozenset(wanted.keys() - known.keys()),
+        removed=frozenset(known.keys() - wanted.keys()),
+        changed=frozenset(
+            folder
+            for folder in wanted.keys() & known.keys()
+            if wanted[folder] != known[folder]
+        ),
+    )
+    if changes:
+        async with in_transaction():
+            if changes.removed:
+                await LocalFolder.filter(folder_id__in=changes.removed).delete()
+            if changes.added:
+                await LocalFolder.bulk_create(
+                    LocalFolder(folder_id=folder, sort_id=wanted[folder].sort_id)
+                    for folder in changes.added
+                )
+            for folder in changes.changed:
+                await LocalFolder.filter(folder_id=folder).update(
+                    sort_id=wanted[folder].sort_id
+                )
+    return changes
 
 
 ### local_folders.py ends here
@@ -11,6 +11,7 @@ from tortoise.transactions import in_transaction
 
 ##############################################################################
 # Local imports.
+from .change_set import ChangeSet
 from .models import (
     LocalSubscription,
     LocalSubscriptionCategory,
@@ -46,38 +47,99 @@ async def get_local_subscriptions() -> Subscriptions:
 
 
 ##############################################################################
-async def save_local_subscriptions(subscriptions: Subscriptions) -> Subscriptions:
+def _details(subscription: Subscription) -> tuple[object, ...]:
+    """Get the details of a subscription, for spotting changes.
+
+    Args:
+        subscription: The subscription to get the details of.
+
+    Returns:
+        The details of the subscription.
+
+    Note:
+        This is needed because the categories of a subscription don't
+        compare by value; nor is their order something that can be relied
+        on, so they're compared as a set.
+    """
+    return (
+        subscription.title,
+        subscription.sort_id,
+        subscription.first_item_time,
+        subscription.url,
+        subscription.html_url,
+        frozenset(subscription.categories),
+    )
+
+
+##############################################################################
+async def save_local_subscriptions(subscriptions: Subscriptions) -> ChangeSet:
     """Local save the given subscriptions.
 
     Args:
         subscriptions: The subscriptions to save.
 
     Returns:
-        The subscriptions.
+        The changes made to the local copy of the subscriptions.
+
+    Note:
+        Only the subscriptions that have been added, removed or changed are
+        written.
     """
-    async with in_transaction():
-        await LocalSubscription.all().delete()
-        await LocalSubscription.bulk_create(
-            LocalSubscription(
-                subscription_id=subscription.id,
-                title=subscription.title,
-                sort_id=subscription.sort_id,
-                first_item_time=subscription.first_item_time,
-                url=subscription.url,
-                html_url=subscription.html_url,
+    known = {
+        subscription.id: subscription
+        for subscription in await get_local_subscriptions()
+    }
+    wanted = {subscription.id: subscription for subscription in subscriptions}
+    changed = {
+        subscription
+        for subscription in wanted.keys() & known.keys()
+        if _details(wanted[subscription]) != _details(known[subscription])
+    }
+    changes = ChangeSet(
+        added=frozenset(wanted.keys() - known.keys()),
+        removed=frozenset(known.keys() - wanted.keys()),
+        renamed=frozenset(
+            subscription
+            for subscription in changed
+            if wanted[subscription].title != known[subscription].title
+        ),
+        moved=frozenset(
+            subscription
+            for subscription in changed
+            if {category.id for category in wanted[subscription].categories}
+            != {category.id for category in known[subscription].categories}
+        ),
+        changed=frozenset(changed),
+    )
+    if changes:
+        async with in_transaction():
+            if changes.removed or changes.changed:
+                # Removing a subscription also removes its categories, so
+                # changed subscriptions get their categories written afresh.
+                await LocalSubscription.filter(
+                    subscription_id__in=changes.removed | changes.changed
+                ).delete()
+            await LocalSubscription.bulk_create(
+                LocalSubscription(
+                    subscription_id=subscription,
+                    title=wanted[subscription].title,
+                    sort_id=wanted[subscription].sort_id,
+                    first_item_time=wanted[subscription].first_item_time,
+                    url=wanted[subscription].url,
+                    html_url=wanted[subscription].html_url,
+                )
+                for subscription in changes.added | changes.changed
             )
-            for subscription in subscriptions
-        )
-        await LocalSubscriptionCategory.bulk_create(
-            LocalSubscriptionCategory(
-                subscription_id=subscription.id,
-                category_id=category.id,
-                label=category.label,
+            await LocalSubscriptionCategory.bulk_create(
+                LocalSubscriptionCategory(
+                    subscription_id=subscription,
+                    category_id=category.id,
+                    label=category.label,
+                )
+                for subscription in changes.added | changes.changed
+                for category in wanted[subscription].categories
             )
-            for subscription in subscriptions
-            for category in subscription.categories
-        )
-    return subscriptions
+    return changes
 
 
 ##############################################################################
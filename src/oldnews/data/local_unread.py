@@ -6,7 +6,7 @@ from oldas import Folders, Subscriptions, id_is_a_feed
 
 ##############################################################################
 # Local imports.
-from .local_articles import get_local_read_article_ids, unread_count_in
+from .fast_reads import unread_counts
 
 ##############################################################################
 LocalUnread = dict[str, int]
@@ -26,11 +26,7 @@ async def get_local_unread(
     Returns:
         The local unread counts.
     """
-    read = await get_local_read_article_ids()
-    unread = LocalUnread()
-    for category in [*folders, *subscriptions]:
-        unread[category.id] = await unread_count_in(category, read)
-    return unread
+    return LocalUnread(await unread_counts(folders, subscriptions))
 
 
 ##############################################################################
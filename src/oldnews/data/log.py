@@ -1,16 +1,105 @@
-"""Provides the application's logger."""
+"""Provides the application's logger.
+
+Log records are handed to a queue, and written to their files by a
+background thread, so that logging never has the event loop waiting on
+file I/O (or on a log file being rotated).
+
+Note:
+    Log messages should use `%`-style arguments rather than f-strings, so
+    that they're only formatted if they're actually going to be logged; and
+    large collections should be wrapped in `Capped` so that only a sample of
+    them ends up in the log.
+"""
 
 ##############################################################################
 # Python imports.
+from atexit import register
+from collections.abc import Collection
 from functools import cache
-from logging import DEBUG, INFO, Formatter, Logger, getLogger
-from logging.handlers import RotatingFileHandler
+from logging import DEBUG, INFO, Formatter, Handler, Logger, getLogger
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from os import getenv
+from queue import SimpleQueue
+from typing import Any
 
 ##############################################################################
 # Local imports.
 from .locations import data_dir
 
+##############################################################################
+CAPPED_SAMPLE = 10
+"""The number of items of a large collection that are shown in the log."""
+
+
+##############################################################################
+class Capped:
+    """Wraps a collection so that it is logged with its size and a sample."""
+
+    def __init__(self, items: Collection[Any], sample: int = CAPPED_SAMPLE) -> None:
+        """Initialise the capped collection.
+
+        Args:
+            items: The collection to log.
+            sample: The number of items to show in the log.
+        """
+        self._items = items
+        """The collection to log."""
+        self._sample = sample
+        """The number of items to show in the log."""
+
+    def __str__(self) -> str:
+        """The collection as it should appear in the log."""
+        shown: list[str] = []
+        for item in self._items:
+            if len(shown) == self._sample:
+                break
+            shown.append(str(item))
+        more = len(self._items) - len(shown)
+        return (
+            f"{len(self._items):,} items: {', '.join(shown)}"
+            f"{f' (+{more:,} more)' if more else ''}"
+        )
+
+
+##############################################################################
+def _queued(handler: Handler) -> QueueHandler:
+    """Put a handler behind a queue, with a background thread to write to it.
+
+    Args:
+        handler: The handler to put behind a queue.
+
+    Returns:
+        A `QueueHandler` that passes log records on to the handler.
+
+    Note:
+        The background thread is stopped, and any outstanding records are
+        written, when the application exits.
+    """
+    queue: SimpleQueue[Any] = SimpleQueue()
+    listener = QueueListener(queue, handler)
+    listener.start()
+    register(listener.stop)
+    return QueueHandler(queue)
+
+
+##############################################################################
+def _file_handler(log_file: str, log_format: str) -> QueueHandler:
+    """Build a handler for logging to a file in the data directory.
+
+    Args:
+        log_file: The name of the file to log to.
+        log_format: The format for the log entries.
+
+    Returns:
+        A `QueueHandler` that passes log records on to a configured
+        `RotatingFileHandler`.
+    """
+    file_handler = RotatingFileHandler(
+        data_dir() / log_file, maxBytes=1024 * 1024, backupCount=5
+    )
+    file_handler.setFormatter(Formatter(log_format))
+    return _queued(file_handler)
+
 
 ##############################################################################
 def _build_logger() -> Logger:
@@ -21,13 +110,26 @@ def _build_logger() -> Logger:
     """
     logger = getLogger("oldnews")
     logger.setLevel(DEBUG if getenv("OLDNEWS_DEBUG") else INFO)
-    file_handler = RotatingFileHandler(
-        data_dir() / "oldnews.log", maxBytes=1024 * 1024, backupCount=5
+    logger.addHandler(
+        _file_handler(
+            "oldnews.log",
+            "%(asctime)s - %(levelname)s - %(module)s:%(lineno)d - %(message)s",
+        )
     )
-    file_handler.setFormatter(
-        Formatter("%(asctime)s - %(levelname)s - %(module)s:%(lineno)d - %(message)s")
-    )
-    logger.addHandler(file_handler)
+    return logger
+
+
+##############################################################################
+def _build_slow_query_logger() -> Logger:
+    """Build a logger for slow database queries.
+
+    Returns:
+        A configured `Logger` object.
+    """
+    logger = getLogger("oldnews.slow_queries")
+    logger.setLevel(INFO)
+    logger.propagate = False
+    logger.addHandler(_file_handler("slow-queries.log", "%(asctime)s - %(message)s"))
     return logger
 
 
@@ -35,4 +137,8 @@ def _build_logger() -> Logger:
 Log = cache(_build_logger)
 """The application-wide logging object."""
 
+##############################################################################
+SlowQueryLog = cache(_build_slow_query_logger)
+"""The logging object for slow database queries."""
+
 ### log.py ends here
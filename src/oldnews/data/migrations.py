@@ -0,0 +1,408 @@
+"""Provides code for migrating the local database between schema versions.
+
+The version of the schema is kept in SQLite's `user_version`. A new
+database is created straight from the models and stamped with the latest
+version; an existing database has each migration it hasn't seen applied to
+it, in order, each in its own transaction. When the version of the
+database already matches, no schema work is done at all.
+
+Note:
+    Any index a migration creates should be created with `add_index`, so
+    that it has the same name Tortoise would give it; that way a migrated
+    database ends up with the same schema as a new one.
+"""
+
+##############################################################################
+# Python imports.
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+##############################################################################
+# Humanize imports.
+from humanize import intcomma, naturalsize
+
+##############################################################################
+# Tortoise imports.
+from tortoise import Tortoise
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.models import Model
+from tortoise.transactions import in_transaction
+
+##############################################################################
+# Local imports.
+from .compression import compress_summary
+from .log import Log
+from .models import LocalArticle, LocalArticleAlternate, LocalArticleCategory
+
+##############################################################################
+type MigrationProgress = Callable[[str, int, int], None]
+"""Type of a function that reports progress: description, done, total (0 if unknown)."""
+
+
+##############################################################################
+def log_progress(description: str, done: int, total: int) -> None:
+    """Report the progress of a migration to the log.
+
+    Args:
+        description: The description of the work being done.
+        done: How much of the work has been done.
+        total: How much work there is to do; 0 if it isn't known.
+    """
+    if total:
+        Log().info("%s: %s/%s", description, intcomma(done), intcomma(total))
+    else:
+        Log().info(description)
+
+
+##############################################################################
+@dataclass(frozen=True)
+class Migration:
+    """A migration of the local database from one version to the next."""
+
+    description: str
+    """The description of the migration."""
+    apply: Callable[[BaseDBAsyncClient, MigrationProgress], Awaitable[None]]
+    """The function that applies the migration."""
+    vacuum: bool = False
+    """Should the database be vacuumed after the migration?"""
+
+
+##############################################################################
+async def add_index(
+    connection: BaseDBAsyncClient, model: type[Model], *columns: str
+) -> None:
+    """Add an index to a table, if it doesn't already exist.
+
+    Args:
+        connection: The connection to the database.
+        model: The model whose table should be indexed.
+        columns: The columns to index.
+    """
+    await connection.execute_query(
+        connection.schema_generator(connection)._get_index_sql(
+            model, columns, safe=True
+        )
+    )
+
+
+##############################################################################
+async def drop_index(connection: BaseDBAsyncClient, name: str) -> None:
+    """Drop an index, if it exists.
+
+    Args:
+        connection: The connection to the database.
+        name: The name of the index to drop.
+    """
+    await connection.execute_query(f'DROP INDEX IF EXISTS "{name}"')
+
+
+##############################################################################
+async def add_column(
+    connection: BaseDBAsyncClient, model: type[Model], definition: str
+) -> None:
+    """Add a column to a table.
+
+    Args:
+        connection: The connection to the database.
+        model: The model whose table the column should be added to.
+        definition: The SQL definition of the column.
+    """
+    await connection.execute_query(
+        f'ALTER TABLE "{model._meta.db_table}" ADD COLUMN {definition}'
+    )
+
+
+##############################################################################
+async def in_chunks(
+    connection: BaseDBAsyncClient,
+    table: str,
+    description: str,
+    progress: MigrationProgress,
+    chunk_size: int = 1_000,
+) -> AsyncIterator[tuple[int, int]]:
+    """Work through the rows of a table in chunks.
+
+    Args:
+        connection: The connection to the database.
+        table: The name of the table to work through.
+        description: The description of the work being done.
+        progress: The function to report progress to.
+        chunk_size: The number of rows in each chunk.
+
+    Yields:
+        The lowest and highest `rowid` of each chunk of rows.
+    """
+    _, (count,) = await connection.execute_query(
+        f'SELECT COUNT(*) AS total FROM "{table}"'
+    )
+    total, done, after = count["total"], 0, None
+    progress(description, done, total)
+    while True:
+        _, rows = await connection.execute_query(
+            f'SELECT rowid AS "rowid" FROM "{table}" '
+            f"{'' if after is None else 'WHERE rowid > ? '}"
+            "ORDER BY rowid LIMIT ?",
+            [chunk_size] if after is None else [after, chunk_size],
+        )
+        if not rows:
+            break
+        yield rows[0]["rowid"], (after := rows[-1]["rowid"])
+        progress(description, done := done + len(rows), total)
+
+
+##############################################################################
+async def backfill(
+    connection: BaseDBAsyncClient,
+    model: type[Model],
+    assignments: str,
+    progress: MigrationProgress,
+    chunk_size: int = 1_000,
+) -> None:
+    """Backfill the columns of a table, a chunk of rows at a time.
+
+    Args:
+        connection: The connection to the database.
+        model: The model whose table should be backfilled.
+        assignments: The SQL assignments that fill in the columns.
+        progress: The function to report progress to.
+        chunk_size: The number of rows to update at a time.
+    """
+    table = model._meta.db_table
+    async for low, high in in_chunks(
+        connection, table, f"Backfilling {table}", progress, chunk_size
+    ):
+        await connection.execute_query(
+            f'UPDATE "{table}" SET {assignments} WHERE rowid BETWEEN ? AND ?',
+            [low, high],
+        )
+
+
+##############################################################################
+async def rebuild_table(
+    connection: BaseDBAsyncClient,
+    model: type[Model],
+    definition: str,
+    columns: str,
+    progress: MigrationProgress,
+    chunk_size: int = 1_000,
+) -> None:
+    """Rebuild a table, copying its rows across a chunk at a time.
+
+    Args:
+        connection: The connection to the database.
+        model: The model whose table should be rebuilt.
+        definition: The SQL definition of the columns of the new table.
+        columns: The SQL for the columns to copy, as a `SELECT` list.
+        progress: The function to report progress to.
+        chunk_size: The number of rows to copy at a time.
+
+    Note:
+        This is for changes that `ALTER TABLE` can't make. The indexes of
+        the table are created again once it has been rebuilt, so any of
+        them that use a column the new table doesn't have need dropping
+        first.
+    """
+    table = model._meta.db_table
+    rebuilt = f"{table}_rebuild"
+    # The indexes go when the table is dropped, so note them first.
+    _, indexes = await connection.execute_query(
+        "SELECT sql FROM sqlite_master "
+        "WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+        [table],
+    )
+    await connection.execute_query(f'CREATE TABLE "{rebuilt}" ({definition})')
+    async for low, high in in_chunks(
+        connection, table, f"Rebuilding {table}", progress, chunk_size
+    ):
+        await connection.execute_query(
+            f'INSERT INTO "{rebuilt}" SELECT {columns} FROM "{table}" '
+            "WHERE rowid BETWEEN ? AND ?",
+            [low, high],
+        )
+    await connection.execute_query(f'DROP TABLE "{table}"')
+    await connection.execute_query(f'ALTER TABLE "{rebuilt}" RENAME TO "{table}"')
+    for index in indexes:
+        await connection.execute_query(index["sql"])
+
+
+##############################################################################
+async def _index_article_tables(
+    connection: BaseDBAsyncClient, _: MigrationProgress
+) -> None:
+    """Index the article tables for the queries the application makes.
+
+    Args:
+        connection: The connection to the database.
+    """
+    # Replaced by the index on (origin_stream_id, published).
+    await drop_index(connection, "idx_localarticl_origin__0d469f")
+    # Replaced by the index on (category, article_id).
+    await drop_index(connection, "idx_localarticl_categor_3d97f4")
+    await add_index(connection, LocalArticle, "published")
+    await add_index(connection, LocalArticle, "origin_stream_id", "published")
+    await add_index(connection, LocalArticleCategory, "category", "article_id")
+    await add_index(connection, LocalArticleCategory, "article_id", "category")
+    await add_index(connection, LocalArticleAlternate, "article_id")
+
+
+##############################################################################
+async def _compress_summaries(
+    connection: BaseDBAsyncClient, progress: MigrationProgress
+) -> None:
+    """Compress the content of the summaries of the articles.
+
+    Args:
+        connection: The connection to the database.
+        progress: The function to report progress to.
+    """
+    await add_column(connection, LocalArticle, '"summary_size" INT NOT NULL DEFAULT 0')
+    table = LocalArticle._meta.db_table
+    original = stored = 0
+    async for low, high in in_chunks(
+        connection, table, "Compressing summaries", progress
+    ):
+        _, rows = await connection.execute_query(
+            f'SELECT rowid, "summary_content" FROM "{table}" '
+            "WHERE rowid BETWEEN ? AND ?",
+            [low, high],
+        )
+        compressed: list[list[Any]] = []
+        for row in rows:
+            size = len(row["summary_content"].encode("utf-8"))
+            content = compress_summary(row["summary_content"])
+            compressed.append([content, size, row["rowid"]])
+            original += size
+            stored += len(content)
+        await connection.execute_many(
+            f'UPDATE "{table}" SET "summary_content" = ?, "summary_size" = ? '
+            "WHERE rowid = ?",
+            compressed,
+        )
+    Log().info(
+        "Compressed summaries from %s to %s", naturalsize(original), naturalsize(stored)
+    )
+
+
+##############################################################################
+async def _add_content_hashes(
+    connection: BaseDBAsyncClient, _: MigrationProgress
+) -> None:
+    """Add a hash of the content to the articles.
+
+    Args:
+        connection: The connection to the database.
+
+    Note:
+        Existing articles are left with an empty hash, so they'll be
+        written again the first time they're seen in a sync.
+    """
+    await add_column(
+        connection, LocalArticle, "\"content_hash\" VARCHAR(32) NOT NULL DEFAULT ''"
+    )
+
+
+##############################################################################
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration("Index the article tables", _index_article_tables),
+    Migration("Compress article summaries", _compress_summaries, vacuum=True),
+    Migration("Add content hashes to articles", _add_content_hashes),
+)
+"""The migrations, in order; a database's version is how many it has had."""
+
+SCHEMA_VERSION = len(MIGRATIONS)
+"""The version of the schema the application expects."""
+
+
+##############################################################################
+async def _schema_version(connection: BaseDBAsyncClient) -> int:
+    """Get the version of the schema of the database.
+
+    Args:
+        connection: The connection to the database.
+
+    Returns:
+        The version of the schema.
+    """
+    _, (version,) = await connection.execute_query("PRAGMA user_version")
+    return int(version["user_version"])
+
+
+##############################################################################
+async def _is_new(connection: BaseDBAsyncClient) -> bool:
+    """Is the database a new, empty, database?
+
+    Args:
+        connection: The connection to the database.
+
+    Returns:
+        `True` if the database has no tables, `False` if not.
+    """
+    _, (tables,) = await connection.execute_query(
+        "SELECT COUNT(*) AS tables FROM sqlite_master WHERE type = 'table'"
+    )
+    return not tables["tables"]
+
+
+##############################################################################
+async def _apply(
+    connection: BaseDBAsyncClient,
+    version: int,
+    migration: Migration,
+    progress: MigrationProgress,
+) -> None:
+    """Apply a migration.
+
+    Args:
+        connection: The connection to the database.
+        version: The version the migration takes the database to.
+        migration: The migration to apply.
+        progress: The function to report progress to.
+    """
+    Log().info("Migrating database to version %s: %s", version, migration.description)
+    async with in_transaction() as transaction:
+        await migration.apply(transaction, progress)
+        _, problems = await transaction.execute_query("PRAGMA foreign_key_check")
+        if problems:
+            raise RuntimeError(
+                f"Migration to version {version} broke {len(problems)} foreign keys"
+            )
+        await transaction.execute_query(f"PRAGMA user_version = {version}")
+
+
+##############################################################################
+async def migrate(progress: MigrationProgress = log_progress) -> None:
+    """Bring the schema of the local database up to date.
+
+    Args:
+        progress: The function to report the progress of migrations to.
+    """
+    connection = Tortoise.get_connection("default")
+    if (version := await _schema_version(connection)) == SCHEMA_VERSION:
+        return
+    if version > SCHEMA_VERSION:
+        Log().warning(
+            "Database schema version %s is newer than %s", version, SCHEMA_VERSION
+        )
+        return
+    if not await _is_new(connection):
+        # Foreign keys can't be turned off inside a transaction, and need to
+        # be off so that a migration that rebuilds a table doesn't cascade
+        # deletes.
+        await connection.execute_query("PRAGMA foreign_keys = OFF")
+        try:
+            for to_version, migration in enumerate(
+                MIGRATIONS[version:], start=version + 1
+            ):
+                await _apply(connection, to_version, migration, progress)
+        finally:
+            await connection.execute_query("PRAGMA foreign_keys = ON")
+        if any(migration.vacuum for migration in MIGRATIONS[version:]):
+            progress("Vacuuming the database", 0, 0)
+            await connection.execute_query("VACUUM")
+    # Create anything that's missing; for a new database that's everything.
+    await Tortoise.generate_schemas()
+    await connection.execute_query(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+### migrations.py ends here
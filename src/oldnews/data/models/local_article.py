@@ -18,7 +18,7 @@ class LocalArticle(Model):
     """The ID of the article."""
     title = fields.TextField()
     """The title of the article."""
-    published = fields.DatetimeField()
+    published = fields.DatetimeField(index=True)
     """The time when the article was published."""
     updated = fields.DatetimeField()
     """The time when the article was updated."""
@@ -26,14 +26,24 @@ class LocalArticle(Model):
     """The author of the article."""
     summary_direction = fields.CharField(max_length=10)
     """The direction for the text in the summary."""
-    summary_content = fields.TextField()
-    """The content of the summary."""
-    origin_stream_id = fields.CharField(max_length=128, index=True)
+    summary_content = fields.BinaryField()
+    """The compressed content of the summary."""
+    summary_size = fields.IntField(default=0)
+    """The size, in bytes, of the content of the summary before compression."""
+    origin_stream_id = fields.CharField(max_length=128)
     """The stream ID for the article's origin."""
     origin_title = fields.TextField()
     """The title of the origin of the article."""
     origin_html_url = fields.TextField()
     """The URL of the HTML of the origin of the article."""
+    content_hash = fields.CharField(max_length=32, default="")
+    """A hash of the content of the article, for spotting changes."""
+
+    class Meta:
+        indexes = (
+            # For getting a subscription's articles, newest first.
+            ("origin_stream_id", "published"),
+        )
 
     async def add_category(self, category: str | State) -> None:
         """Add a given category to the local article.
@@ -60,9 +70,17 @@ class LocalArticleCategory(Model):
         "models.LocalArticle", related_name="categories", on_delete=fields.CASCADE
     )
     """The article that this category belongs to."""
-    category = fields.CharField(max_length=255, index=True)
+    category = fields.CharField(max_length=255)
     """The category."""
 
+    class Meta:
+        indexes = (
+            # For finding the articles in a category.
+            ("category", "article_id"),
+            # For finding the categories of an article.
+            ("article_id", "category"),
+        )
+
 
 ##############################################################################
 class LocalArticleAlternate(Model):
@@ -77,5 +95,11 @@ class LocalArticleAlternate(Model):
     mime_type = fields.CharField(max_length=100)
     """The MIME type of the alternate."""
 
+    class Meta:
+        indexes = (
+            # For finding the alternates of an article.
+            ("article_id",),
+        )
+
 
 ### local_article.py ends here
@@ -0,0 +1,202 @@
+"""Provides code for keeping statistics about database queries."""
+
+##############################################################################
+# Python imports.
+from asyncio import Task, current_task
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from json import dumps, loads
+from pathlib import Path
+from re import Match, compile
+from sys import _getframe
+from types import FrameType
+from typing import Any
+
+##############################################################################
+# Local imports.
+from .locations import data_dir
+
+
+##############################################################################
+@dataclass
+class QueryStats:
+    """Aggregated statistics for the queries made by a single function."""
+
+    function: str
+    """The function that made the queries."""
+    statements: int = 0
+    """The number of statements executed."""
+    rows: int = 0
+    """The number of rows returned or affected."""
+    total_time: float = 0.0
+    """The total time, in seconds, spent executing the statements."""
+    maximum_time: float = 0.0
+    """The longest time, in seconds, spent executing a single statement."""
+    slowest_statement: str = ""
+    """The text of the slowest statement."""
+
+    @property
+    def mean_time(self) -> float:
+        """The mean time, in seconds, spent executing a statement."""
+        return self.total_time / self.statements if self.statements else 0.0
+
+    def record(self, statement: str, rows: int, duration: float) -> None:
+        """Record the execution of a statement.
+
+        Args:
+            statement: The text of the statement.
+            rows: The number of rows returned or affected.
+            duration: The time, in seconds, the statement took.
+        """
+        self.statements += 1
+        self.rows += rows
+        self.total_time += duration
+        if duration >= self.maximum_time:
+            self.maximum_time = duration
+            self.slowest_statement = statement
+
+    def merge(self, other: "QueryStats") -> None:
+        """Merge another set of statistics into these ones.
+
+        Args:
+            other: The statistics to merge.
+        """
+        self.statements += other.statements
+        self.rows += other.rows
+        self.total_time += other.total_time
+        if other.maximum_time >= self.maximum_time:
+            self.maximum_time = other.maximum_time
+            self.slowest_statement = other.slowest_statement
+
+
+##############################################################################
+_PLACEHOLDERS = compile(r"\?(?:, ?\?){9,}")
+"""Regular expression for finding long runs of parameter placeholders."""
+
+
+##############################################################################
+def tidy_statement(statement: str) -> str:
+    """Tidy up the text of a statement for reporting.
+
+    Args:
+        statement: The statement to tidy.
+
+    Returns:
+        The statement, with long runs of placeholders collapsed.
+    """
+
+    def collapse(placeholders: Match[str]) -> str:
+        return f"?...[{placeholders[0].count('?')} placeholders]"
+
+    return _PLACEHOLDERS.sub(collapse, statement)
+
+
+##############################################################################
+_query_stats: dict[str, QueryStats] = {}
+"""The statistics for the queries made during this session."""
+
+
+##############################################################################
+_last_caller: ContextVar[tuple[Task[Any] | None, str]] = ContextVar(
+    "_last_caller", default=(None, "<unknown>")
+)
+"""The task and application function that last made a database call."""
+
+
+##############################################################################
+def calling_function() -> str:
+    """Work out which application function is making a database call.
+
+    Returns:
+        The name of the function, or `<unknown>` if it can't be worked out.
+
+    Note:
+        This is the first function up the stack that lives in the
+        application's own code, other than the database code itself. Some
+        queries (prefetching related data, for example) are run by Tortoise
+        in their own tasks; in that case the function that last made a call
+        in the task that created that task is used.
+    """
+    frame: FrameType | None = _getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if (
+            module.startswith("oldnews.")
+            and module != __name__
+            and not module.endswith(".db_client")
+        ):
+            _last_caller.set(
+                (current_task(), caller := f"{module}.{frame.f_code.co_name}")
+            )
+            return caller
+        frame = frame.f_back
+    task, caller = _last_caller.get()
+    return caller if task is not current_task() else "<unknown>"
+
+
+##############################################################################
+def record_query(function: str, statement: str, rows: int, duration: float) -> None:
+    """Record the execution of a statement.
+
+    Args:
+        function: The function that made the statement.
+        statement: The text of the statement.
+        rows: The number of rows returned or affected.
+        duration: The time, in seconds, the statement took.
+    """
+    if function not in _query_stats:
+        _query_stats[function] = QueryStats(function)
+    _query_stats[function].record(tidy_statement(statement), rows, duration)
+
+
+##############################################################################
+def query_stats_file() -> Path:
+    """The path to the file that holds the saved query statistics.
+
+    Returns:
+        The path to the query statistics file.
+    """
+    return data_dir() / "query-stats.json"
+
+
+##############################################################################
+def load_query_stats() -> dict[str, QueryStats]:
+    """Load the saved query statistics.
+
+    Returns:
+        The saved statistics, keyed by function.
+    """
+    if (stats_file := query_stats_file()).exists():
+        return {
+            stats["function"]: QueryStats(**stats)
+            for stats in loads(stats_file.read_text(encoding="utf-8"))
+        }
+    return {}
+
+
+##############################################################################
+def save_query_stats() -> None:
+    """Merge the statistics for this session into the saved statistics."""
+    if not _query_stats:
+        return
+    saved = load_query_stats()
+    for function, stats in _query_stats.items():
+        if function in saved:
+            saved[function].merge(stats)
+        else:
+            saved[function] = stats
+    query_stats_file().write_text(
+        dumps([asdict(stats) for stats in saved.values()], indent=4),
+        encoding="utf-8",
+    )
+    _query_stats.clear()
+
+
+##############################################################################
+def reset_query_stats() -> None:
+    """Remove all the saved query statistics."""
+    _query_stats.clear()
+    query_stats_file().unlink(missing_ok=True)
+
+
+### query_stats.py ends here
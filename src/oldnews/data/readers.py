@@ -0,0 +1,129 @@
+"""Provides a pool of read-only connections to the local database.
+
+All writing to the local database goes through Tortoise's own connection,
+which serialises its statements, and holds on to the database for the
+whole of a transaction; so while a sync is saving a big batch of articles
+anything else that wants that connection has to wait for it to finish.
+
+Because the database runs in WAL mode, readers and a writer don't block
+each other; so the busiest reads, the ones the UI makes while a sync is
+going on, are made with connections from this pool instead. Each reader is
+a read-only connection, and each use of one is a read transaction, so the
+reads made within it all see the same snapshot of the database.
+"""
+
+##############################################################################
+# Python imports.
+from asyncio import Queue
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+##############################################################################
+# Tortoise imports.
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+##############################################################################
+# Local imports.
+from .db_client import OldNewsSqliteClient
+
+##############################################################################
+READERS = 3
+"""The number of read-only connections in the pool."""
+
+
+##############################################################################
+class ReaderPool:
+    """A pool of read-only connections to the local database."""
+
+    def __init__(self, database: Path, size: int = READERS) -> None:
+        """Initialise the pool.
+
+        Args:
+            database: The database to read from.
+            size: The number of connections in the pool.
+
+        Note:
+            The connections are only opened when they're first used.
+        """
+        self._readers = [
+            OldNewsSqliteClient(
+                str(database),
+                connection_name=f"reader-{reader}",
+                journal_mode="WAL",
+                query_only="ON",
+            )
+            for reader in range(size)
+        ]
+        """The connections in the pool."""
+        self._idle: Queue[OldNewsSqliteClient] = Queue()
+        """The connections that aren't in use."""
+        for reader in self._readers:
+            self._idle.put_nowait(reader)
+
+    @asynccontextmanager
+    async def reading(self) -> AsyncIterator[BaseDBAsyncClient]:
+        """Read from the database within a read transaction.
+
+        Yields:
+            The connection to read with.
+
+        Note:
+            If every connection is in use this waits for one to be free.
+        """
+        reader = await self._idle.get()
+        try:
+            async with reader._in_transaction() as transaction:
+                yield transaction
+        finally:
+            self._idle.put_nowait(reader)
+
+    async def close(self) -> None:
+        """Close all the connections in the pool."""
+        for reader in self._readers:
+            await reader.close()
+
+
+##############################################################################
+_pool: ReaderPool | None = None
+"""The pool of readers for the local database."""
+
+
+##############################################################################
+def open_readers(database: Path) -> None:
+    """Open the pool of readers for the local database.
+
+    Args:
+        database: The database to read from.
+    """
+    global _pool
+    _pool = ReaderPool(database)
+
+
+##############################################################################
+async def close_readers() -> None:
+    """Close the pool of readers for the local database."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+##############################################################################
+@asynccontextmanager
+async def reading() -> AsyncIterator[BaseDBAsyncClient]:
+    """Read from the local database within a read transaction.
+
+    Yields:
+        The connection to read with.
+
+    Raises:
+        RuntimeError: If the local database hasn't been initialised.
+    """
+    if _pool is None:
+        raise RuntimeError("The local database has not been initialised")
+    async with _pool.reading() as reader:
+        yield reader
+
+
+### readers.py ends here
@@ -22,6 +22,8 @@ def reset_data(logout: bool) -> None:
         "*.db-shm",
         "*.db-wal",
         "*.log",
+        "query-stats.json",
+        "batch-sizes.json",
         *((".token",) if logout else ()),
     ):
         to_remove.extend(data_dir().glob(pattern))
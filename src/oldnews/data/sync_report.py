@@ -0,0 +1,162 @@
+"""Provides classes for reporting on the performance of a sync.
+
+Phases of a sync can run at the same time, so the work done is tallied
+against the phases being measured in the current context (see `measuring`
+and `tally`), rather than worked out from application-wide counters.
+"""
+
+##############################################################################
+# Python imports.
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from json import dumps
+from time import perf_counter
+from typing import Any
+
+
+##############################################################################
+@dataclass
+class SyncPhase:
+    """The metrics for one phase of a sync."""
+
+    name: str
+    """The name of the phase."""
+    wall_time: float = 0.0
+    """The wall time, in seconds, spent in the phase."""
+    items: int = 0
+    """The number of items handled by the phase."""
+    bytes_received: int = 0
+    """The number of bytes received from TheOldReader during the phase."""
+    retries: int = 0
+    """The number of calls to TheOldReader that were retried during the phase."""
+    db_statements: int = 0
+    """The number of database statements executed during the phase."""
+    written: int = 0
+    """The number of items that needed writing to the database."""
+    skipped: int = 0
+    """The number of items that were skipped as they hadn't changed."""
+
+    @property
+    def items_per_second(self) -> float:
+        """The throughput of the phase, in items per second."""
+        return self.items / self.wall_time if self.wall_time else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """The metrics as a dictionary.
+
+        Returns:
+            A dictionary of the metrics.
+        """
+        return {
+            "name": self.name,
+            "wall_time": round(self.wall_time, 4),
+            "items": self.items,
+            "bytes_received": self.bytes_received,
+            "retries": self.retries,
+            "db_statements": self.db_statements,
+            "written": self.written,
+            "skipped": self.skipped,
+            "items_per_second": round(self.items_per_second, 2),
+        }
+
+
+##############################################################################
+@dataclass
+class SyncReport:
+    """A report on the performance of a sync."""
+
+    started: datetime = field(default_factory=lambda: datetime.now(UTC))
+    """The time at which the sync started."""
+    wall_time: float = 0.0
+    """The wall time, in seconds, that the whole sync took."""
+    completed: bool = False
+    """Did the sync run to completion?"""
+    phases: dict[str, SyncPhase] = field(default_factory=dict)
+    """The phases of the sync."""
+
+    def phase(self, name: str) -> SyncPhase:
+        """Get the metrics for a given phase.
+
+        Args:
+            name: The name of the phase.
+
+        Returns:
+            The metrics for that phase.
+
+        Note:
+            If the phase isn't yet known to the report it will be added.
+        """
+        if name not in self.phases:
+            self.phases[name] = SyncPhase(name)
+        return self.phases[name]
+
+    def as_dict(self) -> dict[str, Any]:
+        """The report as a dictionary.
+
+        Returns:
+            A dictionary of the report.
+        """
+        return {
+            "started": self.started.isoformat(),
+            "wall_time": round(self.wall_time, 4),
+            "completed": self.completed,
+            "phases": [phase.as_dict() for phase in self.phases.values()],
+        }
+
+    def as_json(self) -> str:
+        """The report as JSON.
+
+        Returns:
+            The report as a JSON string.
+        """
+        return dumps(self.as_dict())
+
+
+##############################################################################
+_measuring: ContextVar[tuple[SyncPhase, ...]] = ContextVar("measuring", default=())
+"""The phases being measured in the current context."""
+
+
+##############################################################################
+@contextmanager
+def measuring(phase: SyncPhase) -> Iterator[SyncPhase]:
+    """Measure the work done by a phase of a sync.
+
+    Args:
+        phase: The phase to measure.
+
+    Yields:
+        The phase, so that items can be counted.
+
+    Note:
+        Measurements for the same phase are accumulated, so this can be
+        used multiple times for a single phase.
+    """
+    token = _measuring.set((*_measuring.get(), phase))
+    started = perf_counter()
+    try:
+        yield phase
+    finally:
+        phase.wall_time += perf_counter() - started
+        _measuring.reset(token)
+
+
+##############################################################################
+def tally(*, db_statements: int = 0, bytes_received: int = 0, retries: int = 0) -> None:
+    """Tally work against the phases being measured in the current context.
+
+    Args:
+        db_statements: The number of database statements executed.
+        bytes_received: The number of bytes received from TheOldReader.
+        retries: The number of calls to TheOldReader that were retried.
+    """
+    for phase in _measuring.get():
+        phase.db_statements += db_statements
+        phase.bytes_received += bytes_received
+        phase.retries += retries
+
+
+### sync_report.py ends here
@@ -0,0 +1,319 @@
+"""Provides a governor for the application's calls to TheOldReader.
+
+The governor sits underneath the `oldas` session, as the transport of its
+HTTP client, so every call the application makes to TheOldReader goes
+through it. It:
+
+- Limits the rate of calls with a token bucket.
+- Retries calls that fail in ways that are worth trying again, backing off
+  exponentially with jitter, or for as long as the server asks with
+  `Retry-After`.
+- Stops calling altogether for a while, with a circuit breaker, if
+  TheOldReader keeps failing.
+"""
+
+##############################################################################
+# Python imports.
+from asyncio import Lock, sleep
+from email.utils import parsedate_to_datetime
+from random import uniform
+from time import monotonic, time
+
+##############################################################################
+# httpx imports.
+from httpx import (
+    AsyncBaseTransport,
+    AsyncHTTPTransport,
+    ConnectError,
+    ConnectTimeout,
+    PoolTimeout,
+    Request,
+    Response,
+    TransportError,
+)
+
+##############################################################################
+# Local imports.
+from .data import Log, tally
+
+##############################################################################
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+"""The HTTP statuses that are worth retrying."""
+
+UNPROCESSED_STATUSES = frozenset({429, 503})
+"""The HTTP statuses that mean the server didn't act on the request."""
+
+UNSENT_ERRORS = (ConnectError, ConnectTimeout, PoolTimeout)
+"""The transport errors that mean the request was never sent."""
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+"""The HTTP methods that can safely be retried whatever happened."""
+
+BACKOFF_BASE = 0.5
+"""The number of seconds to back off for before the first retry."""
+
+BACKOFF_MAXIMUM = 30.0
+"""The longest number of seconds to back off for between retries."""
+
+RETRY_AFTER_MAXIMUM = 120.0
+"""The longest `Retry-After` that will be waited for; any longer and the call fails."""
+
+CIRCUIT_THRESHOLD = 5
+"""The number of failures in a row that opens the circuit breaker."""
+
+CIRCUIT_COOLDOWN = 60.0
+"""The number of seconds the circuit breaker stays open for."""
+
+
+##############################################################################
+class CircuitOpen(TransportError):
+    """Raised when a call isn't made because the circuit breaker is open."""
+
+
+##############################################################################
+class TokenBucket:
+    """A token bucket, for limiting the rate of calls."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialise the token bucket.
+
+        Args:
+            rate: The number of tokens added to the bucket each second.
+            burst: The most tokens the bucket can hold.
+
+        Note:
+            A rate of 0 turns off rate limiting.
+        """
+        self._rate = rate
+        """The number of tokens added to the bucket each second."""
+        self._burst = max(1, burst)
+        """The most tokens the bucket can hold."""
+        self._tokens = float(self._burst)
+        """The number of tokens in the bucket."""
+        self._updated = monotonic()
+        """The time at which the bucket was last topped up."""
+        self._lock = Lock()
+        """Lock so that those waiting for a token take turns."""
+
+    def _top_up(self) -> None:
+        """Top up the bucket with the tokens added since it was last topped up."""
+        now = monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + ((now - self._updated) * self._rate)
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Take a token from the bucket, waiting for one if need be."""
+        if self._rate <= 0:
+            return
+        async with self._lock:
+            self._top_up()
+            if self._tokens < 1:
+                await sleep((1 - self._tokens) / self._rate)
+                self._top_up()
+            self._tokens -= 1
+
+
+##############################################################################
+class CircuitBreaker:
+    """A circuit breaker, for stopping calls to a server that keeps failing."""
+
+    def __init__(
+        self, threshold: int = CIRCUIT_THRESHOLD, cooldown: float = CIRCUIT_COOLDOWN
+    ) -> None:
+        """Initialise the circuit breaker.
+
+        Args:
+            threshold: The number of failures in a row that opens the circuit.
+            cooldown: The number of seconds the circuit stays open for.
+        """
+        self._threshold = threshold
+        """The number of failures in a row that opens the circuit."""
+        self._cooldown = cooldown
+        """The number of seconds the circuit stays open for."""
+        self._failures = 0
+        """The number of failures in a row."""
+        self._opened_at: float | None = None
+        """The time at which the circuit was opened, if it's open."""
+
+    def check(self) -> None:
+        """Check that a call can be made.
+
+        Raises:
+            CircuitOpen: If the circuit is open.
+
+        Note:
+            Once the cooldown has passed calls are let through again; if the
+            next one fails the circuit opens again straight away.
+        """
+        if (
+            self._opened_at is not None
+            and (remaining := self._cooldown - (monotonic() - self._opened_at)) > 0
+        ):
+            raise CircuitOpen(
+                f"TheOldReader keeps failing; not trying again for {remaining:.0f}s"
+            )
+
+    def succeeded(self) -> None:
+        """Record that a call succeeded."""
+        self._failures = 0
+        self._opened_at = None
+
+    def failed(self) -> None:
+        """Record that a call failed."""
+        self._failures += 1
+        if self._failures >= self._threshold:
+            if self._opened_at is None:
+                Log().warning(
+                    "Opening circuit breaker after %s failures", self._failures
+                )
+            self._opened_at = monotonic()
+
+
+##############################################################################
+class GovernedTransport(AsyncBaseTransport):
+    """An HTTP transport that governs the calls made through it."""
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst: int,
+        retries: int,
+        transport: AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialise the transport.
+
+        Args:
+            requests_per_second: The most calls to make per second; 0 for no limit.
+            burst: The most calls that can be made at once before the limit applies.
+            retries: The most times to retry a call.
+            transport: The transport that actually makes the calls.
+        """
+        self._transport = transport or AsyncHTTPTransport()
+        """The transport that actually makes the calls."""
+        self._bucket = TokenBucket(requests_per_second, burst)
+        """The token bucket that limits the rate of calls."""
+        self._breaker = CircuitBreaker()
+        """The circuit breaker for when TheOldReader keeps failing."""
+        self._retries = retries
+        """The most times to retry a call."""
+        self.retries_made = 0
+        """The number of retries made so far."""
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Get the time to back off for before a retry.
+
+        Args:
+            attempt: The number of the attempt that failed, from 0.
+
+        Returns:
+            The number of seconds to back off for.
+        """
+        return uniform(0, min(BACKOFF_MAXIMUM, BACKOFF_BASE * (2**attempt)))
+
+    @staticmethod
+    def _retry_after(response: Response) -> float | None:
+        """Get the time the server asked us to wait before trying again.
+
+        Args:
+            response: The response from the server.
+
+        Returns:
+            The number of seconds to wait, or `None` if the server didn't say.
+        """
+        if not (retry_after := response.headers.get("retry-after")):
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time())
+        except (TypeError, ValueError):
+            return None
+
+    async def _wait_to_retry(
+        self, request: Request, attempt: int, delay: float, reason: str
+    ) -> None:
+        """Wait before retrying a call.
+
+        Args:
+            request: The request being retried.
+            attempt: The number of the attempt that failed, from 0.
+            delay: The number of seconds to wait.
+            reason: The reason the call is being retried.
+        """
+        self.retries_made += 1
+        tally(retries=1)
+        Log().warning(
+            "Retrying %s %s in %.2fs (retry %s of %s): %s",
+            request.method,
+            request.url.path,
+            delay,
+            attempt + 1,
+            self._retries,
+            reason,
+        )
+        await sleep(delay)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        """Make a call, governing the rate and retrying where it makes sense.
+
+        Args:
+            request: The request to make.
+
+        Returns:
+            The response.
+
+        Raises:
+            CircuitOpen: If the circuit breaker is open.
+            TransportError: If the call failed, and retrying didn't help.
+        """
+        # Make sure the body can be sent again if the call is retried.
+        await request.aread()
+        idempotent = request.method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            self._breaker.check()
+            await self._bucket.acquire()
+            try:
+                response = await self._transport.handle_async_request(request)
+            except TransportError as error:
+                self._breaker.failed()
+                if attempt >= self._retries or not (
+                    idempotent or isinstance(error, UNSENT_ERRORS)
+                ):
+                    raise
+                await self._wait_to_retry(
+                    request, attempt, self._backoff(attempt), repr(error)
+                )
+                attempt += 1
+                continue
+            if response.status_code >= 500:
+                self._breaker.failed()
+            else:
+                self._breaker.succeeded()
+            if (
+                response.status_code not in RETRY_STATUSES
+                or attempt >= self._retries
+                or not (idempotent or response.status_code in UNPROCESSED_STATUSES)
+            ):
+                return response
+            if (delay := self._retry_after(response)) is None:
+                delay = self._backoff(attempt)
+            elif delay > RETRY_AFTER_MAXIMUM:
+                return response
+            await response.aclose()
+            await self._wait_to_retry(
+                request, attempt, delay, f"HTTP {response.status_code}"
+            )
+            attempt += 1
+
+    async def aclose(self) -> None:
+        """Close the transport."""
+        await self._transport.aclose()
+
+
+### governor.py ends here
@@ -29,7 +29,8 @@ from .data import (
     shutdown_local_data,
     update_configuration,
 )
-from .screens import Login, Main
+from .screens import DatabaseUpgrade, Login, Main
+from .session import OldNewsSession
 
 
 ##############################################################################
@@ -103,8 +104,13 @@ class OldNews(EnhancedApp[None]):
             shown; the main screen will then only be shown once a token as
             been acquired.
         """
-        await initialise_local_data()
-        session = partial(Session, "OldNews", logger=Log())
+        # Should the local data need upgrading, show how that's going.
+        await self.push_screen(upgrade := DatabaseUpgrade())
+        try:
+            await initialise_local_data(upgrade.show_progress)
+        finally:
+            await self.pop_screen()
+        session = partial(OldNewsSession, "OldNews", logger=Log())
         if token := get_auth_token():
             self.push_screen(Main(session(token)))
         else:
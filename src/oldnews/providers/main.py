@@ -29,6 +29,7 @@ from ..commands import (
     MoveSubscription,
     Next,
     NextUnread,
+    NextUnreadCategory,
     OpenArticle,
     OpenHomePage,
     Previous,
@@ -37,6 +38,7 @@ from ..commands import (
     Remove,
     Rename,
     SetSubscriptionContentFilter,
+    SyncInformation,
     ToggleCompact,
     ToggleShowAll,
     UserInformation,
@@ -71,6 +73,7 @@ class MainCommands(CommandsProvider):
         yield from self.maybe(MoveSubscription)
         yield from self.maybe(Next)
         yield from self.maybe(NextUnread)
+        yield from self.maybe(NextUnreadCategory)
         yield from self.maybe(OpenArticle)
         yield from self.maybe(OpenHomePage)
         yield from self.maybe(Previous)
@@ -80,6 +83,7 @@ class MainCommands(CommandsProvider):
         yield from self.maybe(Rename)
         yield from self.maybe(Remove)
         yield from self.maybe(SetSubscriptionContentFilter)
+        yield from self.maybe(SyncInformation)
         yield ToggleCompact()
         yield ToggleShowAll()
         yield from self.maybe(UserInformation)
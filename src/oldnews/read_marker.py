@@ -0,0 +1,175 @@
+"""Provides a class for deciding when articles get marked as read."""
+
+##############################################################################
+# Python imports.
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+##############################################################################
+# OldAS imports.
+from oldas import Article
+
+##############################################################################
+# Textual imports.
+from textual.message_pump import MessagePump
+from textual.timer import Timer
+
+##############################################################################
+# Local imports.
+from .data import ArticleHeader
+
+##############################################################################
+type ReadStateWriter = Callable[[frozenset[str], frozenset[str]], Awaitable[None]]
+"""Type of a function that writes read and unread article IDs."""
+
+
+##############################################################################
+class ReadMarker:
+    """Class that decides when articles get marked as read, and batches it up.
+
+    An article that is being viewed is only marked as read once it has been
+    viewed for a while, so that skimming quickly past articles doesn't mark
+    them all as read. Articles that are marked as read or unread are
+    gathered up and written in batches, rather than one at a time.
+    """
+
+    WRITE_INTERVAL = 0.2
+    """The number of seconds to gather up changes for before writing them."""
+
+    def __init__(
+        self, owner: MessagePump, dwell: float, write: ReadStateWriter
+    ) -> None:
+        """Initialise the read marker.
+
+        Args:
+            owner: The owner of the read marker's timers.
+            dwell: The number of seconds an article must be viewed for
+                before it's marked as read; 0 to mark it as read right away.
+            write: The function that writes the read and unread article IDs.
+        """
+        self._owner = owner
+        """The owner of the read marker's timers."""
+        self._dwell = dwell
+        """The number of seconds an article must be viewed for to be read."""
+        self._write = write
+        """The function that writes the read and unread article IDs."""
+        self._viewing: str | None = None
+        """The ID of the article currently being viewed, if there is one."""
+        self._dwell_timer: Timer | None = None
+        """The timer for the article currently being viewed."""
+        self._write_timer: Timer | None = None
+        """The timer for writing the gathered changes."""
+        self._read: set[str] = set()
+        """The IDs of the articles waiting to be written as read."""
+        self._unread: set[str] = set()
+        """The IDs of the articles waiting to be written as unread."""
+
+    def _stop_dwelling(self) -> None:
+        """Stop waiting to mark the article being viewed as read."""
+        if self._dwell_timer is not None:
+            self._dwell_timer.stop()
+            self._dwell_timer = None
+
+    def viewing(self, article: Article | None) -> None:
+        """Note the article that is now being viewed.
+
+        Args:
+            article: The article being viewed, or `None` if none is.
+
+        Note:
+            An unread article is marked as read once it has been viewed for
+            the dwell time; viewing something else before then means it
+            stays unread.
+        """
+        self._stop_dwelling()
+        self._viewing = None if article is None else article.id
+        if article is None or not article.is_unread:
+            return
+        if self._dwell > 0:
+            self._dwell_timer = self._owner.set_timer(
+                self._dwell, partial(self._dwelled, article)
+            )
+        else:
+            self.mark_read(article)
+
+    def _dwelled(self, article: Article) -> None:
+        """Mark an article as read once it has been viewed for long enough.
+
+        Args:
+            article: The article that has been viewed for long enough.
+        """
+        self._dwell_timer = None
+        self.mark_read(article)
+
+    def _write_soon(self) -> None:
+        """Make sure the gathered changes will be written soon."""
+        if self._write_timer is None:
+            self._write_timer = self._owner.set_timer(
+                self.WRITE_INTERVAL, self._write_when_due
+            )
+
+    async def _write_when_due(self) -> None:
+        """Write the gathered changes once the write timer fires."""
+        self._write_timer = None
+        await self.write()
+
+    def mark_read(self, article: Article | ArticleHeader) -> None:
+        """Mark an article as read.
+
+        Args:
+            article: The article to mark as read.
+        """
+        self._unread.discard(article.id)
+        self._read.add(article.id)
+        self._write_soon()
+
+    def mark_unread(self, article: Article | ArticleHeader) -> None:
+        """Mark an article as unread.
+
+        Args:
+            article: The article to mark as unread.
+
+        Note:
+            If the article is the one being viewed it won't then be marked
+            as read again when the dwell time is up.
+        """
+        if article.id == self._viewing:
+            self._stop_dwelling()
+        self._read.discard(article.id)
+        self._unread.add(article.id)
+        self._write_soon()
+
+    async def close(self, write: ReadStateWriter | None = None) -> None:
+        """Stop marking articles, writing any changes that are still gathered.
+
+        Args:
+            write: The function to write the changes with; the usual one if
+                not given.
+
+        Note:
+            The article being viewed, if it hasn't been viewed for long
+            enough yet, stays unread.
+        """
+        self._stop_dwelling()
+        self._viewing = None
+        await self.write(write)
+
+    async def write(self, write: ReadStateWriter | None = None) -> None:
+        """Write the gathered changes now.
+
+        Args:
+            write: The function to write the changes with; the usual one if
+                not given.
+        """
+        if self._write_timer is not None:
+            self._write_timer.stop()
+            self._write_timer = None
+        if not (self._read or self._unread):
+            return
+        read, unread = frozenset(self._read), frozenset(self._unread)
+        self._read.clear()
+        self._unread.clear()
+        await (write or self._write)(read, unread)
+
+
+### read_marker.py ends here
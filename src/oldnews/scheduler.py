@@ -0,0 +1,116 @@
+"""Provides a scheduler for running phases of work that depend on each other."""
+
+##############################################################################
+# Python imports.
+from asyncio import FIRST_EXCEPTION, Task, create_task, gather, wait
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+
+##############################################################################
+@dataclass(frozen=True)
+class _Phase:
+    """A phase of work to be run by the scheduler."""
+
+    name: str
+    """The name of the phase."""
+    work: Callable[[], Awaitable[Any]]
+    """The function that does the work of the phase."""
+    after: tuple[str, ...]
+    """The names of the phases that must finish before this one starts."""
+
+
+##############################################################################
+class PhaseScheduler:
+    """Runs phases of work, each as soon as the phases it depends on are done.
+
+    Phases that don't depend on each other run at the same time; a phase
+    that depends on others only starts once they have all finished, and can
+    get at what they returned with `result`.
+
+    Note:
+        A phase can only depend on phases that were added before it, so
+        there can never be a cycle.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the scheduler."""
+        self._phases: dict[str, _Phase] = {}
+        """The phases to run, keyed by name."""
+        self._tasks: dict[str, Task[Any]] = {}
+        """The tasks running the phases, keyed by name."""
+
+    def add(
+        self,
+        name: str,
+        work: Callable[[], Awaitable[Any]],
+        *,
+        after: Iterable[str] = (),
+    ) -> None:
+        """Add a phase to the scheduler.
+
+        Args:
+            name: The name of the phase.
+            work: The function that does the work of the phase.
+            after: The names of the phases that must finish before this one.
+
+        Raises:
+            ValueError: If the phase is already known, or depends on an
+                unknown phase.
+        """
+        if name in self._phases:
+            raise ValueError(f"Phase {name!r} has already been added")
+        if unknown := [phase for phase in after if phase not in self._phases]:
+            raise ValueError(f"Phase {name!r} depends on unknown phases: {unknown}")
+        self._phases[name] = _Phase(name, work, tuple(after))
+
+    def result(self, name: str) -> Any:
+        """Get the result of a phase that has finished.
+
+        Args:
+            name: The name of the phase.
+
+        Returns:
+            The value returned by the phase's work.
+        """
+        return self._tasks[name].result()
+
+    async def _run(self, phase: _Phase) -> Any:
+        """Run a phase once the phases it depends on have finished.
+
+        Args:
+            phase: The phase to run.
+
+        Returns:
+            The value returned by the phase's work.
+        """
+        for dependency in phase.after:
+            await self._tasks[dependency]
+        return await phase.work()
+
+    async def run(self) -> None:
+        """Run all of the phases.
+
+        Raises:
+            Exception: The first exception raised by a phase; any phases
+                still running when that happens are cancelled.
+        """
+        self._tasks = {
+            name: create_task(self._run(phase), name=name)
+            for name, phase in self._phases.items()
+        }
+        try:
+            pending: set[Task[Any]] = set(self._tasks.values())
+            while pending:
+                done, pending = await wait(pending, return_when=FIRST_EXCEPTION)
+                for task in done:
+                    if (error := task.exception()) is not None:
+                        raise error
+        finally:
+            for task in self._tasks.values():
+                task.cancel()
+            await gather(*self._tasks.values(), return_exceptions=True)
+
+
+### scheduler.py ends here
@@ -2,11 +2,12 @@
 
 ##############################################################################
 # Local imports.
+from .database_upgrade import DatabaseUpgrade
 from .login import Login
 from .main import Main
 
 ##############################################################################
 # Exports.
-__all__ = ["Login", "Main"]
+__all__ = ["DatabaseUpgrade", "Login", "Main"]
 
 ### __init__.py ends here
@@ -0,0 +1,71 @@
+"""Provides a screen for showing the progress of upgrading the local database."""
+
+##############################################################################
+# Textual imports.
+from textual.app import ComposeResult
+from textual.containers import Vertical
+from textual.getters import query_one
+from textual.screen import Screen
+from textual.widgets import Label, ProgressBar
+
+
+##############################################################################
+class DatabaseUpgrade(Screen[None]):
+    """A screen that shows the progress of upgrading the local database.
+
+    The screen stays blank unless there is progress to show, so when the
+    database is already up to date nothing is seen of it.
+    """
+
+    CSS = """
+    DatabaseUpgrade {
+        align: center middle;
+
+        &> Vertical {
+            display: none;
+            padding: 1 2;
+            width: auto;
+            min-width: 60;
+            height: auto;
+            background: $panel;
+            border: panel $border;
+
+            &.--upgrading {
+                display: block;
+            }
+
+            ProgressBar {
+                margin-top: 1;
+            }
+        }
+    }
+    """
+
+    dialog = query_one(Vertical)
+    """The dialog that shows the progress."""
+    description = query_one(Label)
+    """The description of the work being done."""
+    progress = query_one(ProgressBar)
+    """The progress of the work being done."""
+
+    def compose(self) -> ComposeResult:
+        """Compose the content of the screen."""
+        with Vertical() as dialog:
+            dialog.border_title = "Upgrading local data"
+            yield Label()
+            yield ProgressBar()
+
+    def show_progress(self, description: str, done: int, total: int) -> None:
+        """Show the progress of the upgrade.
+
+        Args:
+            description: The description of the work being done.
+            done: How much of the work has been done.
+            total: How much work there is to do; 0 if it isn't known.
+        """
+        self.dialog.add_class("--upgrading")
+        self.description.update(description)
+        self.progress.update(total=total or None, progress=done)
+
+
+### database_upgrade.py ends here
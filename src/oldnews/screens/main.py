@@ -2,10 +2,12 @@
 
 ##############################################################################
 # Python imports.
-from collections.abc import Awaitable, Callable
+from collections import deque
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from functools import partial
+from time import perf_counter
+from typing import Any
 from webbrowser import open as open_url
 
 ##############################################################################
@@ -20,9 +22,9 @@ from humanize import intcomma
 # OldAs imports.
 from oldas import (
     Article,
-    Articles,
     Folder,
     Folders,
+    OldASError,
     Session,
     State,
     Subscription,
@@ -42,8 +44,8 @@ from textual.app import ComposeResult
 from textual.getters import query_one
 from textual.message import Message
 from textual.reactive import var
+from textual.timer import Timer
 from textual.widgets import Footer, Header
-from textual.worker import Worker
 
 ##############################################################################
 # Textual enhanced imports.
@@ -71,6 +73,7 @@ from ..commands import (
     MoveSubscription,
     Next,
     NextUnread,
+    NextUnreadCategory,
     OpenArticle,
     OpenHomePage,
     Previous,
@@ -79,24 +82,31 @@ from ..commands import (
     Remove,
     Rename,
     SetSubscriptionContentFilter,
+    SyncInformation,
     ToggleCompact,
     ToggleShowAll,
     UserInformation,
 )
+from ..daemon import DaemonClient, changes_from_json
 from ..data import (
+    ArticleChanges,
+    ArticleHeader,
+    ArticleHeaders,
     LocalUnread,
+    Log,
+    SyncReport,
     clean_old_read_articles,
     data_dump,
     get_content_grab_filter_for,
-    get_local_articles,
+    get_local_article,
+    get_local_article_headers,
     get_local_folders,
     get_local_subscriptions,
     get_local_unread,
     last_grabbed_data_at,
     load_configuration,
     locally_mark_article_ids_read,
-    locally_mark_read,
-    locally_mark_unread,
+    locally_mark_article_ids_unread,
     move_subscription_articles,
     remove_folder_from_articles,
     remove_subscription_articles,
@@ -107,7 +117,9 @@ from ..data import (
     update_configuration,
 )
 from ..providers import MainCommands
+from ..read_marker import ReadMarker
 from ..sync import TheOldReaderSync
+from ..sync_schedule import SyncSchedule
 from ..widgets import (
     ArticleContent,
     ArticleList,
@@ -207,6 +219,7 @@ class Main(EnhancedScreen[None]):
         MoveSubscription,
         Next,
         NextUnread,
+        NextUnreadCategory,
         OpenArticle,
         OpenHomePage,
         Previous,
@@ -216,12 +229,22 @@ class Main(EnhancedScreen[None]):
         UserInformation,
         ToggleCompact,
         SetSubscriptionContentFilter,
+        SyncInformation,
     ]
 
     BINDINGS = Command.bindings(*COMMAND_MESSAGES)
 
     COMMANDS = {MainCommands}
 
+    SYNC_REPORTS_KEPT = 10
+    """The number of sync performance reports to keep."""
+
+    ARTICLE_MERGE_INTERVAL = 0.3
+    """The least time, in seconds, to gather article changes for before merging them into the display."""
+
+    ARTICLE_MERGE_SPACING = 4
+    """The multiple of the time the last merge took to gather article changes for, at least."""
+
     folders: var[Folders] = var(Folders)
     """The folders that subscriptions are assigned to."""
     subscriptions: var[Subscriptions] = var(Subscriptions)
@@ -230,7 +253,7 @@ class Main(EnhancedScreen[None]):
     """The navigation category that is currently selected."""
     unread: var[LocalUnread] = var(LocalUnread)
     """The unread counts."""
-    articles: var[Articles] = var(Articles)
+    articles: var[ArticleHeaders] = var(tuple)
     """The currently-viewed list of articles."""
     article: var[Article | None] = var(None)
     """The currently-viewed article."""
@@ -276,14 +299,48 @@ class Main(EnhancedScreen[None]):
         counts: LocalUnread
         """The new unread counts."""
 
+    @dataclass
+    class ArticlesChanged(Message):
+        """Message sent when a sync changes local articles."""
+
+        changes: ArticleChanges
+        """The changes that were made."""
+
+    @dataclass
     class SyncFinished(Message):
         """Message sent when a sync from TheOldReader is finished."""
 
+        articles_changed: bool = True
+        """Did the sync change any local articles?"""
+
     def __init__(self, session: Session) -> None:
         """Initialise the main screen."""
         super().__init__()
         self._session = session
         """The TOR session."""
+        configuration = load_configuration()
+        self._sync_schedule = SyncSchedule(
+            configuration.background_sync_interval,
+            configuration.background_sync_jitter,
+            configuration.background_sync_maximum_interval,
+        )
+        """The schedule for background syncs with TheOldReader."""
+        self._background_sync_timer: Timer | None = None
+        """The timer for the next background sync."""
+        self._sync_reports: deque[SyncReport] = deque(maxlen=self.SYNC_REPORTS_KEPT)
+        """The performance reports of the most recent syncs."""
+        self._pending_changes = ArticleChanges()
+        """Article changes that are waiting to be merged into the display."""
+        self._merge_timer: Timer | None = None
+        """The timer for the next merge of article changes."""
+        self._merge_time = 0.0
+        """The time, in seconds, that the last merge of article changes took."""
+        self._read_marker = ReadMarker(
+            self, configuration.mark_read_after, self._write_read_state
+        )
+        """Decides when articles get marked as read, and batches up the marking."""
+        self._daemon: DaemonClient | None = None
+        """The connection to the sync daemon, if we're attached to one."""
 
     def compose(self) -> ComposeResult:
         """Compose the content of the main screen."""
@@ -305,6 +362,15 @@ class Main(EnhancedScreen[None]):
         self.compact_ui = load_configuration().compact_ui
         self._load_locally()
 
+    async def on_unmount(self) -> None:
+        """Write any changes to read state still waiting to be written.
+
+        Note:
+            The screen's workers have been cancelled by the time it's
+            unmounted, so the changes are written to TheOldReader here.
+        """
+        await self._read_marker.close(partial(self._write_read_state, wait=True))
+
     def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
         """Check if an action is possible to perform right now.
 
@@ -356,6 +422,8 @@ class Main(EnhancedScreen[None]):
             return self.articles is not None and any(
                 article.is_unread for article in self.articles
             )
+        if action == NextUnreadCategory.action_name():
+            return any(self.unread.values())
         if action == Copy.action_name():
             return (
                 self.navigation.has_focus
@@ -373,6 +441,8 @@ class Main(EnhancedScreen[None]):
             )
         if action == UserInformation.action_name():
             return self._session.logged_in
+        if action == SyncInformation.action_name():
+            return bool(self._sync_reports)
         return True
 
     @on(SubTitle)
@@ -414,33 +484,103 @@ class Main(EnhancedScreen[None]):
         self.unread = message.counts
         self.post_message(self.SubTitle())
 
+    def _show_articles(self, articles: ArticleHeaders) -> None:
+        """Show a list of articles.
+
+        Args:
+            articles: The articles to show.
+        """
+        self.articles = articles
+        # If the result is there's nothing showing, tidy up the content
+        # side of the display and maybe move focus back to navigation.
+        if not self.articles:
+            self.article = None
+            if self.article_view.has_focus_within:
+                self.navigation.focus()
+
     async def _refresh_article_list(self) -> None:
         """Refresh the content of the article list."""
         if self.selected_category:
-            self.articles = await get_local_articles(
-                self.selected_category, not self.show_all
+            self._show_articles(
+                await get_local_article_headers(
+                    self.selected_category, not self.show_all
+                )
+            )
+
+    @on(ArticlesChanged)
+    def _articles_changed(self, message: ArticlesChanged) -> None:
+        """Handle a sync changing local articles.
+
+        Args:
+            message: The message with the changes.
+
+        Note:
+            Changes are gathered up and merged into the display no more
+            than once every `ARTICLE_MERGE_INTERVAL` seconds; if merging is
+            slow, they're gathered for longer still, so that merging
+            doesn't take over while a sync is running.
+        """
+        self._pending_changes |= message.changes
+        if self._merge_timer is None:
+            self._merge_timer = self.set_timer(
+                max(
+                    self.ARTICLE_MERGE_INTERVAL,
+                    self.ARTICLE_MERGE_SPACING * self._merge_time,
+                ),
+                self._merge_when_due,
+            )
+
+    async def _merge_when_due(self) -> None:
+        """Merge the pending article changes once the merge timer fires."""
+        self._merge_timer = None
+        await self._merge_article_changes()
+
+    async def _merge_article_changes(self) -> None:
+        """Merge any pending article changes into the display."""
+        if self._merge_timer is not None:
+            self._merge_timer.stop()
+            self._merge_timer = None
+        if not (changes := self._pending_changes):
+            return
+        self._pending_changes = ArticleChanges()
+        Log().debug("Merging article changes: %s", changes)
+        started = perf_counter()
+        self.post_message(
+            self.NewUnread(await get_local_unread(self.folders, self.subscriptions))
+        )
+        if (category := self.selected_category) is not None:
+            changed = await get_local_article_headers(
+                category, not self.show_all, changes.article_ids
             )
-            # If the result is there's nothing showing, tidy up the content
-            # side of the display and maybe move focus back to navigation.
-            if not self.articles:
-                self.article = None
-                if self.article_view.has_focus_within:
-                    self.navigation.focus()
+            # Only merge if we're still looking at the same category.
+            if category == self.selected_category:
+                self._show_articles(changes.merged_into(self.articles, changed))
+        self._merge_time = perf_counter() - started
 
     @work(exclusive=True)
     async def _load_locally(self) -> None:
         """Load up any locally-held data."""
+        if (daemon := await DaemonClient.attach()) is not None:
+            Log().info("Attached to the sync daemon")
+            self._daemon = daemon
+            self._listen_to_daemon(daemon)
         if subscriptions := await get_local_subscriptions():
             self.post_message(self.NewSubscriptions(subscriptions))
         if folders := await get_local_folders():
             self.post_message(self.NewFolders(folders))
-        if cleaned := await clean_old_read_articles(
-            timedelta(days=load_configuration().local_history)
+        # The sync daemon, if there is one, looks after cleaning up.
+        if self._daemon is None and (
+            cleaned := await clean_old_read_articles(
+                timedelta(days=load_configuration().local_history)
+            )
         ):
             self.notify(f"Old read articles cleaned from local storage: {cleaned}")
         if unread := await get_local_unread(folders, subscriptions):
             self.post_message(self.NewUnread(unread))
         await self._refresh_article_list()
+        # The sync daemon, if there is one, looks after syncing.
+        if self._daemon is not None:
+            return
         # If we've never grabbed data from ToR before, or if it's been long enough...
         if (last_grabbed := await last_grabbed_data_at()) is None or (
             (datetime.now(UTC) - last_grabbed).seconds
@@ -448,24 +588,127 @@ class Main(EnhancedScreen[None]):
         ):
             # ...kick off a refresh from TheOldReader.
             self.post_message(RefreshFromTheOldReader())
+        else:
+            # ...otherwise leave it to the background sync.
+            self._schedule_background_sync()
+
+    async def _daemon_event(self, event: dict[str, Any]) -> None:
+        """Act on an event from the sync daemon.
+
+        Args:
+            event: The event to act on.
+        """
+        match event["kind"]:
+            case "step":
+                self.post_message(self.SubTitle(event["text"]))
+            case "result":
+                self.notify(event["text"], markup=False)
+            case "folders":
+                self.post_message(self.NewFolders(await get_local_folders()))
+            case "subscriptions":
+                self.post_message(
+                    self.NewSubscriptions(await get_local_subscriptions())
+                )
+            case "unread":
+                self.post_message(self.NewUnread(event["counts"]))
+            case "articles_changed":
+                self.post_message(
+                    self.ArticlesChanged(changes_from_json(event["changes"]))
+                )
+            case "sync_finished":
+                self.post_message(self.SyncFinished(event["articles_changed"]))
+            case "sync_failed":
+                self.notify(
+                    event["error"],
+                    title="Sync with TheOldReader failed",
+                    severity="error",
+                    timeout=8,
+                    markup=False,
+                )
+                self.post_message(self.SubTitle())
+            case "error":
+                self.notify(
+                    event["error"],
+                    title=event.get("title", "Sync daemon error"),
+                    severity="error",
+                    markup=False,
+                )
+
+    @work(group="daemon")
+    async def _listen_to_daemon(self, daemon: DaemonClient) -> None:
+        """Listen for events from the sync daemon, and act on them.
+
+        Args:
+            daemon: The connection to the sync daemon.
+
+        Note:
+            If the connection to the daemon is lost, syncing with
+            TheOldReader goes back to being done directly.
+        """
+        try:
+            async for event in daemon.events():
+                await self._daemon_event(event)
+        finally:
+            await daemon.detach()
+        self._daemon = None
+        self.notify(
+            "Lost the connection to the sync daemon; syncing directly with TheOldReader",
+            severity="warning",
+        )
+        self._schedule_background_sync()
 
     @on(SyncFinished)
-    async def _sync_finished(self) -> None:
-        """Clean up after a sync from TheOldReader has finished."""
+    async def _sync_finished(self, message: SyncFinished) -> None:
+        """Clean up after a sync from TheOldReader has finished.
+
+        Args:
+            message: The message saying the sync has finished.
+        """
         # Ensure the selected category (if there is one) is refreshed
         # because it could be that a folder or subscription got renamed.
         if self.selected_category:
             self.selected_category = self.navigation.current_category
-        # Ensure that any article list that is showing gets a refresh.
-        await self._refresh_article_list()
+        # If the articles changed, make sure that all of the changes have
+        # made it into the display.
+        if message.articles_changed:
+            await self._merge_article_changes()
         # Put the title of the application in its default state.
         self.post_message(self.SubTitle())
 
+    @property
+    def _sync_running(self) -> bool:
+        """Is a sync with TheOldReader currently running?"""
+        return any(
+            worker.group == "sync" and worker.is_running for worker in self.workers
+        )
+
+    def _schedule_background_sync(self) -> None:
+        """Schedule the next background sync with TheOldReader."""
+        if self._background_sync_timer is not None:
+            self._background_sync_timer.stop()
+            self._background_sync_timer = None
+        if self._sync_schedule.enabled:
+            self._background_sync_timer = self.set_timer(
+                self._sync_schedule.next_delay, self._background_sync
+            )
+
+    def _background_sync(self) -> None:
+        """Perform a background sync with TheOldReader."""
+        self._background_sync_timer = None
+        if self._sync_running:
+            Log().debug("Skipping background sync as a sync is already running")
+            self._schedule_background_sync()
+        else:
+            Log().info("Starting background sync")
+            self.post_message(RefreshFromTheOldReader())
+
     @on(RefreshFromTheOldReader)
-    @work(exclusive=True)
+    @work(exclusive=True, group="sync")
     async def action_refresh_from_the_old_reader_command(self) -> None:
         """Load the main data from TheOldReader."""
-        await TheOldReaderSync(
+        if self._daemon is not None and await self._daemon.request_sync():
+            return
+        sync = TheOldReaderSync(
             self._session,
             on_new_step=Pipe[str, bool](self.SubTitle, self.post_message),
             on_new_result=partial(self.notify, markup=False),
@@ -474,10 +717,32 @@ class Main(EnhancedScreen[None]):
                 self.NewSubscriptions, self.post_message
             ),
             on_new_unread=Pipe[LocalUnread, bool](self.NewUnread, self.post_message),
-            on_sync_finished=Pipe[Pipe.Nullary, bool](
-                self.SyncFinished, self.post_message
+            on_articles_changed=Pipe[ArticleChanges, bool](
+                self.ArticlesChanged, self.post_message
             ),
-        ).sync()
+            on_sync_finished=Pipe[bool, bool](self.SyncFinished, self.post_message),
+            on_sync_report=self._sync_reports.append,
+        )
+        try:
+            await sync.sync()
+        except Exception as error:
+            # Whatever went wrong, be it with TheOldReader or with the local
+            # database (which the sync daemon or another instance could be
+            # writing to), report it and leave the schedule to try again.
+            Log().error("Sync with TheOldReader failed: %s", error)
+            self._sync_schedule.failed()
+            self.notify(
+                str(error),
+                title="Sync with TheOldReader failed",
+                severity="error",
+                timeout=8,
+                markup=False,
+            )
+            self.post_message(self.SubTitle())
+        else:
+            self._sync_schedule.synced(sync.articles_changed)
+        finally:
+            self._schedule_background_sync()
 
     @on(Navigation.CategorySelected)
     async def _handle_navigaion_selection(
@@ -488,7 +753,15 @@ class Main(EnhancedScreen[None]):
         Args:
             message: The message to react to.
         """
-        self.selected_category = message.category
+        await self._select_category(message.category)
+
+    async def _select_category(self, category: Folder | Subscription) -> None:
+        """Select a category and show its articles.
+
+        Args:
+            category: The category to select.
+        """
+        self.selected_category = category
         self.article = None
         await self._refresh_article_list()
         self.article_list.focus()
@@ -497,61 +770,101 @@ class Main(EnhancedScreen[None]):
         """Handle changes to the show all flag."""
         await self._refresh_article_list()
 
-    @work
-    async def _remotely_mark_read(self, article: Article) -> None:
-        """Mark an article as read on the TheOldReader server.
+    def _remote_call_failed(self, error: OldASError, title: str) -> None:
+        """Report that a call to TheOldReader failed.
 
         Args:
-            article: The article to mark as read.
+            error: The error that occurred.
+            title: The title for the report.
         """
-        await article.mark_read(self._session)
+        Log().error("%s: %s", title, error)
+        self.notify(
+            str(error),
+            title=title,
+            severity="error",
+            timeout=8,
+            markup=False,
+        )
+
+    async def _remotely_mark(
+        self, read: frozenset[str], unread: frozenset[str]
+    ) -> None:
+        """Mark articles as read or unread on the TheOldReader server.
+
+        Args:
+            read: The IDs of the articles to mark as read.
+            unread: The IDs of the articles to mark as unread.
+        """
+        try:
+            if read:
+                await self._session.add_tag(sorted(read), State.READ)
+            if unread:
+                await self._session.remove_tag(sorted(unread), State.READ)
+        except OldASError as error:
+            self._remote_call_failed(error, "Failed to mark on TheOldReader")
 
     @work
-    async def _remotely_mark_unread(self, article: Article) -> None:
-        """Mark an article as unread on the TheOldReader server.
+    async def _remotely_mark_in_background(
+        self, read: frozenset[str], unread: frozenset[str]
+    ) -> None:
+        """Mark articles as read or unread on the TheOldReader server, in the background.
 
         Args:
-            article: The article to mark as unread.
+            read: The IDs of the articles to mark as read.
+            unread: The IDs of the articles to mark as unread.
         """
-        await article.mark_unread(self._session)
+        await self._remotely_mark(read, unread)
 
-    async def _mark(
-        self,
-        locally_mark: Callable[[Article], Awaitable[None]],
-        remotely_mark: Callable[[Article], Worker[None]],
-        article: Article,
+    async def _write_read_state(
+        self, read: frozenset[str], unread: frozenset[str], *, wait: bool = False
     ) -> None:
-        """Mark an article with the given methods and then update the display.
+        """Write a batch of changes to the read state of articles.
 
         Args:
-            locally_mark: The function to locally mark the article.
-            remotely_mark: The function to locally mark the article.
-            article: The article to mark.
+            read: The IDs of the articles to mark as read.
+            unread: The IDs of the articles to mark as unread.
+            wait: Wait for the changes to be written to TheOldReader, rather
+                than writing them in the background, and don't show them.
+
+        Note:
+            The changes are written locally and to TheOldReader, and then
+            merged into the display along with any other pending changes.
+            If we're attached to the sync daemon it's asked to write them
+            instead, and it tells us about the changes once it has.
         """
-        remotely_mark(article)
-        await locally_mark(article)
-        self.post_message(
-            self.NewUnread(await get_local_unread(self.folders, self.subscriptions))
-        )
-        await self._refresh_article_list()
+        if self._daemon is not None and await self._daemon.mark(read, unread):
+            return
+        if not wait:
+            self._remotely_mark_in_background(read, unread)
+        if read:
+            await locally_mark_article_ids_read(read)
+        if unread:
+            await locally_mark_article_ids_unread(unread)
+        if wait:
+            await self._remotely_mark(read, unread)
+        else:
+            self._pending_changes |= ArticleChanges(read=read, unread=unread)
+            await self._merge_article_changes()
 
-    async def _mark_read(self, article: Article) -> None:
-        """Mark the given article as read.
+    async def _mark_read(self, article: Article | ArticleHeader) -> None:
+        """Mark the given article as read, right away.
 
         Args:
             article: The article to mark as read.
         """
         if article.is_unread:
-            await self._mark(locally_mark_read, self._remotely_mark_read, article)
+            self._read_marker.mark_read(article)
+            await self._read_marker.write()
 
-    async def _mark_unread(self, article: Article) -> None:
-        """Mark the given article as unread.
+    async def _mark_unread(self, article: Article | ArticleHeader) -> None:
+        """Mark the given article as unread, right away.
 
         Args:
             article: The article to mark as unread.
         """
         if article.is_read:
-            await self._mark(locally_mark_unread, self._remotely_mark_unread, article)
+            self._read_marker.mark_unread(article)
+            await self._read_marker.write()
 
     @on(ArticleContent.Displayed)
     async def _article_in_view(self, message: ArticleContent.Displayed) -> None:
@@ -561,16 +874,31 @@ class Main(EnhancedScreen[None]):
             message: The message letting us known which article was displayed.
         """
         self.article_content.focus()
-        await self._mark_read(message.article)
+        if load_configuration().article_read_ahead:
+            self.article_content.read_ahead(
+                article.id for article in self.article_list.articles_around_highlight()
+            )
+        self._read_marker.viewing(message.article)
+
+    def _watch_article(self) -> None:
+        """React to the article being viewed changing."""
+        # The article that was being viewed is no longer being read; the
+        # new one, if there is one, will be noted once it's displayed.
+        self._read_marker.viewing(None)
 
     @on(ArticleList.ViewArticle)
-    def _view_article(self, message: ArticleList.ViewArticle) -> None:
+    async def _view_article(self, message: ArticleList.ViewArticle) -> None:
         """Handle a request to view an article.
 
         Args:
             message: The message requesting an article be viewed.
+
+        Note:
+            The article list only holds the headers of the articles it
+            shows, so the full article is loaded here.
         """
-        self.article = message.article
+        if (article := await get_local_article(message.article.id)) is not None:
+            self.article = article
 
     def action_toggle_show_all_command(self) -> None:
         """Toggle showing all/unread."""
@@ -642,6 +970,19 @@ class Main(EnhancedScreen[None]):
         else:
             self.article_list.select_previous_unread_article()
 
+    async def action_next_unread_category_command(self) -> None:
+        """Go to the first unread article in the next category with unread articles."""
+        reading = self.article is not None
+        if not self.navigation.highlight_next_unread_category():
+            return
+        if (category := self.navigation.current_category) is None:
+            return
+        await self._select_category(category)
+        if reading:
+            self.article_list.select_first_unread_article()
+        else:
+            self.article_list.highlight_first_unread_article()
+
     def action_open_article_command(self) -> None:
         """Open the current article in a web browser."""
         if self.article is not None:
@@ -681,14 +1022,27 @@ class Main(EnhancedScreen[None]):
                 f"This will mark {len(ids_to_mark_read)} article{plural} as read.",
             )
         ):
-            if await self._session.add_tag(ids_to_mark_read, State.READ):
-                await locally_mark_article_ids_read(ids_to_mark_read)
-                self.post_message(
-                    self.NewUnread(
-                        await get_local_unread(self.folders, self.subscriptions)
+            try:
+                if self._daemon is not None and await self._daemon.mark(
+                    ids_to_mark_read, ()
+                ):
+                    marked = True
+                elif marked := await self._session.add_tag(
+                    ids_to_mark_read, State.READ
+                ):
+                    await locally_mark_article_ids_read(ids_to_mark_read)
+                    self.post_message(
+                        self.NewUnread(
+                            await get_local_unread(self.folders, self.subscriptions)
+                        )
                     )
+                    await self._refresh_article_list()
+            except OldASError as error:
+                self._remote_call_failed(
+                    error, "Failed to mark as read on TheOldReader"
                 )
-                await self._refresh_article_list()
+                return
+            if marked:
                 self.notify(
                     f"{intcomma(len(ids_to_mark_read))} article{plural} marked read for {category_description}",
                     markup=False,
@@ -798,17 +1152,22 @@ class Main(EnhancedScreen[None]):
                         f"Moving new subscription into '{subscription.folder}'",
                         markup=False,
                     )
-                    if await Subscriptions.move(
-                        self._session, result.stream_id, subscription.folder
-                    ):
-                        self.notify("Moved")
-                    else:
-                        self.notify(
-                            f"Could not move the new subscription into '{subscription.folder}'",
-                            title="Move failed",
-                            timeout=8,
-                            markup=False,
+                    try:
+                        moved = await Subscriptions.move(
+                            self._session, result.stream_id, subscription.folder
                         )
+                    except OldASError as error:
+                        self._remote_call_failed(error, "Move failed")
+                    else:
+                        if moved:
+                            self.notify("Moved")
+                        else:
+                            self.notify(
+                                f"Could not move the new subscription into '{subscription.folder}'",
+                                title="Move failed",
+                                timeout=8,
+                                markup=False,
+                            )
                 self.post_message(RefreshFromTheOldReader())
 
     @work
@@ -821,7 +1180,14 @@ class Main(EnhancedScreen[None]):
         if new_name := await self.app.push_screen_wait(
             ModalInput("Subscription name", subscription.title)
         ):
-            if await Subscriptions.rename(self._session, subscription, new_name):
+            try:
+                renamed = await Subscriptions.rename(
+                    self._session, subscription, new_name
+                )
+            except OldASError as error:
+                self._remote_call_failed(error, "Rename failed")
+                return
+            if renamed:
                 self.notify("Renamed")
                 self.post_message(RefreshFromTheOldReader())
             else:
@@ -837,7 +1203,12 @@ class Main(EnhancedScreen[None]):
         if new_name := await self.app.push_screen_wait(
             ModalInput("Subscription name", folder.name)
         ):
-            if await Folders.rename(self._session, folder, new_name):
+            try:
+                renamed = await Folders.rename(self._session, folder, new_name)
+            except OldASError as error:
+                self._remote_call_failed(error, "Rename failed")
+                return
+            if renamed:
                 await rename_folder_for_articles(folder, new_name)
                 await rename_folder_in_navigation_state(folder, new_name)
                 self.notify("Renamed")
@@ -873,7 +1244,12 @@ class Main(EnhancedScreen[None]):
                 "Are you sure you wish to remove the subscription?",
             )
         ):
-            if await Subscriptions.remove(self._session, subscription):
+            try:
+                removed = await Subscriptions.remove(self._session, subscription)
+            except OldASError as error:
+                self._remote_call_failed(error, "Remove failed")
+                return
+            if removed:
                 await remove_subscription_articles(subscription)
                 self.notify(f"Removed {subscription.title}", markup=False)
                 self.post_message(RefreshFromTheOldReader())
@@ -892,7 +1268,12 @@ class Main(EnhancedScreen[None]):
                 f"Remove {folder.name}", "Are you sure you wish to remove the folder?"
             )
         ):
-            if await Folders.remove(self._session, folder):
+            try:
+                removed = await Folders.remove(self._session, folder)
+            except OldASError as error:
+                self._remote_call_failed(error, "Remove failed")
+                return
+            if removed:
                 await remove_folder_from_articles(folder)
                 self.notify(f"Removed {folder.name}")
                 self.post_message(RefreshFromTheOldReader())
@@ -919,7 +1300,14 @@ class Main(EnhancedScreen[None]):
                 MoveSubscriptionTo(subscription, self.folders)
             )
         ) is not None:
-            if await Subscriptions.move(self._session, subscription, target_folder):
+            try:
+                moved = await Subscriptions.move(
+                    self._session, subscription, target_folder
+                )
+            except OldASError as error:
+                self._remote_call_failed(error, "Move failed")
+                return
+            if moved:
                 await move_subscription_articles(
                     subscription, subscription.folder_id, target_folder
                 )
@@ -964,9 +1352,25 @@ class Main(EnhancedScreen[None]):
 
     async def action_user_information_command(self) -> None:
         """Show information about the logged-in user."""
+        try:
+            user = await User.load(self._session)
+        except OldASError as error:
+            self._remote_call_failed(error, "Failed to get user information")
+            return
+        self.app.push_screen(
+            InformationDisplay("Current User Information", data_dump(user))
+        )
+
+    def action_sync_information_command(self) -> None:
+        """Show performance reports for the most recent syncs."""
         self.app.push_screen(
             InformationDisplay(
-                "Current User Information", data_dump(await User.load(self._session))
+                "Sync Performance",
+                (
+                    information
+                    for report in reversed(self._sync_reports)
+                    for information in data_dump(report)
+                ),
             )
         )
 
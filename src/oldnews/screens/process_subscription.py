@@ -2,7 +2,7 @@
 
 ##############################################################################
 # OldAS imports.
-from oldas import Session, Subscriptions
+from oldas import OldASError, Session, Subscriptions
 from oldas.subscriptions import SubscribeResult
 
 ##############################################################################
@@ -77,7 +77,13 @@ class ProcessSubscription(ModalScreen[SubscribeResult]):
     @work
     async def _request_subscription(self) -> None:
         """Process the request."""
-        self.dismiss(await Subscriptions.add(self._session, self._feed))
+        try:
+            result = await Subscriptions.add(self._session, self._feed)
+        except OldASError as error:
+            result = SubscribeResult(
+                query=self._feed, number_of_results=0, stream_id=None, error=str(error)
+            )
+        self.dismiss(result)
 
     def on_mount(self) -> None:
         """Start the work once the DOM is ready."""
@@ -0,0 +1,91 @@
+"""Provides the application's TheOldReader API session class."""
+
+##############################################################################
+# Python imports.
+from collections.abc import Awaitable
+from typing import Any
+
+##############################################################################
+# httpx imports.
+from httpx import AsyncClient, Response
+
+##############################################################################
+# OldAS imports.
+from oldas import Session
+
+##############################################################################
+# Local imports.
+from .data import load_configuration, tally
+from .governor import GovernedTransport
+
+
+##############################################################################
+class OldNewsSession(Session):
+    """The TheOldReader API session for the application.
+
+    This is the normal `oldas` session, which also keeps track of how much
+    it has been talking to TheOldReader, and which makes all of its calls
+    through a `GovernedTransport` so that they're rate limited and retried.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialise the session.
+
+        Args:
+            args: The positional arguments for the `oldas` session.
+            kwargs: The keyword arguments for the `oldas` session.
+        """
+        super().__init__(*args, **kwargs)
+        self._requests_made = 0
+        """The number of requests made to TheOldReader."""
+        self._bytes_received = 0
+        """The number of bytes received from TheOldReader."""
+        configuration = load_configuration()
+        self._governor = GovernedTransport(
+            configuration.api_requests_per_second,
+            configuration.api_request_burst,
+            configuration.api_retries,
+        )
+        """The transport that governs the calls made to TheOldReader."""
+
+    @property
+    def _web_client(self) -> AsyncClient:
+        """The HTTPX client, which makes its calls through the governor."""
+        if self._web_client_ is None:
+            self._web_client_ = AsyncClient(
+                timeout=self._timeout, transport=self._governor
+            )
+        return self._web_client_
+
+    @property
+    def requests_made(self) -> int:
+        """The number of requests made to TheOldReader so far."""
+        return self._requests_made
+
+    @property
+    def bytes_received(self) -> int:
+        """The number of bytes received from TheOldReader so far."""
+        return self._bytes_received
+
+    @property
+    def retries(self) -> int:
+        """The number of calls to TheOldReader that have been retried so far."""
+        return self._governor.retries_made
+
+    async def _call(self, call: Awaitable[Response]) -> Response:
+        """Make a call out to the API.
+
+        Args:
+            call: The call to make.
+
+        Returns:
+            The response.
+        """
+        self._requests_made += 1
+        response = await super()._call(call)
+        self._bytes_received += len(response.content)
+        tally(bytes_received=len(response.content))
+        return response
+
+
+### session.py ends here
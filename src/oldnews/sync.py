@@ -2,9 +2,11 @@
 
 ##############################################################################
 # Python imports.
-from collections.abc import AsyncIterator, Callable, Iterable
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from time import perf_counter
 from typing import Any
 
 ##############################################################################
@@ -24,24 +26,34 @@ from oldas import (
 )
 
 ##############################################################################
+from .adaptive_size import AdaptiveSize
 from .data import (
+    ArticleChanges,
+    BatchSizes,
+    Capped,
     LocalUnread,
     Log,
+    SyncPhase,
+    SyncReport,
     get_local_subscriptions,
     get_local_unread,
     get_unread_article_ids,
     last_grabbed_data_at,
+    load_batch_sizes,
     load_configuration,
     locally_known_article_ids,
     locally_mark_article_ids_read,
     locally_mark_article_ids_unread,
+    measuring,
     remember_we_last_grabbed_at,
     remove_subscription_articles,
+    save_batch_sizes,
     save_local_articles,
     save_local_folders,
     save_local_subscriptions,
 )
 from .data.models import LocalSubscriptionGrabFilter
+from .scheduler import PhaseScheduler
 
 ##############################################################################
 type Callback = Callable[[], Any] | None
@@ -49,6 +61,13 @@ type Callback = Callable[[], Any] | None
 type CallbackWith[T] = Callable[[T], Any] | None
 """Type of callback with a single argument."""
 
+##############################################################################
+PAGE_TIME_TARGET = 1.0
+"""The number of seconds a page of articles from TheOldReader should take."""
+
+SAVE_TIME_TARGET = 0.25
+"""The number of seconds saving a batch of articles should take."""
+
 
 ##############################################################################
 @dataclass
@@ -67,17 +86,80 @@ class TheOldReaderSync:
     """Function to call when new subscriptions are acquired."""
     on_new_unread: CallbackWith[LocalUnread] = None
     """Function to call when new unread counts are calculated."""
-    on_sync_finished: Callback = None
-    """Function to call when the sync has finished."""
+    on_articles_changed: CallbackWith[ArticleChanges] = None
+    """Function to call as local articles are changed by the sync.
+
+    This is called for each batch of changes as it is saved, so that
+    anything showing articles can keep up while the sync runs.
+    """
+    on_sync_finished: CallbackWith[bool] = None
+    """Function to call when the sync has finished.
+
+    The function is passed a flag that says if the sync changed any local
+    articles.
+    """
+    on_sync_report: CallbackWith[SyncReport] = None
+    """Function to call with the performance report for the sync."""
 
     def __post_init__(self) -> None:
         """Initialise the sync object."""
-        self._batch_size = load_configuration().article_download_batch_size
-        """The size of the article batch to download and save."""
+        configuration = load_configuration()
+        remembered = load_batch_sizes()
+        self._page_size = AdaptiveSize(
+            remembered.page_size
+            if remembered
+            else configuration.article_download_batch_size,
+            configuration.article_page_size_minimum,
+            configuration.article_page_size_maximum,
+            PAGE_TIME_TARGET,
+        )
+        """The number of articles to ask TheOldReader for in each page."""
+        self._save_size = AdaptiveSize(
+            remembered.save_size
+            if remembered
+            else configuration.article_download_batch_size,
+            configuration.article_save_batch_size_minimum,
+            configuration.article_save_batch_size_maximum,
+            SAVE_TIME_TARGET,
+        )
+        """The number of downloaded articles to save in each batch."""
         self._last_sync: datetime | None = None
         """The time at which we last did a sync."""
         self._first_sync = True
         """Is this our first ever sync?"""
+        self._articles_changed = False
+        """Did the sync change any local articles?"""
+        self._downloaded: set[str] = set()
+        """The IDs of the articles downloaded during the sync."""
+        self._report = SyncReport()
+        """The performance report for the sync."""
+
+    @property
+    def articles_changed(self) -> bool:
+        """Did the most recent sync change any local articles?"""
+        return self._articles_changed
+
+    @property
+    def report(self) -> SyncReport:
+        """The performance report for the most recent sync."""
+        return self._report
+
+    @contextmanager
+    def _measure(self, phase: str) -> Iterator[SyncPhase]:
+        """Measure the performance of a phase of the sync.
+
+        Args:
+            phase: The name of the phase being measured.
+
+        Yields:
+            The metrics for the phase, so that items can be counted.
+
+        Note:
+            Measurements for the same phase are accumulated, so this can be
+            used multiple times for a single phase.
+        """
+        with measuring(self._report.phase(phase)) as metrics:
+            yield metrics
 
     def _step(self, step: str, *, log: bool = True) -> None:
         """Mark a new step.
@@ -101,36 +183,112 @@ class TheOldReaderSync:
         if self.on_new_result:
             self.on_new_result(result)
 
-    async def _download(self, stream: AsyncIterator[Article], description: str) -> int:
+    def _changed(self, changes: ArticleChanges) -> None:
+        """Report that local articles have been changed.
+
+        Args:
+            changes: The changes that were made.
+        """
+        self._articles_changed |= bool(changes)
+        if changes and self.on_articles_changed:
+            self.on_articles_changed(changes)
+
+    async def _save(self, articles: list[Article], phase: str) -> None:
+        """Save a batch of downloaded articles.
+
+        Args:
+            articles: The articles to save.
+            phase: The name of the phase the save is part of.
+        """
+        Log().debug("Saving batch of articles: %s", len(articles))
+        with self._measure(f"{phase}: save") as metrics:
+            started = perf_counter()
+            saved = await save_local_articles(Articles(articles))
+            self._save_size.observe(perf_counter() - started, len(articles))
+            metrics.items += len(articles)
+            metrics.written += saved.written
+            metrics.skipped += saved.skipped
+        Log().debug("Saved batch of articles: %s", saved)
+        self._changed(
+            ArticleChanges(
+                added=frozenset(saved.added_ids), updated=frozenset(saved.updated_ids)
+            )
+        )
+
+    async def _stream_new_since(
+        self, since: datetime, stream: Subscription | None = None
+    ) -> AsyncIterator[Article]:
+        """Stream all the articles newer than a given time.
+
+        Args:
+            since: The time from which to get articles.
+            stream: The subscription to get the articles for, or `None` for all.
+
+        Yields:
+            The articles.
+
+        Note:
+            This does the same job as `Articles.stream_new_since`, but each
+            page is asked for with the current page size, and how long the
+            page took is used to tune the page size.
+        """
+        continuation: str | None = ""
+        while True:
+            started = perf_counter()
+            page = await self.session.get(
+                "stream/contents",
+                s="" if stream is None else stream.id,
+                c=continuation,
+                n=self._page_size.size,
+                ot=int(since.timestamp()),  # codespell:ignore ot
+                # The continuation of "newer than" filtered items only seems
+                # to work if the result is ordered; so go oldest first.
+                r="o",
+            )
+            articles = [Article.from_json(article) for article in page.get("items", [])]
+            self._page_size.observe(perf_counter() - started, len(articles))
+            for article in articles:
+                yield article
+            if not (continuation := page.get("continuation")):
+                break
+
+    async def _download(
+        self, stream: AsyncIterator[Article], description: str, phase: str
+    ) -> int:
         """Download and save articles from an article stream.
 
         Args:
             stream: The stream to download.
             description: The description of the download.
+            phase: The name of the phase the download is part of.
 
         Returns:
             The number of articles downloaded.
         """
         loaded = 0
         save_batch: list[Article] = []
-        async for article in stream:
+        articles = aiter(stream)
+        while True:
+            with self._measure(f"{phase}: download") as metrics:
+                try:
+                    article = await anext(articles)
+                except StopAsyncIteration:
+                    break
+                metrics.items += 1
             # I've encountered articles that don't have an origin stream ID,
             # which means that I can't relate them back to a stream, which
             # means I'll never see them anyway...
             if not article.origin.stream_id:
                 continue
             save_batch.append(article)
+            self._downloaded.add(article.id)
             loaded += 1
-            if (loaded % self._batch_size) == 0:
+            if len(save_batch) >= self._save_size.size:
                 self._step(f"{description}: {intcomma(loaded)}", log=False)
-                Log().debug(f"Saving batch of articles: {len(save_batch)}")
-                await save_local_articles(Articles(save_batch))
-                Log().debug(f"Saved batch of articles: {len(save_batch)}")
+                await self._save(save_batch, phase)
                 save_batch = []
         if save_batch:
-            Log().debug(f"Saving final batch of articles: {len(save_batch)}")
-            await save_local_articles(Articles(save_batch))
-            Log().debug(f"Saved final batch of articles: {len(save_batch)}")
+            await self._save(save_batch, phase)
         return loaded
 
     async def _catchup_read(
@@ -143,8 +301,11 @@ class TheOldReaderSync:
             local_unread: The IDs of articles unread locally.
         """
         if mark_as_read := local_unread - remote_unread:
-            Log().debug(f"Articles found as marked read elsewhere: {mark_as_read}")
+            Log().debug(
+                "Articles found as marked read elsewhere: %s", Capped(mark_as_read)
+            )
             await locally_mark_article_ids_read(mark_as_read)
+            self._changed(ArticleChanges(read=frozenset(mark_as_read)))
             self._result(
                 f"Articles found marked read elsewhere on TheOldReader: {intcomma(len(mark_as_read))}"
             )
@@ -159,24 +320,53 @@ class TheOldReaderSync:
             local_unread: The IDs of articles unread locally.
         """
         if mark_as_unread := remote_unread - local_unread:
-            Log().debug(f"Articles found as marked unread elsewhere: {mark_as_unread}")
+            Log().debug(
+                "Articles found as marked unread elsewhere: %s", Capped(mark_as_unread)
+            )
             await locally_mark_article_ids_unread(mark_as_unread)
+            self._changed(ArticleChanges(unread=frozenset(mark_as_unread)))
             self._result(
                 f"Articles found marked unread elsewhere on TheOldReader: {intcomma(len(mark_as_unread))}"
             )
 
-    async def _get_updated_read_status(self) -> None:
-        """Refresh the (un)read status from the server."""
+    async def _get_remote_unread(self) -> set[str] | None:
+        """Get the IDs of the articles that are unread on the server.
+
+        Returns:
+            The IDs of the unread articles, or `None` if this is the first sync.
+        """
         if self._first_sync:
+            return None
+        self._step("Getting unread articles from TheOldReader")
+        with self._measure("read status: download") as metrics:
+            remote_unread = await ArticleIDs.load_unread(self.session)
+            metrics.items = len(remote_unread)
+        return {article_id.full_id for article_id in remote_unread}
+
+    async def _get_updated_read_status(self, remote_unread: set[str] | None) -> None:
+        """Refresh the (un)read status from the server.
+
+        Args:
+            remote_unread: The IDs of the articles unread on the server.
+
+        Note:
+            The unread IDs are fetched while new articles are still being
+            downloaded, so articles downloaded during this sync are left
+            out of the comparison; they arrived with their read status.
+        """
+        if remote_unread is None:
             return
         self._step("Syncing read/unread status with TheOldReader")
-        remote_unread_articles = await locally_known_article_ids(
-            article_id.full_id
-            for article_id in await ArticleIDs.load_unread(self.session)
-        )
-        local_unread_articles = set(await get_unread_article_ids())
-        await self._catchup_read(remote_unread_articles, local_unread_articles)
-        await self._catchup_unread(remote_unread_articles, local_unread_articles)
+        with self._measure("read status: diff") as metrics:
+            remote_unread_articles = (
+                await locally_known_article_ids(remote_unread)
+            ) - self._downloaded
+            local_unread_articles = (
+                set(await get_unread_article_ids()) - self._downloaded
+            )
+            metrics.items = len(remote_unread_articles | local_unread_articles)
+            await self._catchup_read(remote_unread_articles, local_unread_articles)
+            await self._catchup_unread(remote_unread_articles, local_unread_articles)
 
     async def _download_backlog(self, subscriptions: Iterable[Subscription]) -> None:
         """Download the backlog of articles for the given subscriptions.
@@ -187,10 +377,9 @@ class TheOldReaderSync:
         cutoff = datetime.now(UTC) - timedelta(days=load_configuration().local_history)
         for subscription in subscriptions:
             if loaded := await self._download(
-                Articles.stream_new_since(
-                    self.session, cutoff, subscription, n=self._batch_size
-                ),
+                self._stream_new_since(cutoff, subscription),
                 f"Downloading article backlog for {subscription.title}",
+                "backlog",
             ):
                 self._result(
                     f"Downloaded article backlog for {subscription.title}: {intcomma(loaded)}"
@@ -203,8 +392,14 @@ class TheOldReaderSync:
             The folders.
         """
         self._step("Getting folder list")
-        folders = await save_local_folders(await Folders.load(self.session))
-        if self.on_new_folders:
+        with self._measure("folders") as metrics:
+            folders = await Folders.load(self.session)
+            changes = await save_local_folders(folders)
+            metrics.items = len(folders)
+            metrics.written = len(changes)
+            metrics.skipped = len(folders) - len(changes.added | changes.changed)
+        Log().debug("Folder changes: %s", changes)
+        if changes and self.on_new_folders:
             self.on_new_folders(folders)
         return folders
 
@@ -216,11 +411,15 @@ class TheOldReaderSync:
             after.
         """
         self._step("Getting subscriptions list")
-        original_subscriptions = await get_local_subscriptions()
-        subscriptions = await save_local_subscriptions(
-            await Subscriptions.load(self.session)
-        )
-        if self.on_new_subscriptions:
+        with self._measure("subscriptions") as metrics:
+            original_subscriptions = await get_local_subscriptions()
+            subscriptions = await Subscriptions.load(self.session)
+            changes = await save_local_subscriptions(subscriptions)
+            metrics.items = len(subscriptions)
+            metrics.written = len(changes)
+            metrics.skipped = len(subscriptions) - len(changes.added | changes.changed)
+        Log().debug("Subscription changes: %s", changes)
+        if changes and self.on_new_subscriptions:
             self.on_new_subscriptions(subscriptions)
         return original_subscriptions, subscriptions
 
@@ -236,8 +435,9 @@ class TheOldReaderSync:
             new_grab - timedelta(days=load_configuration().local_history)
         )
         if loaded := await self._download(
-            Articles.stream_new_since(self.session, last_grabbed, n=self._batch_size),
+            self._stream_new_since(last_grabbed),
             "Downloading articles from TheOldReader",
+            "new articles",
         ):
             self._result(f"Articles downloaded: {intcomma(loaded)}")
         else:
@@ -278,7 +478,7 @@ class TheOldReaderSync:
             new_subscriptions := self._set_of_ids(current_subscriptions)
             - self._set_of_ids(original_subscriptions)
         ):
-            Log().info(f"New subscriptions found: {new_subscriptions}")
+            Log().info("New subscriptions found: %s", Capped(new_subscriptions))
             await self._download_backlog(
                 subscription
                 for subscription in current_subscriptions
@@ -301,16 +501,26 @@ class TheOldReaderSync:
             removed_subscriptions := self._set_of_ids(original_subscriptions)
             - self._set_of_ids(current_subscriptions)
         ):
-            Log().info(f"Found remotely-removed subscriptions: {removed_subscriptions}")
-            for subscription in removed_subscriptions:
-                await remove_subscription_articles(subscription)
+            Log().info(
+                "Found remotely-removed subscriptions: %s",
+                Capped(removed_subscriptions),
+            )
+            removed: set[str] = set()
+            with self._measure("orphaned articles") as metrics:
+                for subscription in removed_subscriptions:
+                    removed |= await remove_subscription_articles(subscription)
+                metrics.items = len(removed_subscriptions)
+            self._changed(ArticleChanges(removed=frozenset(removed)))
 
     async def _clean_orphaned_filters(self, subscriptions: Subscriptions) -> None:
         """Clean out any content filters related to subscriptions we no longer have."""
         Log().info("Checking for orphaned content filters")
-        await LocalSubscriptionGrabFilter.filter(
-            subscription_id__not_in={subscription.id for subscription in subscriptions}
-        ).delete()
+        with self._measure("orphaned filters") as metrics:
+            metrics.items = await LocalSubscriptionGrabFilter.filter(
+                subscription_id__not_in={
+                    subscription.id for subscription in subscriptions
+                }
+            ).delete()
 
     async def _get_unread_counts(
         self, folders: Folders, subscriptions: Subscriptions
@@ -322,23 +532,81 @@ class TheOldReaderSync:
             subscriptions: The subscriptions to get the counts for.
         """
         if self.on_new_unread:
-            self.on_new_unread(await get_local_unread(folders, subscriptions))
+            with self._measure("unread counts") as metrics:
+                unread = await get_local_unread(folders, subscriptions)
+                metrics.items = len(unread)
+            self.on_new_unread(unread)
+
+    def _phases(self) -> PhaseScheduler:
+        """Get the phases of the sync, and what they each depend on.
+
+        Returns:
+            A scheduler that will run the phases of the sync.
+
+        Note:
+            Phases only wait on each other where one needs the data the
+            other fetched or changed; the rest overlap their network and
+            database work.
+        """
+        phases = PhaseScheduler()
+        phases.add("folders", self._get_folders)
+        phases.add("subscriptions", self._get_subscriptions)
+        phases.add("new articles", self._get_new_articles)
+        phases.add("remote unread", self._get_remote_unread)
+        phases.add(
+            "read status",
+            lambda: self._get_updated_read_status(phases.result("remote unread")),
+            after=("new articles", "remote unread"),
+        )
+        phases.add(
+            "historical articles",
+            lambda: self._get_historical_articles(*phases.result("subscriptions")),
+            after=("subscriptions", "read status"),
+        )
+        phases.add(
+            "orphaned articles",
+            lambda: self._clean_orphaned_articles(*phases.result("subscriptions")),
+            after=("subscriptions", "read status"),
+        )
+        phases.add(
+            "unread counts",
+            lambda: self._get_unread_counts(
+                phases.result("folders"), phases.result("subscriptions")[1]
+            ),
+            after=("folders", "historical articles", "orphaned articles"),
+        )
+        phases.add(
+            "orphaned filters",
+            lambda: self._clean_orphaned_filters(phases.result("subscriptions")[1]),
+            after=("subscriptions",),
+        )
+        return phases
 
     async def sync(self) -> None:
         """Sync the data from TheOldReader."""
         Log().info("Starting sync with TheOldReader")
-        self._last_sync = await last_grabbed_data_at()
-        self._first_sync = self._last_sync is None
-        folders = await self._get_folders()
-        original_subscriptions, subscriptions = await self._get_subscriptions()
-        await self._get_new_articles()
-        await self._get_updated_read_status()
-        await self._get_historical_articles(original_subscriptions, subscriptions)
-        await self._clean_orphaned_articles(original_subscriptions, subscriptions)
-        await self._get_unread_counts(folders, subscriptions)
-        await self._clean_orphaned_filters(subscriptions)
+        self._report = SyncReport()
+        started = perf_counter()
+        try:
+            self._last_sync = await last_grabbed_data_at()
+            self._first_sync = self._last_sync is None
+            self._articles_changed = False
+            self._downloaded = set()
+            await self._phases().run()
+            self._report.completed = True
+        finally:
+            self._report.wall_time = perf_counter() - started
+            Log().info("Sync report: %s", self._report.as_json())
+            Log().info(
+                "Batch sizes: page %s, save %s",
+                self._page_size.size,
+                self._save_size.size,
+            )
+            save_batch_sizes(BatchSizes(self._page_size.size, self._save_size.size))
+            if self.on_sync_report:
+                self.on_sync_report(self._report)
         if self.on_sync_finished:
-            self.on_sync_finished()
+            self.on_sync_finished(self._articles_changed)
         Log().info("Finished sync with TheOldReader")
 
 
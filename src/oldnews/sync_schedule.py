@@ -0,0 +1,75 @@
+"""Provides a class for deciding when to next sync with TheOldReader."""
+
+##############################################################################
+# Python imports.
+from dataclasses import dataclass
+from random import uniform
+
+
+##############################################################################
+@dataclass
+class SyncSchedule:
+    """Class that works out the timing of background syncs."""
+
+    interval: float
+    """The normal number of seconds between background syncs."""
+    jitter: float = 0.1
+    """The proportion of the delay by which to randomly vary each sync."""
+    maximum_interval: float = 14_400
+    """The longest number of seconds we'll back off to."""
+
+    IDLE_BACKOFF = 1.5
+    """The backoff multiplier to apply when a sync found nothing new."""
+    FAILURE_BACKOFF = 2.0
+    """The backoff multiplier to apply when a sync failed."""
+
+    def __post_init__(self) -> None:
+        """Initialise the schedule."""
+        self._backoff = 1.0
+        """The multiplier currently being applied to the interval."""
+
+    @property
+    def enabled(self) -> bool:
+        """Is background syncing enabled?"""
+        return self.interval > 0
+
+    @property
+    def next_delay(self) -> float:
+        """The number of seconds to wait until the next background sync."""
+        delay = min(
+            self.interval * self._backoff, max(self.interval, self.maximum_interval)
+        )
+        return max(1.0, delay + (delay * uniform(-self.jitter, self.jitter)))
+
+    def _back_off(self, by: float) -> None:
+        """Back off the schedule.
+
+        Args:
+            by: The multiplier to back off by.
+        """
+        if self.enabled:
+            self._backoff = min(
+                self._backoff * by, max(1.0, self.maximum_interval / self.interval)
+            )
+
+    def synced(self, found_changes: bool) -> None:
+        """Record that a sync took place.
+
+        Args:
+            found_changes: Did the sync find anything new?
+
+        If the sync found changes the schedule returns to the normal
+        interval; if it didn't we're idle so the schedule backs off a
+        little.
+        """
+        if found_changes:
+            self._backoff = 1.0
+        else:
+            self._back_off(self.IDLE_BACKOFF)
+
+    def failed(self) -> None:
+        """Record that a sync failed."""
+        self._back_off(self.FAILURE_BACKOFF)
+
+
+### sync_schedule.py ends here
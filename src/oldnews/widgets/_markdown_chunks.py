@@ -0,0 +1,90 @@
+"""Support code for splitting Markdown up so it can be rendered a bit at a time."""
+
+##############################################################################
+# Python imports.
+from collections.abc import Iterator
+
+##############################################################################
+FIRST_CHUNK_SIZE = 6_000
+"""The number of characters to aim for in the first chunk; about a screenful."""
+
+CHUNK_SIZE = 4_000
+"""The number of characters to aim for in each chunk after the first."""
+
+_FENCES = ("```", "~~~")
+"""The markers that open and close a fenced block."""
+
+
+##############################################################################
+def _blocks(markdown: str) -> Iterator[str]:
+    """Split Markdown into its top-level blocks.
+
+    Args:
+        markdown: The Markdown to split.
+
+    Yields:
+        The top-level blocks of the Markdown, each with the blank line that
+        follows it.
+
+    Note:
+        This is a cheap line-based scan rather than a full parse; a block
+        ends at a blank line that isn't inside a fenced block and isn't
+        followed by an indented line (which would be a continuation of a
+        list item, or part of an indented code block).
+    """
+    lines = markdown.splitlines(keepends=True)
+    block: list[str] = []
+    fence: str | None = None
+    for line_number, line in enumerate(lines):
+        block.append(line)
+        stripped = line.strip()
+        if fence is not None:
+            if stripped.startswith(fence):
+                fence = None
+            continue
+        if stripped.startswith(_FENCES):
+            fence = stripped[:3]
+            continue
+        if (
+            not stripped
+            and len(block) > 1
+            and line_number + 1 < len(lines)
+            and not lines[line_number + 1][:1].isspace()
+        ):
+            yield "".join(block)
+            block = []
+    if block:
+        yield "".join(block)
+
+
+##############################################################################
+def chunked(
+    markdown: str, first_size: int = FIRST_CHUNK_SIZE, size: int = CHUNK_SIZE
+) -> tuple[str, ...]:
+    """Split Markdown into chunks that can be rendered one after another.
+
+    Args:
+        markdown: The Markdown to split.
+        first_size: The number of characters to aim for in the first chunk.
+        size: The number of characters to aim for in the other chunks.
+
+    Returns:
+        The chunks of Markdown; each holds whole top-level blocks, so a
+        chunk is never empty and may be larger than asked for.
+    """
+    chunks: list[str] = []
+    chunk: list[str] = []
+    chunk_size = 0
+    for block in _blocks(markdown):
+        if chunk and chunk_size + len(block) > (size if chunks else first_size):
+            chunks.append("".join(chunk))
+            chunk = []
+            chunk_size = 0
+        chunk.append(block)
+        chunk_size += len(block)
+    if chunk or not chunks:
+        chunks.append("".join(chunk))
+    return tuple(chunks)
+
+
+### _markdown_chunks.py ends here
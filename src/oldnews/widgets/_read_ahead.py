@@ -0,0 +1,201 @@
+"""Support code for preparing articles for display before they're viewed."""
+
+##############################################################################
+# Python imports.
+from asyncio import to_thread
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+##############################################################################
+# html-to-markdown imports.
+from html_to_markdown import convert
+
+##############################################################################
+# Markdown-it imports.
+from markdown_it import MarkdownIt
+from markdown_it.token import Token
+from markdown_it.utils import EnvType
+
+##############################################################################
+# OldAS imports.
+from oldas import Article
+
+##############################################################################
+# Local imports.
+from ._markdown_chunks import chunked
+
+##############################################################################
+READ_AHEAD_KEPT = 16
+"""The number of prepared articles to keep hold of."""
+
+
+##############################################################################
+def to_markdown(html: str) -> tuple[str, ...]:
+    """Convert the HTML of an article to Markdown, ready to be rendered.
+
+    Args:
+        html: The HTML to convert.
+
+    Returns:
+        The Markdown version of the HTML, split into chunks that can be
+        rendered one after another.
+    """
+    return chunked(convert(html)["content"] or "")
+
+
+##############################################################################
+@dataclass(frozen=True)
+class _Prepared:
+    """An article that has been prepared for display."""
+
+    source: str
+    """The HTML that the Markdown was converted from."""
+    chunks: tuple[str, ...]
+    """The chunks of Markdown to display."""
+
+
+##############################################################################
+class ReadAhead:
+    """Prepares articles for display ahead of them being viewed.
+
+    Preparing an article means converting its summary to Markdown and
+    parsing the first chunk of that Markdown, so that when the article is
+    viewed all that is left to do is to build the widgets that show it.
+    """
+
+    def __init__(self, kept: int = READ_AHEAD_KEPT) -> None:
+        """Initialise the read-ahead.
+
+        Args:
+            kept: The number of prepared articles to keep hold of.
+        """
+        self._kept = kept
+        """The number of prepared articles to keep hold of."""
+        self._prepared: OrderedDict[str, _Prepared] = OrderedDict()
+        """The prepared articles, keyed by article ID, oldest first."""
+        self._parsed: dict[str, list[Token]] = {}
+        """Parsed chunks of Markdown waiting to be displayed, keyed by the Markdown."""
+
+    def _cached(self, article: Article) -> _Prepared | None:
+        """Get the prepared version of an article, if there is one.
+
+        Args:
+            article: The article to get.
+
+        Returns:
+            The prepared article, or `None` if it hasn't been prepared or
+            its content has changed since it was.
+        """
+        if (
+            prepared := self._prepared.get(article.id)
+        ) is not None and prepared.source == article.summary.content:
+            self._prepared.move_to_end(article.id)
+            return prepared
+        return None
+
+    def _remember(self, article: Article, prepared: _Prepared) -> None:
+        """Remember a prepared article.
+
+        Args:
+            article: The article that was prepared.
+            prepared: The prepared version of the article.
+        """
+        self._prepared[article.id] = prepared
+        self._prepared.move_to_end(article.id)
+        while len(self._prepared) > self._kept:
+            _, forgotten = self._prepared.popitem(last=False)
+            self._parsed.pop(forgotten.chunks[0], None)
+
+    def chunks_for(self, article: Article) -> tuple[str, ...]:
+        """Get the chunks of Markdown for an article, preparing it if need be.
+
+        Args:
+            article: The article to get the Markdown for.
+
+        Returns:
+            The chunks of Markdown for the article.
+        """
+        if (prepared := self._cached(article)) is None:
+            prepared = _Prepared(
+                article.summary.content, to_markdown(article.summary.content)
+            )
+            self._remember(article, prepared)
+        return prepared.chunks
+
+    async def prepare(self, articles: Iterable[Article]) -> None:
+        """Prepare some articles for display.
+
+        Args:
+            articles: The articles to prepare.
+
+        Note:
+            The work is done in a thread, an article at a time, so that
+            cancelling the preparation stops it after the current article.
+        """
+        for article in articles:
+            if self._cached(article) is None:
+                chunks = await to_thread(to_markdown, article.summary.content)
+                self._parsed[chunks[0]] = await to_thread(
+                    MarkdownIt("gfm-like").parse, chunks[0]
+                )
+                self._remember(article, _Prepared(article.summary.content, chunks))
+
+    def take_parsed(self, markdown: str) -> list[Token] | None:
+        """Take the parsed version of some Markdown, if it's been prepared.
+
+        Args:
+            markdown: The Markdown to get the parsed version of.
+
+        Returns:
+            The parsed Markdown, or `None` if it hasn't been prepared.
+
+        Note:
+            Parsed Markdown can only be taken once, as the widgets built
+            from it keep hold of it.
+        """
+        return self._parsed.pop(markdown, None)
+
+    def parser(self) -> MarkdownIt:
+        """Make a Markdown parser that makes use of prepared articles.
+
+        Returns:
+            A Markdown parser.
+
+        Note:
+            This is intended to be used as the `parser_factory` of a
+            Textual `Markdown` widget.
+        """
+        return _ReadAheadParser(self)
+
+
+##############################################################################
+class _ReadAheadParser(MarkdownIt):
+    """A Markdown parser that uses Markdown parsed by a `ReadAhead`."""
+
+    def __init__(self, read_ahead: ReadAhead) -> None:
+        """Initialise the parser.
+
+        Args:
+            read_ahead: The read-ahead to get parsed Markdown from.
+        """
+        super().__init__("gfm-like")
+        self._read_ahead = read_ahead
+        """The read-ahead to get parsed Markdown from."""
+
+    def parse(self, src: str, env: EnvType | None = None) -> list[Token]:
+        """Parse some Markdown, using the prepared version if there is one.
+
+        Args:
+            src: The Markdown to parse.
+            env: The environment for the parse.
+
+        Returns:
+            The parsed Markdown.
+        """
+        if env is None and (tokens := self._read_ahead.take_parsed(src)) is not None:
+            return tokens
+        return super().parse(src, env)
+
+
+### _read_ahead.py ends here
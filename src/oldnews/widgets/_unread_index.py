@@ -0,0 +1,95 @@
+"""Support code for OptionLists that want to find unread things quickly."""
+
+##############################################################################
+# Python imports.
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+
+##############################################################################
+# BagOfStuff imports.
+from bagofstuff.itertools import Direction
+
+
+##############################################################################
+class UnreadIndex:
+    """A sorted index of the positions of the unread options in a list.
+
+    The index is kept in step with the list it describes, so finding the
+    next or previous unread option is a binary search rather than a walk
+    over every option in the list.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the index."""
+        self._positions: list[int] = []
+        """The positions of the unread options, in ascending order."""
+
+    def __bool__(self) -> bool:
+        """Is there anything unread in the index?"""
+        return bool(self._positions)
+
+    def __len__(self) -> int:
+        """The number of unread positions in the index."""
+        return len(self._positions)
+
+    def rebuild(self, unread: Iterable[bool]) -> None:
+        """Rebuild the index from scratch.
+
+        Args:
+            unread: Whether each option in the list, in order, is unread.
+        """
+        self._positions = [position for position, flag in enumerate(unread) if flag]
+
+    def mark(self, position: int, unread: bool) -> None:
+        """Mark the option at a given position as read or unread.
+
+        Args:
+            position: The position of the option.
+            unread: Is the option now unread?
+        """
+        index = bisect_left(self._positions, position)
+        indexed = index < len(self._positions) and self._positions[index] == position
+        if unread and not indexed:
+            insort(self._positions, position)
+        elif indexed and not unread:
+            del self._positions[index]
+
+    def first(self) -> int | None:
+        """Get the position of the first unread option.
+
+        Returns:
+            The position of the first unread option, or `None` if nothing
+            is unread.
+        """
+        return self._positions[0] if self._positions else None
+
+    def next_from(self, current: int | None, direction: Direction) -> int | None:
+        """Get the position of the next unread option from a given position.
+
+        Args:
+            current: The current position, or `None` if there isn't one.
+            direction: The direction to search in.
+
+        Returns:
+            The position of the next unread option, or `None` if nothing is
+            unread.
+
+        Notes:
+            The search wraps around the ends of the list; if there is no
+            current position the search starts at position 0.
+        """
+        if not self._positions:
+            return None
+        if direction == "forward":
+            start = 0 if current is None else current + 1
+            index = bisect_left(self._positions, start)
+            return self._positions[index if index < len(self._positions) else 0]
+        start = 0 if current is None else current - 1
+        return self._positions[bisect_right(self._positions, start) - 1]
+
+
+##############################################################################
+# Re-export the direction type.
+__all__ = ["Direction", "UnreadIndex"]
+
+### _unread_index.py ends here
@@ -2,12 +2,14 @@
 
 ##############################################################################
 # Python imports.
+from asyncio import sleep
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Self
 
 ##############################################################################
-# html-to-markdown imports.
-from html_to_markdown import convert
+# Humanize imports.
+from humanize import intcomma
 
 ##############################################################################
 # OldAS imports.
@@ -15,6 +17,7 @@ from oldas import Article
 
 ##############################################################################
 # Textual imports.
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.getters import query_one
@@ -26,6 +29,9 @@ from textual_enhanced.binding import HelpfulBinding
 ##############################################################################
 # Local imports.
 from ..content import download_content_of
+from ..data import get_local_articles_by_id, load_configuration
+from ._markdown_chunks import chunked
+from ._read_ahead import ReadAhead
 
 
 ##############################################################################
@@ -63,6 +69,12 @@ class ArticleContent(Vertical):
             padding: 0 1 0 1;
         }
 
+        #truncated {
+            display: none;
+            padding: 0 2 1 2;
+            color: $text-warning;
+        }
+
         &.--compact #header {
             padding: 0 2;
         }
@@ -82,9 +94,18 @@ class ArticleContent(Vertical):
             "grab_full_content",
             "Grab Full",
             tooltip="Grab the page of the article and render it as text",
-        )
+        ),
+        HelpfulBinding(
+            "e",
+            "render_all",
+            "Render All",
+            tooltip="Render all of an article that is too large to render in one go",
+        ),
     ]
 
+    RENDER_PAUSE = 0.01
+    """The number of seconds to pause between rendering chunks of an article."""
+
     article: var[Article | None] = var(None)
     """The article being viewed."""
     compact_ui: var[bool] = var(False, toggle_class="--compact")
@@ -98,9 +119,26 @@ class ArticleContent(Vertical):
     """The link label."""
     markdown = query_one(Markdown)
     """The markdown display for the article."""
+    truncated = query_one("#truncated", Label)
+    """The label that says the article has been cut short."""
     content = query_one(VerticalScroll)
     """The article content."""
 
+    def __init__(self, id: str | None = None, classes: str | None = None):
+        """Initialise the article content widget.
+
+        Args:
+            id: The ID of the article content in the DOM.
+            classes: The CSS classes of the article content.
+        """
+        super().__init__(id=id, classes=classes)
+        self._read_ahead = ReadAhead()
+        """Prepares articles for display before they're viewed."""
+        self._chunks: tuple[str, ...] = ()
+        """The chunks of Markdown being shown."""
+        self._rendered = 0
+        """The number of chunks that have been rendered so far."""
+
     @dataclass
     class Displayed(Message):
         """Message sent once an article is displayed."""
@@ -116,10 +154,15 @@ class ArticleContent(Vertical):
                 yield Label(id="published")
             yield Label(id="link", markup=False)
         with VerticalScroll(classes="panel"):
-            yield Markdown()
+            yield Markdown(parser_factory=self._read_ahead.parser)
+            yield Label(id="truncated")
 
     async def _watch_article(self) -> None:
         """React to the article being updated."""
+        # Whatever was being read ahead, or rendered, was for the article
+        # we were on.
+        self.workers.cancel_group(self, "read-ahead")
+        self.workers.cancel_group(self, "render")
         if self.article is not None:
             self.title.update(self.article.title)
             self.published.update(
@@ -130,13 +173,86 @@ class ArticleContent(Vertical):
             else:
                 self.link.visible = True
                 self.link.update(self.article.html_url)
-            await self.markdown.update(
-                convert(self.article.summary.content)["content"] or ""
-            )
+            await self._show(self._read_ahead.chunks_for(self.article))
             self.content.scroll_home(animate=False)
             self.post_message(self.Displayed(self.article))
         self.set_class(self.article is not None, "--has-article")
 
+    async def _show(self, chunks: tuple[str, ...]) -> None:
+        """Show some Markdown, a chunk at a time.
+
+        Args:
+            chunks: The chunks of Markdown to show.
+
+        Note:
+            The first chunk, which should be about a screenful, is rendered
+            straight away; the rest are rendered in the background.
+        """
+        self.workers.cancel_group(self, "render")
+        self._chunks = chunks
+        self._rendered = 1
+        self.truncated.display = False
+        with self.app.batch_update():
+            await self.markdown.update("")
+            await self.markdown.append(chunks[0])
+        if len(chunks) > 1:
+            self._render_rest()
+
+    @work(exclusive=True, group="render")
+    async def _render_rest(self, everything: bool = False) -> None:
+        """Render the rest of the chunks of Markdown being shown.
+
+        Args:
+            everything: Render everything, ignoring the render limit?
+
+        Note:
+            Rendering stops once the configured render limit is reached,
+            unless `everything` is asked for.
+        """
+        limit = 0 if everything else load_configuration().article_render_limit
+        rendered = sum(len(chunk) for chunk in self._chunks[: self._rendered])
+        while self._rendered < len(self._chunks):
+            if limit and rendered >= limit:
+                self.truncated.update(
+                    f"Only {intcomma(rendered)} of "
+                    f"{intcomma(sum(len(chunk) for chunk in self._chunks))} "
+                    "characters of this article have been rendered; "
+                    "press [b]e[/] to render the rest."
+                )
+                # Note that the label is shown and hidden directly, rather
+                # than with a class on this widget, as changing the classes
+                # of this widget restyles every block of the article.
+                self.truncated.display = True
+                self.refresh_bindings()
+                return
+            # Give the rest of the application a look in between chunks.
+            await sleep(self.RENDER_PAUSE)
+            chunk = self._chunks[self._rendered]
+            await self.markdown.append(chunk)
+            self._rendered += 1
+            rendered += len(chunk)
+
+    @work(exclusive=True, group="read-ahead")
+    async def read_ahead(self, article_ids: Iterable[str]) -> None:
+        """Prepare articles for display, ahead of them being viewed.
+
+        Args:
+            article_ids: The IDs of the articles to prepare, most likely to
+                be viewed first.
+
+        Note:
+            Any reading ahead that is already going on is cancelled, as is
+            this when the article being viewed changes.
+        """
+        article_ids = list(article_ids)
+        articles = {
+            article.id: article
+            for article in await get_local_articles_by_id(article_ids)
+        }
+        await self._read_ahead.prepare(
+            articles[article_id] for article_id in article_ids if article_id in articles
+        )
+
     def focus(self, scroll_visible: bool = True) -> Self:
         self.content.focus(scroll_visible)
         return self
@@ -153,6 +269,8 @@ class ArticleContent(Vertical):
         """
         if self.is_mounted and action == "action_grab_full_content":
             return bool(self.article and self.article.html_url)
+        if self.is_mounted and action == "render_all":
+            return self.truncated.display
         return True
 
     async def action_grab_full_content(self) -> None:
@@ -166,9 +284,15 @@ class ArticleContent(Vertical):
             self.content.loading = False
 
         if isinstance(content, str):
-            await self.markdown.update(content)
+            await self._show(chunked(content))
         else:
             self.notify(content.reason, title="Could not get content", severity="error")
 
+    def action_render_all(self) -> None:
+        """Render all of an article that was too large to render in one go."""
+        self.truncated.display = False
+        self.refresh_bindings()
+        self._render_rest(everything=True)
+
 
 ### article_content.py ends here
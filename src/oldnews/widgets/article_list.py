@@ -7,25 +7,27 @@ from __future__ import annotations
 ##############################################################################
 # Python imports.
 from dataclasses import dataclass
-from operator import attrgetter
 from typing import cast
 
 ##############################################################################
 # OldAs imports.
-from oldas import Article, Articles, Folder, Subscription
+from oldas import Folder, Subscription
 
 ##############################################################################
 # Rich imports.
-from rich.console import Group
+from rich.console import Console, ConsoleOptions, Group, RenderResult
 from rich.markup import escape
 from rich.table import Table
 
 ##############################################################################
 # Textual imports.
 from textual import on
+from textual.css.styles import RulesMap
 from textual.message import Message
 from textual.reactive import var
-from textual.widgets.option_list import Option
+from textual.visual import RichVisual
+from textual.widget import Widget
+from textual.widgets.option_list import Option, OptionDoesNotExist
 
 ##############################################################################
 # Textual enhanced imports.
@@ -33,60 +35,201 @@ from textual_enhanced.widgets import EnhancedOptionList
 
 ##############################################################################
 # Local imports.
-from ._next_matching_option import Direction, next_matching_option
+from ..data import ArticleHeader, ArticleHeaders
+from ._unread_index import Direction, UnreadIndex
 
 
 ##############################################################################
-class ArticleView(Option):
-    """The view of an article in the article list."""
+class ArticlePrompt:
+    """The Rich renderable for the prompt of an article in the article list.
+
+    The Rich renderables that make up the prompt are only built when the
+    prompt is measured or rendered, and aren't kept; so a long list of
+    articles doesn't hold on to a table or two for every article in it.
+    """
+
+    __slots__ = ("_article", "_showing_subscription", "_compact")
 
     def __init__(
-        self, article: Article, showing_subscription: bool, compact: bool
+        self, article: ArticleHeader, showing_subscription: bool, compact: bool
     ) -> None:
-        """Initialise the article object.
+        """Initialise the prompt.
 
         Args:
-            article: The article to view.
+            article: The article to make the prompt for.
             showing_subscription: Is the article list showing a subscription?
             compact: Should we show a compact version?
         """
         self._article = article
-        """The article to view."""
+        """The article to make the prompt for."""
+        self._showing_subscription = showing_subscription
+        """Is the article list showing a subscription?"""
+        self._compact = compact
+        """Should we show a compact version?"""
+
+    def _build(self) -> Table | Group:
+        """Build the prompt for the article.
+
+        Returns:
+            The prompt for the article.
+        """
+        article = self._article
         status = "[green]●[/]" if article.is_unread else ""
         title = escape(article.title)
         published = f"[dim]{escape(article.published.astimezone().strftime('%Y-%m-%d %H:%M:%S'))}[/]"
         header = Table.grid(expand=True)
         header.add_column(width=2)
-        header.add_column(ratio=1, no_wrap=compact)
-        content: Table | Group
-        if compact:
+        header.add_column(ratio=1, no_wrap=self._compact)
+        if self._compact:
             header.add_column(width=20, justify="right")
             header.add_row(status, title, published)
-            content = header
-        else:
-            header.add_row(status, title)
-            provenance = escape(
-                (
-                    article.author
-                    if showing_subscription
-                    else f"{article.origin.title}, {article.author}"
-                )
-                if article.author and article.author != article.origin.title
-                else article.origin.title
+            return header
+        header.add_row(status, title)
+        provenance = escape(
+            (
+                article.author
+                if self._showing_subscription
+                else f"{article.origin_title}, {article.author}"
             )
-            details = Table.grid(expand=True)
-            details.add_column(width=2)
-            details.add_column(ratio=1)
-            details.add_column(width=20, justify="right")
-            details.add_row("", f"[dim italic]{provenance}[/]", published)
-            content = Group(header, details)
-        super().__init__(content, id=article.id)
+            if article.author and article.author != article.origin_title
+            else article.origin_title
+        )
+        details = Table.grid(expand=True)
+        details.add_column(width=2)
+        details.add_column(ratio=1)
+        details.add_column(width=20, justify="right")
+        details.add_row("", f"[dim italic]{provenance}[/]", published)
+        return Group(header, details)
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        """Render the prompt.
+
+        Args:
+            console: The console being rendered to.
+            options: The options for the render.
+
+        Yields:
+            The prompt for the article.
+        """
+        yield self._build()
+
+
+##############################################################################
+class MeasuredPrompt(RichVisual):
+    """The visual for a prompt, which remembers how tall it is.
+
+    Working out the height of a Rich renderable means rendering it, and an
+    option list works out the height of every option whenever its options
+    are set; remembering the height means that options that are carried
+    over from one list of articles to the next aren't measured again.
+    """
+
+    def __init__(self, widget: Widget, prompt: ArticlePrompt) -> None:
+        """Initialise the prompt.
+
+        Args:
+            widget: The widget the prompt is shown in.
+            prompt: The prompt for the article.
+        """
+        super().__init__(widget, prompt)
+        self._measured: tuple[int, int] | None = None
+        """The width the prompt was last measured at, and its height then."""
+
+    def get_height(self, rules: RulesMap, width: int) -> int:
+        """Get the height of the prompt.
+
+        Args:
+            rules: The style rules.
+            width: The width to get the height for.
+
+        Returns:
+            The height of the prompt.
+        """
+        if self._measured is None or self._measured[0] != width:
+            self._measured = (width, super().get_height(rules, width))
+        return self._measured[1]
+
+
+##############################################################################
+class ArticleView(Option):
+    """The view of an article in the article list."""
+
+    def __init__(
+        self,
+        article: ArticleHeader,
+        showing_subscription: bool,
+        compact: bool,
+        widget: Widget,
+    ) -> None:
+        """Initialise the article object.
+
+        Args:
+            article: The article to view.
+            showing_subscription: Is the article list showing a subscription?
+            compact: Should we show a compact version?
+            widget: The widget the article will be shown in.
+        """
+        self._article = article
+        """The article to view."""
+        super().__init__(
+            self.prompt_for(article, showing_subscription, compact, widget),
+            id=article.id,
+        )
+
+    @staticmethod
+    def prompt_for(
+        article: ArticleHeader,
+        showing_subscription: bool,
+        compact: bool,
+        widget: Widget,
+    ) -> MeasuredPrompt:
+        """Make the prompt for viewing the given article.
+
+        Args:
+            article: The article to view.
+            showing_subscription: Is the article list showing a subscription?
+            compact: Should we show a compact version?
+            widget: The widget the article will be shown in.
+
+        Returns:
+            The prompt for the article.
+        """
+        return MeasuredPrompt(
+            widget, ArticlePrompt(article, showing_subscription, compact)
+        )
+
+    def shows(self, article: ArticleHeader) -> bool:
+        """Does this option already show the given article as it is?
+
+        Args:
+            article: The article to check.
+
+        Returns:
+            `True` if the option's prompt is right for the article, `False`
+            if it needs rebuilding.
+        """
+        return self._article == article
 
     @property
-    def article(self) -> Article:
+    def article(self) -> ArticleHeader:
         """The article being viewed."""
         return self._article
 
+    @article.setter
+    def article(self, article: ArticleHeader) -> None:
+        """Set the article being viewed.
+
+        Args:
+            article: The new version of the article.
+
+        Note:
+            This only updates the article that the option relates to; it's
+            the job of the owning list to update the prompt.
+        """
+        self._article = article
+
 
 ##############################################################################
 class ArticleList(EnhancedOptionList):
@@ -101,7 +244,7 @@ class ArticleList(EnhancedOptionList):
 
     selected_category: var[Folder | Subscription | None] = var(None)
     """The category of articles being shown."""
-    articles: var[Articles] = var(Articles)
+    articles: var[ArticleHeaders] = var(tuple)
     """The list of articles to show."""
     compact_ui: var[bool] = var(False)
     """Should we try and make the UI as compact as possible?"""
@@ -110,18 +253,55 @@ class ArticleList(EnhancedOptionList):
     class ViewArticle(Message):
         """Message that requests that we view a specific article."""
 
-        article: Article
+        article: ArticleHeader
         """The article to view."""
 
+    def __init__(self, id: str | None = None, classes: str | None = None):
+        """Initialise the article list.
+
+        Args:
+            id: The ID of the article list in the DOM.
+            classes: The CSS classes of the article list.
+        """
+        super().__init__(id=id, classes=classes)
+        self._showing_subscription = False
+        """Were the current options built to show a subscription?"""
+        self._unread = UnreadIndex()
+        """The index of the positions of the unread articles in the list."""
+
     @property
-    def highlighted_article(self) -> Article | None:
+    def highlighted_article(self) -> ArticleHeader | None:
         """The currently-highlighted article, or `None` if there isn't one."""
         if self.highlighted is not None:
             return cast(ArticleView, self.get_option_at_index(self.highlighted)).article
         return None
 
-    def _watch_articles(self) -> None:
-        """React to the article list being changed."""
+    def _update_in_place(self) -> None:
+        """Update the options in place to reflect the current articles.
+
+        This is used when the articles being shown are the same articles
+        that are already in the list, in the same order; only the options
+        whose article has changed have their prompt rebuilt.
+        """
+        for index, article in enumerate(self.articles):
+            option = cast(ArticleView, self.get_option_at_index(index))
+            unchanged = option.shows(article)
+            option.article = article
+            if not unchanged:
+                self._unread.mark(index, article.is_unread)
+                self.replace_option_prompt_at_index(
+                    index,
+                    ArticleView.prompt_for(
+                        article, self._showing_subscription, self.compact_ui, self
+                    ),
+                )
+
+    def _rebuild_options(self, reuse: bool = False) -> None:
+        """Rebuild all of the options from the current articles.
+
+        Args:
+            reuse: Reuse the existing options for articles that haven't changed?
+        """
         # Normally preserved_highlight is good enough; but here I want to
         # preserve the highlight but only if the article we end up on was
         # the one we started on; so this time we do a little bit of extra
@@ -131,26 +311,73 @@ class ArticleList(EnhancedOptionList):
             if self.highlighted is not None
             else None
         )
-        showing_subscription = isinstance(self.selected_category, Subscription)
+        existing = (
+            {
+                option.article.id: option
+                for option in cast(list[ArticleView], self.options)
+            }
+            if reuse
+            else {}
+        )
+        self._showing_subscription = isinstance(self.selected_category, Subscription)
+        options: list[ArticleView] = []
+        for article in self.articles:
+            if (option := existing.get(article.id)) is not None and option.shows(
+                article
+            ):
+                option.article = article
+            else:
+                option = ArticleView(
+                    article, self._showing_subscription, self.compact_ui, self
+                )
+            options.append(option)
         with self.preserved_highlight:
-            self.set_options(
-                [
-                    ArticleView(article, showing_subscription, self.compact_ui)
-                    for article in self.articles
-                ]
-            )
+            self.set_options(options)
+        self._unread.rebuild(article.is_unread for article in self.articles)
         new_id = (
             self.get_option_at_index(self.highlighted).id
             if self.highlighted is not None
             else None
         )
         if current_id is not None and current_id != new_id:
-            self.highlighted = 0
+            # If the article is still in the list, but has moved because
+            # articles have come or gone around it, follow it.
+            try:
+                self.highlighted = self.get_option_index(current_id)
+            except OptionDoesNotExist:
+                self.highlighted = 0
         self.can_focus = bool(self.option_count)
 
+    def _watch_articles(
+        self, old_articles: ArticleHeaders, new_articles: ArticleHeaders
+    ) -> None:
+        """React to the article list being changed.
+
+        Args:
+            old_articles: The articles that were being shown.
+            new_articles: The articles that are to be shown.
+        """
+        # If we're looking at the same articles in the same order, in the
+        # same sort of category, just update what's changed; this keeps the
+        # scroll position and highlight exactly where the user left them.
+        # If it's the same sort of category, but articles have come or gone,
+        # at least don't rebuild the options for articles that are the same.
+        same_kind = self._showing_subscription == isinstance(
+            self.selected_category, Subscription
+        )
+        if (
+            same_kind
+            and self.option_count == len(new_articles)
+            and [article.id for article in old_articles]
+            == [article.id for article in new_articles]
+        ):
+            self._update_in_place()
+        else:
+            self._rebuild_options(reuse=same_kind)
+
     def _watch_compact_ui(self) -> None:
         """React to the compact setting being toggled."""
-        self.mutate_reactive(ArticleList.articles)
+        self._rebuild_options()
 
     @on(EnhancedOptionList.OptionSelected)
     def _select_article(self, message: EnhancedOptionList.OptionSelected) -> None:
@@ -172,18 +399,39 @@ class ArticleList(EnhancedOptionList):
             `True` if an unread article was found and highlighted, `False`
             if not.
         """
-        if (
-            next_hit := next_matching_option(
-                cast(list[ArticleView], self.options),
-                self.highlighted,
-                direction,
-                attrgetter("article.is_unread"),
-            )
-        ) and next_hit.id is not None:
-            self.highlighted = self.get_option_index(next_hit.id)
-            return True
-        self.notify("No more unread articles")
-        return False
+        if (next_hit := self._unread.next_from(self.highlighted, direction)) is None:
+            self.notify("No more unread articles")
+            return False
+        self.highlighted = next_hit
+        return True
+
+    def articles_around_highlight(self) -> list[ArticleHeader]:
+        """Get the articles that are likely to be viewed after the highlighted one.
+
+        Returns:
+            The next and previous articles, and the next and previous unread
+            articles, with the most likely to be viewed first.
+        """
+        if (highlighted := self.highlighted) is None:
+            return []
+        around: list[int] = []
+        for position in (
+            highlighted + 1,
+            self._unread.next_from(highlighted, "forward"),
+            highlighted - 1,
+            self._unread.next_from(highlighted, "backward"),
+        ):
+            if (
+                position is not None
+                and position != highlighted
+                and 0 <= position < self.option_count
+                and position not in around
+            ):
+                around.append(position)
+        return [
+            cast(ArticleView, self.get_option_at_index(position)).article
+            for position in around
+        ]
 
     def highlight_next_article(self) -> None:
         """Highlight the next article in the list."""
@@ -221,5 +469,22 @@ class ArticleList(EnhancedOptionList):
         if self._highlight_unread("backward"):
             self.call_later(self.run_action, "select")
 
+    def highlight_first_unread_article(self) -> bool:
+        """Highlight the first unread article in the list.
+
+        Returns:
+            `True` if there was an unread article to highlight, `False` if
+            not.
+        """
+        if (first := self._unread.first()) is None:
+            return False
+        self.highlighted = first
+        return True
+
+    def select_first_unread_article(self) -> None:
+        """Select the first unread article in the list."""
+        if self.highlight_first_unread_article():
+            self.call_later(self.run_action, "select")
+
 
 ### article_list.py ends here
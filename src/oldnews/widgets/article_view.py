@@ -1,14 +1,14 @@
 """Provides the panel for viewing things related to articles."""
 
-##############################################################################
-# OldAS imports.
-from oldas import Articles
-
 ##############################################################################
 # Textual imports.
 from textual.containers import Vertical
 from textual.reactive import var
 
+##############################################################################
+# Local imports.
+from ..data import ArticleHeaders
+
 
 ##############################################################################
 class ArticleView(Vertical):
@@ -23,7 +23,7 @@ class ArticleView(Vertical):
     }
     """
 
-    articles: var[Articles] = var(Articles)
+    articles: var[ArticleHeaders] = var(tuple)
     """The currently-viewed list of articles."""
 
     def _watch_articles(self) -> None:
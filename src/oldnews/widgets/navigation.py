@@ -40,7 +40,7 @@ from textual_enhanced.widgets import EnhancedOptionList
 ##############################################################################
 # Local imports.
 from ..data import LocalUnread, get_navigation_state, save_navigation_state
-from ._next_matching_option import Direction, next_matching_option
+from ._unread_index import Direction, UnreadIndex
 
 
 ##############################################################################
@@ -173,6 +173,8 @@ class Navigation(EnhancedOptionList):
         super().__init__(id=id, classes=classes)
         self._expanded: set[str] = set()
         """The IDs of the folders that are expanded."""
+        self._unread_categories = UnreadIndex()
+        """The index of the positions of the categories with unread articles."""
 
     def on_mount(self) -> None:
         """Configure the widget once the DOM is mounted."""
@@ -261,6 +263,10 @@ class Navigation(EnhancedOptionList):
             self.set_options(
                 (*self._gather_folderless_subscrtiptions(), *self._gather_folders())
             )
+        self._unread_categories.rebuild(
+            self._contains_unread(option)
+            for option in cast(list[FolderView | SubscriptionView], self.options)
+        )
 
     async def _watch_folders(self) -> None:
         """React to the folders being updated."""
@@ -271,9 +277,37 @@ class Navigation(EnhancedOptionList):
         """React to the subscriptions being updated."""
         self._refresh_navigation()
 
-    def _watch_unread(self) -> None:
-        """React to the unread data being updated."""
-        self._refresh_navigation()
+    def _watch_unread(self, old_unread: LocalUnread, new_unread: LocalUnread) -> None:
+        """React to the unread data being updated.
+
+        Args:
+            old_unread: The unread counts that were being shown.
+            new_unread: The unread counts to show.
+
+        Note:
+            Only the folders and subscriptions whose counts have changed
+            have their prompts rebuilt.
+        """
+        for index, option in enumerate(self.options):
+            if option.id is None or old_unread.get(option.id) == new_unread.get(
+                option.id
+            ):
+                continue
+            if isinstance(option, FolderView):
+                view: Option = FolderView(
+                    option.folder,
+                    option.id in self._expanded,
+                    new_unread,
+                    self.compact_ui,
+                )
+            elif isinstance(option, SubscriptionView):
+                view = SubscriptionView(
+                    option.subscription, new_unread, self.compact_ui
+                )
+            else:
+                continue
+            self.replace_option_prompt_at_index(index, view.prompt)
+            self._unread_categories.mark(index, bool(new_unread.get(option.id)))
 
     def _watch_compact_ui(self) -> None:
         """React to the compact UI being toggled."""
@@ -388,25 +422,30 @@ class Navigation(EnhancedOptionList):
             if not.
         """
         if (
-            next_hit := next_matching_option(
-                cast(list[FolderView | SubscriptionView], self.options),
-                self.highlighted,
-                direction,
-                self._contains_unread,
-            )
-        ) and next_hit.id is not None:
-            self.highlighted = self.get_option_index(next_hit.id)
-            return True
-        self.notify("No more folders or subscriptions with unread articles")
-        return False
-
-    def highlight_next_unread_category(self) -> None:
-        """Highlight the next unread category."""
-        self._highlight_unread("forward")
-
-    def highlight_previous_unread_category(self) -> None:
-        """Highlight the previous unread category."""
-        self._highlight_unread("backward")
+            next_hit := self._unread_categories.next_from(self.highlighted, direction)
+        ) is None:
+            self.notify("No more folders or subscriptions with unread articles")
+            return False
+        self.highlighted = next_hit
+        return True
+
+    def highlight_next_unread_category(self) -> bool:
+        """Highlight the next unread category.
+
+        Returns:
+            `True` if an unread category was found and highlighted, `False`
+            if not.
+        """
+        return self._highlight_unread("forward")
+
+    def highlight_previous_unread_category(self) -> bool:
+        """Highlight the previous unread category.
+
+        Returns:
+            `True` if an unread category was found and highlighted, `False`
+            if not.
+        """
+        return self._highlight_unread("backward")
 
 
 ### navigation.py ends here